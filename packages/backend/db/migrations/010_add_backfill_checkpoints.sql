@@ -0,0 +1,19 @@
+-- Migration 010: Backfill checkpoints
+-- Tracks each (season, week) of a historical backfill so interrupted runs resume
+
+CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL CHECK (status IN ('running', 'completed', 'failed')),
+    attempts INTEGER DEFAULT 0,
+    games_written INTEGER DEFAULT 0,
+    last_error TEXT,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (season, week)
+);
+
+CREATE INDEX IF NOT EXISTS idx_backfill_checkpoints_status ON backfill_checkpoints(status);
+
+COMMENT ON TABLE backfill_checkpoints IS 'Progress of historical data backfills, one row per season/week';
@@ -0,0 +1,12 @@
+-- Migration 011: Row fingerprints for change detection
+-- Ingestion stores a hash of each normalized upstream row and skips the update when it
+-- is unchanged, so polling no longer rewrites identical games and team_stats rows
+
+ALTER TABLE games
+ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(64);
+
+ALTER TABLE team_stats
+ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(64);
+
+COMMENT ON COLUMN games.payload_hash IS 'SHA-256 of the last ingested upstream row; updates are skipped when it matches';
+COMMENT ON COLUMN team_stats.payload_hash IS 'SHA-256 of the last ingested upstream row; updates are skipped when it matches';
@@ -0,0 +1,14 @@
+-- Migration 012: Natural key for injury reports
+-- Injury refreshes merge on (team_id, player_name, season) instead of deleting and
+-- reinserting the whole season, so the key must be unique
+
+-- Keep the most recent row for any player reported more than once
+DELETE FROM injuries a
+USING injuries b
+WHERE a.team_id = b.team_id
+  AND a.player_name = b.player_name
+  AND a.season = b.season
+  AND a.id < b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_injuries_team_player_season
+ON injuries(team_id, player_name, season);
@@ -0,0 +1,17 @@
+-- Migration 013: Team stats derived from the games table
+-- team_stats rows for week W hold each team's record as of kickoff of week W (only
+-- games from earlier weeks). Record, points, streak and home/away splits are computed
+-- locally; upstream stats only fill the yardage/efficiency columns.
+
+ALTER TABLE team_stats
+ADD COLUMN IF NOT EXISTS games_played INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS streak INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS home_wins INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS home_losses INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS away_wins INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS away_losses INTEGER DEFAULT 0;
+
+COMMENT ON COLUMN team_stats.streak IS 'Current streak entering the week: +N wins, -N losses, 0 after a tie or before any game';
+
+-- The aggregator scans a season's finalized games
+CREATE INDEX IF NOT EXISTS idx_games_season_status ON games(season, status);
@@ -0,0 +1,83 @@
+-- Migration 014: Change-only betting line history
+-- Odds polling used to append a full snapshot per book on every call. Lines are now
+-- stored as one event per (game, sportsbook, market) only when the line moves, with
+-- the current line per key kept in betting_lines_latest (maintained by the writer in
+-- the same statement) and a consensus view over it.
+--
+-- Markets: 'spread' (home/away points), 'total' (points in home_value) and
+-- 'moneyline' (home/away American odds).
+
+CREATE TABLE IF NOT EXISTS betting_line_events (
+    id BIGSERIAL PRIMARY KEY,
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    sportsbook VARCHAR(50) NOT NULL,
+    market VARCHAR(10) NOT NULL CHECK (market IN ('spread', 'total', 'moneyline')),
+    home_value DECIMAL(7,2),
+    away_value DECIMAL(7,2),
+    recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_betting_line_events_game
+ON betting_line_events(game_id, market, recorded_at);
+
+CREATE TABLE IF NOT EXISTS betting_lines_latest (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    sportsbook VARCHAR(50) NOT NULL,
+    market VARCHAR(10) NOT NULL CHECK (market IN ('spread', 'total', 'moneyline')),
+    home_value DECIMAL(7,2),
+    away_value DECIMAL(7,2),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (game_id, market, sportsbook)
+);
+
+CREATE OR REPLACE VIEW betting_line_consensus AS
+SELECT
+    game_id,
+    market,
+    COUNT(*) AS books,
+    ROUND(AVG(home_value), 2) AS avg_home_value,
+    ROUND(AVG(away_value), 2) AS avg_away_value,
+    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY home_value) AS median_home_value,
+    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY away_value) AS median_away_value,
+    MIN(home_value) AS min_home_value,
+    MAX(home_value) AS max_home_value,
+    MAX(updated_at) AS updated_at
+FROM betting_lines_latest
+GROUP BY game_id, market;
+
+-- Convert existing snapshots: keep the first observation and every change per key
+INSERT INTO betting_line_events (game_id, sportsbook, market, home_value, away_value, recorded_at)
+SELECT game_id, sportsbook, market, home_value, away_value, recorded_at
+FROM (
+    SELECT
+        s.*,
+        ROW_NUMBER() OVER w AS seq,
+        LAG(home_value) OVER w AS prev_home,
+        LAG(away_value) OVER w AS prev_away
+    FROM (
+        SELECT game_id, sportsbook, 'spread' AS market, home_spread AS home_value,
+               away_spread AS away_value, timestamp AS recorded_at
+        FROM betting_lines
+        UNION ALL
+        SELECT game_id, sportsbook, 'total', over_under, NULL, timestamp
+        FROM betting_lines
+        UNION ALL
+        SELECT game_id, sportsbook, 'moneyline', home_moneyline, away_moneyline, timestamp
+        FROM betting_lines
+    ) s
+    WHERE s.game_id IS NOT NULL AND s.sportsbook IS NOT NULL AND s.recorded_at IS NOT NULL
+      AND (s.home_value IS NOT NULL OR s.away_value IS NOT NULL)
+    WINDOW w AS (PARTITION BY game_id, sportsbook, market ORDER BY recorded_at)
+) changes
+WHERE (seq = 1 OR (home_value, away_value) IS DISTINCT FROM (prev_home, prev_away))
+  -- Only on the first run, so re-applying the migration does not duplicate history
+  AND NOT EXISTS (SELECT 1 FROM betting_line_events);
+
+INSERT INTO betting_lines_latest (game_id, sportsbook, market, home_value, away_value, updated_at)
+SELECT DISTINCT ON (game_id, market, sportsbook)
+    game_id, sportsbook, market, home_value, away_value, recorded_at
+FROM betting_line_events
+ORDER BY game_id, market, sportsbook, recorded_at DESC, id DESC
+ON CONFLICT (game_id, market, sportsbook) DO NOTHING;
+
+COMMENT ON TABLE betting_lines IS 'Legacy per-poll odds snapshots; superseded by betting_line_events (migration 014)';
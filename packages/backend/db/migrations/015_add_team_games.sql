@@ -0,0 +1,36 @@
+-- Migration 015: Team-perspective game rows
+-- One row per team per game, so per-team lookups (recent form, rest days, head to
+-- head) are a single index range scan instead of an OR over home/away columns.
+-- Backfilled here; kept in sync by the trigger on games added in migration 017.
+
+CREATE TABLE IF NOT EXISTS team_games (
+    team_id INTEGER NOT NULL REFERENCES teams(id),
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    opponent_id INTEGER REFERENCES teams(id),
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    game_date TIMESTAMP NOT NULL,
+    status VARCHAR(20),
+    is_home BOOLEAN NOT NULL,
+    points_for INTEGER,
+    points_against INTEGER,
+    spread_line DECIMAL(5,2),
+    PRIMARY KEY (team_id, game_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_team_games_team_date ON team_games(team_id, game_date DESC);
+
+INSERT INTO team_games (
+    team_id, game_id, opponent_id, season, week, game_date, status,
+    is_home, points_for, points_against, spread_line
+)
+SELECT g.home_team_id, g.id, g.away_team_id, g.season, g.week, g.game_date, g.status,
+       TRUE, g.home_score, g.away_score, g.spread
+FROM games g
+WHERE g.home_team_id IS NOT NULL
+UNION ALL
+SELECT g.away_team_id, g.id, g.home_team_id, g.season, g.week, g.game_date, g.status,
+       FALSE, g.away_score, g.home_score, -g.spread
+FROM games g
+WHERE g.away_team_id IS NOT NULL
+ON CONFLICT (team_id, game_id) DO NOTHING;
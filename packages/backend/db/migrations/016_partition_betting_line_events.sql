@@ -0,0 +1,100 @@
+-- Migration 016: Season partitioning for line history
+-- betting_line_events is the only table that grows by orders of magnitude each
+-- season, while serving queries only touch the current one. It becomes a range
+-- partitioned table on season (one partition per season plus a default), so
+-- season-scoped reads prune to a single partition and old seasons can be
+-- detached or archived whole.
+--
+-- games stays unpartitioned: predictions, bankroll entries, team_games and the
+-- line tables reference games(id), which a partitioned table could only back with a
+-- (season, id) key, and a season is ~285 rows already covered by
+-- idx_games_season_status.
+--
+-- New seasons are attached with ensure_season_partition() (see
+-- packages/ml-service/scripts/ensure_partitions.py); rows written before their
+-- partition exists land in the default partition and are moved on attach.
+
+CREATE OR REPLACE FUNCTION ensure_season_partition(parent TEXT, season INTEGER)
+RETURNS TEXT AS $$
+DECLARE
+    partition_name TEXT := format('%s_%s', parent, season);
+    default_name TEXT := format('%s_default', parent);
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name, parent
+    );
+    -- Attaching fails while the default partition holds rows for the new range
+    IF to_regclass(default_name) IS NOT NULL THEN
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM %I WHERE season = %s RETURNING *) INSERT INTO %I SELECT * FROM moved',
+            default_name, season, partition_name
+        );
+    END IF;
+    EXECUTE format(
+        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%s) TO (%s)',
+        parent, partition_name, season, season + 1
+    );
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class WHERE relname = 'betting_line_events' AND relkind = 'r'
+    ) THEN
+        ALTER TABLE betting_line_events RENAME TO betting_line_events_unpartitioned;
+        ALTER INDEX idx_betting_line_events_game RENAME TO idx_betting_line_events_unpartitioned_game;
+        ALTER SEQUENCE betting_line_events_id_seq RENAME TO betting_line_events_unpartitioned_id_seq;
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS betting_line_events (
+    id BIGSERIAL,
+    season INTEGER NOT NULL,
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    sportsbook VARCHAR(50) NOT NULL,
+    market VARCHAR(10) NOT NULL CHECK (market IN ('spread', 'total', 'moneyline')),
+    home_value DECIMAL(7,2),
+    away_value DECIMAL(7,2),
+    recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (season, id)
+) PARTITION BY RANGE (season);
+
+CREATE INDEX IF NOT EXISTS idx_betting_line_events_game
+ON betting_line_events(game_id, market, recorded_at);
+
+CREATE TABLE IF NOT EXISTS betting_line_events_default PARTITION OF betting_line_events DEFAULT;
+
+SELECT ensure_season_partition('betting_line_events', season)
+FROM (
+    SELECT DISTINCT season FROM games
+    UNION
+    SELECT CAST(EXTRACT(YEAR FROM CURRENT_DATE) AS INTEGER)
+) seasons
+ORDER BY season;
+
+DO $$
+BEGIN
+    IF to_regclass('betting_line_events_unpartitioned') IS NOT NULL THEN
+        INSERT INTO betting_line_events (
+            id, season, game_id, sportsbook, market, home_value, away_value, recorded_at
+        )
+        SELECT e.id, g.season, e.game_id, e.sportsbook, e.market,
+               e.home_value, e.away_value, e.recorded_at
+        FROM betting_line_events_unpartitioned e
+        JOIN games g ON g.id = e.game_id;
+
+        PERFORM setval(
+            pg_get_serial_sequence('betting_line_events', 'id'),
+            COALESCE((SELECT MAX(id) FROM betting_line_events), 0) + 1,
+            FALSE
+        );
+        DROP TABLE betting_line_events_unpartitioned;
+    END IF;
+END $$;
@@ -0,0 +1,86 @@
+-- Migration 017: Keep team_games in sync with games from every writer
+-- team_games was only maintained by the ML service's games upsert, so games written
+-- by the backend's sync jobs never reached it. A row trigger on games now mirrors
+-- inserts, relevant updates and deletes whoever writes them.
+
+CREATE OR REPLACE FUNCTION sync_team_games() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM team_games WHERE game_id = OLD.id;
+        RETURN OLD;
+    END IF;
+
+    -- A game whose team ids changed no longer belongs to the old teams
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM team_games
+        WHERE game_id = NEW.id
+          AND team_id IS DISTINCT FROM NEW.home_team_id
+          AND team_id IS DISTINCT FROM NEW.away_team_id;
+    END IF;
+
+    INSERT INTO team_games (
+        team_id, game_id, opponent_id, season, week, game_date, status,
+        is_home, points_for, points_against, spread_line
+    )
+    SELECT NEW.home_team_id, NEW.id, NEW.away_team_id, NEW.season, NEW.week, NEW.game_date,
+           NEW.status, TRUE, NEW.home_score, NEW.away_score, NEW.spread
+    WHERE NEW.home_team_id IS NOT NULL
+    UNION ALL
+    SELECT NEW.away_team_id, NEW.id, NEW.home_team_id, NEW.season, NEW.week, NEW.game_date,
+           NEW.status, FALSE, NEW.away_score, NEW.home_score, -NEW.spread
+    WHERE NEW.away_team_id IS NOT NULL
+    ON CONFLICT (team_id, game_id)
+    DO UPDATE SET
+        opponent_id = EXCLUDED.opponent_id,
+        season = EXCLUDED.season,
+        week = EXCLUDED.week,
+        game_date = EXCLUDED.game_date,
+        status = EXCLUDED.status,
+        is_home = EXCLUDED.is_home,
+        points_for = EXCLUDED.points_for,
+        points_against = EXCLUDED.points_against,
+        spread_line = EXCLUDED.spread_line;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sync_team_games_on_change ON games;
+CREATE TRIGGER sync_team_games_on_change
+    AFTER INSERT OR DELETE OR UPDATE OF
+        home_team_id, away_team_id, season, week, game_date, status,
+        home_score, away_score, spread
+    ON games
+    FOR EACH ROW EXECUTE FUNCTION sync_team_games();
+
+-- Catch up on anything the backend wrote between migration 015 and this trigger
+INSERT INTO team_games (
+    team_id, game_id, opponent_id, season, week, game_date, status,
+    is_home, points_for, points_against, spread_line
+)
+SELECT g.home_team_id, g.id, g.away_team_id, g.season, g.week, g.game_date, g.status,
+       TRUE, g.home_score, g.away_score, g.spread
+FROM games g
+WHERE g.home_team_id IS NOT NULL
+UNION ALL
+SELECT g.away_team_id, g.id, g.home_team_id, g.season, g.week, g.game_date, g.status,
+       FALSE, g.away_score, g.home_score, -g.spread
+FROM games g
+WHERE g.away_team_id IS NOT NULL
+ON CONFLICT (team_id, game_id)
+DO UPDATE SET
+    opponent_id = EXCLUDED.opponent_id,
+    season = EXCLUDED.season,
+    week = EXCLUDED.week,
+    game_date = EXCLUDED.game_date,
+    status = EXCLUDED.status,
+    is_home = EXCLUDED.is_home,
+    points_for = EXCLUDED.points_for,
+    points_against = EXCLUDED.points_against,
+    spread_line = EXCLUDED.spread_line;
+
+DELETE FROM team_games tg
+USING games g
+WHERE tg.game_id = g.id
+  AND tg.team_id IS DISTINCT FROM g.home_team_id
+  AND tg.team_id IS DISTINCT FROM g.away_team_id;
@@ -0,0 +1,15 @@
+-- Migration 018: Leave upstream team stats NULL until ESPN reports them
+-- The aggregator inserts one derived row per team and week, and the DEFAULT 0 on
+-- turnovers and sacks made those rows claim "no turnovers, no sacks" rather than
+-- "not reported". Rows never written by the upstream stats feed (no payload_hash and
+-- no yardage) are reset to NULL.
+
+ALTER TABLE team_stats
+ALTER COLUMN turnovers DROP DEFAULT,
+ALTER COLUMN sacks DROP DEFAULT;
+
+UPDATE team_stats
+SET turnovers = NULL, sacks = NULL
+WHERE payload_hash IS NULL
+  AND total_yards IS NULL AND passing_yards IS NULL AND rushing_yards IS NULL
+  AND (turnovers IS NOT NULL OR sacks IS NOT NULL);
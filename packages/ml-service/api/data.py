@@ -3,9 +3,16 @@ from pydantic import BaseModel
 from typing import Optional
 
 from services.data_service import DataService
+from services.line_history import LineHistory
+from services.live_scheduler import live_scheduler
+from utils.cache import cache
+from utils.database import pool_status, read_session, replica_router
+from utils.http_policy import upstream_policies
 from utils.logger import logger
+from utils.queries import queries
 
 router = APIRouter()
+line_history = LineHistory()
 
 
 class UpdateRequest(BaseModel):
@@ -27,6 +34,7 @@ async def fetch_games(season: Optional[int] = None, week: Optional[int] = None):
             "games_fetched": result.get("fetched"),
             "games_inserted": result.get("inserted"),
             "games_updated": result.get("updated"),
+            "games_unchanged": result.get("unchanged"),
             "season": result.get("season"),
             "week": result.get("week")
         }
@@ -34,6 +42,25 @@ async def fetch_games(season: Optional[int] = None, week: Optional[int] = None):
         logger.error(f"Error fetching games: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/fetch/season/{season}")
+async def fetch_season_games(season: int, include_postseason: bool = False):
+    """Load a whole season schedule in one upstream request"""
+    try:
+        service = DataService()
+        result = await service.fetch_season_games(season, include_postseason=include_postseason)
+        return {
+            "status": "success",
+            "season": result.get("season"),
+            "games_fetched": result.get("games"),
+            "games_inserted": result.get("inserted"),
+            "games_updated": result.get("updated"),
+            "games_unchanged": result.get("unchanged"),
+            "weeks": result.get("weeks")
+        }
+    except Exception as e:
+        logger.error(f"Error fetching season {season} games: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/fetch/stats")
 async def fetch_team_stats(season: Optional[int] = None, week: Optional[int] = None):
     """Fetch team statistics"""
@@ -45,6 +72,7 @@ async def fetch_team_stats(season: Optional[int] = None, week: Optional[int] = N
             "season": result.get("season"),
             "week": result.get("week"),
             "teams_updated": result.get("processed"),
+            "teams_unchanged": result.get("unchanged"),
             "season": result.get("season"),
             "week": result.get("week")
         }
@@ -61,7 +89,9 @@ async def fetch_injuries():
         return {
             "status": "success",
             "season": result.get("season"),
-            "injuries_updated": result.get("processed")
+            "injuries_updated": result.get("processed"),
+            "affected_teams": result.get("affected_teams", []),
+            "invalidated_games": result.get("invalidated_games", [])
         }
     except Exception as e:
         logger.error(f"Error fetching injuries: {e}")
@@ -78,6 +108,7 @@ async def fetch_betting_odds():
             "season": result.get("season"),
             "week": result.get("week"),
             "entries_created": result.get("processed"),
+            "unmatched_events": result.get("unmatched", []),
             "message": result.get("message")
         }
     except Exception as e:
@@ -96,9 +127,80 @@ async def update_all_data(payload: UpdateRequest = UpdateRequest()):
             include_odds=payload.include_odds
         )
         return {
-            "status": "success",
+            "status": "partial" if result.get("failed_feeds") else "success",
             "details": result
         }
     except Exception as e:
         logger.error(f"Error updating all data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/upstream/metrics")
+async def get_upstream_metrics():
+    """Rate limit, retry and circuit breaker metrics per upstream host"""
+    return {
+        "status": "success",
+        "hosts": upstream_policies.metrics()
+    }
+
+@router.get("/db/metrics")
+async def get_db_metrics():
+    """Connection pool usage, read replica routing and per-query latency for the hot queries"""
+    return {
+        "status": "success",
+        "pool": pool_status(),
+        "replica": replica_router.state,
+        "queries": queries.metrics()
+    }
+
+@router.get("/cache/metrics")
+async def get_cache_metrics():
+    """Hit rates of the in-process cache tier and Redis"""
+    return {
+        "status": "success",
+        "cache": cache.snapshot()
+    }
+
+@router.get("/live-polling")
+async def get_live_polling_status():
+    """State of the in-process live game poller"""
+    return {
+        "status": "success",
+        "scheduler": live_scheduler.state
+    }
+
+@router.get("/odds/consensus")
+async def get_odds_consensus(game_ids: str, include_books: bool = False):
+    """Current consensus line per market for a comma separated list of games"""
+    try:
+        ids = [int(part) for part in game_ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="game_ids must be comma separated integers")
+
+    async with read_session() as session:
+        consensus = await line_history.consensus(session, ids)
+        books = await line_history.current(session, ids) if include_books else {}
+
+    games = {game_id: {"consensus": markets} for game_id, markets in consensus.items()}
+    if include_books:
+        for game_id, entry in games.items():
+            entry["books"] = books.get(game_id, {})
+
+    return {
+        "status": "success",
+        "games": games
+    }
+
+@router.get("/odds/{game_id}/movement")
+async def get_line_movement(game_id: int, market: Optional[str] = None, sportsbook: Optional[str] = None):
+    """Line changes for a game as [recorded_at, home, away] points per market and sportsbook"""
+    if market and market not in ("spread", "total", "moneyline"):
+        raise HTTPException(status_code=400, detail="market must be spread, total or moneyline")
+
+    async with read_session() as session:
+        movement = await line_history.movement(session, game_id, market=market, sportsbook=sportsbook)
+
+    return {
+        "status": "success",
+        "game_id": game_id,
+        "markets": movement
+    }
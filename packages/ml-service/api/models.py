@@ -1,14 +1,15 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Dict, List
-import json
 
 from services.model_service import ModelService
-from utils.database import get_redis
+from utils.cache import cache
 from utils.logger import logger
 
 router = APIRouter()
 
+MODEL_STATS_KEY = "ml:model:stats"
+
 class ModelStats(BaseModel):
     model_name: str
     accuracy: float
@@ -22,23 +23,20 @@ class ModelStats(BaseModel):
 async def get_model_stats():
     """Get performance statistics for all models"""
     try:
-        redis = get_redis()
-        cache_key = "ml:model:stats"
+        cache_key = MODEL_STATS_KEY
 
         # Try cache
-        if redis:
-            cached = await redis.get(cache_key)
-            if cached:
-                logger.info("Returning cached model stats")
-                return json.loads(cached)
+        cached = await cache.get(cache_key, 3600)
+        if cached:
+            logger.info("Returning cached model stats")
+            return cached
 
         # Get fresh stats
         service = ModelService()
         stats = await service.get_model_stats()
 
         # Cache for 1 hour
-        if redis:
-            await redis.setex(cache_key, 3600, json.dumps(stats))
+        await cache.set(cache_key, stats, 3600)
 
         return stats
     except Exception as e:
@@ -83,6 +81,7 @@ async def trigger_training():
     try:
         service = ModelService()
         result = await service.train_models()
+        await cache.delete(MODEL_STATS_KEY)
         return {
             "status": "success",
             "message": "Model training initiated",
@@ -1,16 +1,23 @@
+import hashlib
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
-import json
-
-from fastapi.encoders import jsonable_encoder
-
+from pydantic import BaseModel, TypeAdapter
+
+from services.prediction_cache import (
+    GAME_PREDICTION_TTL,
+    game_prediction_key,
+    model_version,
+    upcoming_predictions_key,
+    weekly_predictions_key,
+)
 from services.prediction_service import PredictionService
-from utils.database import get_redis
+from utils import codec
+from utils.cache import cache
 from utils.logger import logger
+from utils.responses import ORJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class PredictionResponse(BaseModel):
     game_id: int
@@ -32,6 +39,59 @@ class PredictionResponse(BaseModel):
     weather: Optional[Dict[str, Any]] = None
     venue: Optional[Dict[str, Any]] = None
     model_breakdown: Optional[Dict[str, Any]] = None
+    market_lines: Optional[Dict[str, Any]] = None
+
+# Validate and serialize once on a cache miss; hits send the stored bytes unchanged
+PREDICTION_LIST_ADAPTER = TypeAdapter(List[PredictionResponse])
+PREDICTION_ADAPTER = TypeAdapter(PredictionResponse)
+
+PREDICTION_FIELDS = frozenset(PredictionResponse.model_fields)
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Validated ``?fields=`` projection; ``game_id`` is always included"""
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - PREDICTION_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(["game_id", *requested]))
+
+def _project(data, fields: Optional[List[str]]):
+    if not fields:
+        return data
+    if isinstance(data, list):
+        return [_project(item, fields) for item in data]
+    return {name: data.get(name) for name in fields}
+
+# Cached sets are invalidated whenever injuries or lines change, so clients may keep
+# a copy but must revalidate it; a matching ETag costs a 304 with no body
+PREDICTION_CACHE_CONTROL = "public, no-cache"
+
+def _etag(body: bytes, fields: Optional[List[str]] = None) -> str:
+    """Weak validator from the model version and the cached body (which holds every input)"""
+    digest = hashlib.blake2b(body, digest_size=12)
+    if fields:
+        digest.update(",".join(fields).encode())
+    # Weak: the same set is sent gzip/brotli-encoded or identity
+    return f'W/"{model_version()}-{digest.hexdigest()}"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an If-None-Match header"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == opaque for tag in tags)
+
+def _json_response(body: bytes, request: Request, fields: Optional[List[str]] = None) -> Response:
+    etag = _etag(body, fields)
+    headers = {"ETag": etag, "Cache-Control": PREDICTION_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if fields:
+        body = codec.dumps(_project(codec.loads(body), fields))
+    return Response(content=body, media_type="application/json", headers=headers)
 
 class ParlayRequest(BaseModel):
     game_ids: List[int]
@@ -39,66 +99,81 @@ class ParlayRequest(BaseModel):
     target_odds: Optional[float] = None
 
 @router.get("/upcoming", response_model=List[PredictionResponse])
-async def get_upcoming_predictions():
-    """Get predictions for all upcoming games"""
+async def get_upcoming_predictions(request: Request, fields: Optional[str] = None):
+    """Get predictions for all upcoming games; ``fields`` limits the returned keys"""
+    field_list = _parse_fields(fields)
     try:
-        redis = get_redis()
-        cache_key = "ml:predictions:upcoming"
+        cache_key = upcoming_predictions_key()
 
         # Try cache
-        if redis:
-            cached = await redis.get(cache_key)
-            if cached:
-                logger.info("Returning cached upcoming predictions")
-                return json.loads(cached)
+        cached = await cache.get_bytes(cache_key, 1800)
+        if cached:
+            logger.info("Returning cached upcoming predictions")
+            return _json_response(cached, request, field_list)
 
         # Generate predictions
         service = PredictionService()
         predictions = await service.get_upcoming_predictions()
 
+        body = PREDICTION_LIST_ADAPTER.dump_json(PREDICTION_LIST_ADAPTER.validate_python(predictions))
+
         # Cache for 30 minutes
-        if redis:
-            await redis.setex(cache_key, 1800, json.dumps(jsonable_encoder(predictions)))
+        await cache.set_bytes(cache_key, body, 1800)
 
-        return predictions
+        return _json_response(body, request, field_list)
     except Exception as e:
         logger.error(f"Error getting upcoming predictions: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/game/{game_id}", response_model=PredictionResponse)
-async def get_game_prediction(game_id: int):
-    """Get detailed prediction for a specific game"""
+async def get_game_prediction(game_id: int, request: Request, fields: Optional[str] = None):
+    """Get detailed prediction for a specific game; ``fields`` limits the returned keys"""
+    field_list = _parse_fields(fields)
     try:
-        redis = get_redis()
-        cache_key = f"ml:prediction:game:{game_id}"
+        cache_key = game_prediction_key(game_id)
 
         # Try cache
-        if redis:
-            cached = await redis.get(cache_key)
-            if cached:
-                logger.info(f"Returning cached prediction for game {game_id}")
-                return json.loads(cached)
+        cached = await cache.get_bytes(cache_key, GAME_PREDICTION_TTL)
+        if cached:
+            logger.info(f"Returning cached prediction for game {game_id}")
+            return _json_response(cached, request, field_list)
 
         # Generate prediction
         service = PredictionService()
         prediction = await service.predict_game(game_id)
 
+        body = PREDICTION_ADAPTER.dump_json(PREDICTION_ADAPTER.validate_python(prediction))
+
         # Cache for 15 minutes
-        if redis:
-            await redis.setex(cache_key, 900, json.dumps(jsonable_encoder(prediction)))
+        await cache.set_bytes(cache_key, body, GAME_PREDICTION_TTL)
 
-        return prediction
+        return _json_response(body, request, field_list)
     except Exception as e:
         logger.error(f"Error predicting game {game_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/weekly")
-async def get_weekly_predictions(week: int, season: int):
-    """Get predictions for a specific week"""
+async def get_weekly_predictions(week: int, season: int, request: Request, fields: Optional[str] = None):
+    """Get predictions for a specific week; ``fields`` limits the returned keys"""
+    field_list = _parse_fields(fields)
     try:
+        cache_key = weekly_predictions_key(season, week)
+
+        # Try cache
+        cached = await cache.get_bytes(cache_key, 1800)
+        if cached:
+            logger.info(f"Returning cached predictions for week {week} of {season}")
+            return _json_response(cached, request, field_list)
+
         service = PredictionService()
         predictions = await service.get_weekly_predictions(week, season)
-        return predictions
+
+        body = codec.dumps(predictions)
+
+        # Cache for 30 minutes
+        await cache.set_bytes(cache_key, body, 1800)
+
+        return _json_response(body, request, field_list)
     except Exception as e:
         logger.error(f"Error getting weekly predictions: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -113,7 +188,7 @@ async def optimize_parlay(request: ParlayRequest):
             request.max_selections,
             request.target_odds
         )
-        return optimized
+        return ORJSONResponse(optimized)
     except Exception as e:
         logger.error(f"Error optimizing parlay: {e}")
         raise HTTPException(status_code=500, detail=str(e))
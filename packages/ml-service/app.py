@@ -7,6 +7,8 @@ from contextlib import asynccontextmanager
 
 from api import predictions, models, data
 from utils.logger import logger
+from utils.cache import cache
+from utils.compression import CompressionMiddleware
 from utils.database import init_db, close_db
 
 load_dotenv()
@@ -17,6 +19,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting NFL Predictor ML Service...")
     await init_db()
     logger.info("Database connections established")
+    await cache.start()
 
     # Auto-train models if they don't exist or if forced
     from pathlib import Path
@@ -48,9 +51,17 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("✅ Models found, skipping training")
 
+    live_polling = os.getenv("LIVE_POLLING_ENABLED", "false").lower() == "true"
+    if live_polling:
+        from services.live_scheduler import live_scheduler
+        live_scheduler.start()
+
     yield
     # Shutdown
     logger.info("Shutting down ML Service...")
+    if live_polling:
+        await live_scheduler.stop()
+    await cache.stop()
     await close_db()
 
 app = FastAPI(
@@ -69,6 +80,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Negotiated brotli/gzip for larger JSON bodies (prediction lists run to tens of KB)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MIN_BYTES", 1024))
+)
+
 # Health check
 @app.get("/health")
 async def health_check():
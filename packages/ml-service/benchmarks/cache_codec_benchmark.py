@@ -0,0 +1,152 @@
+"""
+Cached prediction payload size and hit-path latency, before and after the codec.
+
+Builds a synthetic upcoming-predictions list and times what a Redis hit costs
+in-process (no network):
+
+  json         stored json.dumps(jsonable_encoder(...)); a hit json.loads the
+               payload, re-validates it through PredictionResponse and serializes
+               the response again (the previous /upcoming path)
+  orjson       stored pre-serialized response bytes; a hit unpacks and sends them
+  orjson+zstd  as above, zstd-compressed in Redis (needs the zstandard package)
+
+    python -m benchmarks.cache_codec_benchmark --games 16 --iterations 2000
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from api.predictions import PREDICTION_LIST_ADAPTER
+from benchmarks.fake_upstream import TEAMS
+from benchmarks.ingestion_benchmark import _percentile
+from utils import codec
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _prediction(game_id: int, rng: random.Random) -> Dict:
+    home, away = rng.sample(TEAMS, 2)
+    home_score, away_score = rng.uniform(14, 31), rng.uniform(14, 31)
+    confidence = rng.uniform(0.5, 0.8)
+    return {
+        "game_id": game_id,
+        "season": 2024,
+        "week": 10,
+        "game_date": datetime(2024, 11, 10, 18) + timedelta(hours=game_id % 4 * 3),
+        "home_team": home[1],
+        "away_team": away[1],
+        "home_abbr": home[0],
+        "away_abbr": away[0],
+        "predicted_winner": home[1] if home_score >= away_score else away[1],
+        "predicted_score": {
+            "home": round(home_score, 1),
+            "away": round(away_score, 1),
+            "spread": round(home_score - away_score, 1),
+            "total": round(home_score + away_score, 1),
+        },
+        "confidence": confidence,
+        "spread_prediction": round(home_score - away_score, 1),
+        "over_under_prediction": round(home_score + away_score, 1),
+        "key_factors": [
+            "Home field advantage",
+            "Recent form favors the home team",
+            "Key injuries on the away roster",
+        ],
+        "gematria_insights": {
+            "home_value": rng.randint(100, 999),
+            "away_value": rng.randint(100, 999),
+            "alignment": rng.choice(["strong", "neutral", "weak"]),
+            "ciphers": {name: rng.randint(10, 300) for name in ("ordinal", "reduction", "reverse", "sumerian")},
+        },
+        "injuries": {
+            "home": {"severe": rng.randint(0, 3), "questionable": rng.randint(0, 5), "impact": 0.3},
+            "away": {"severe": rng.randint(0, 3), "questionable": rng.randint(0, 5), "impact": 0.4},
+        },
+        "weather": {"temperature": rng.uniform(30, 80), "wind_speed": rng.uniform(0, 20), "conditions": "clear"},
+        "venue": {"name": home[2], "city": home[3]},
+        "model_breakdown": {
+            name: {"winner": rng.choice(["home", "away"]), "confidence": rng.uniform(0.5, 0.8)}
+            for name in ("random_forest", "xgboost", "neural_net")
+        },
+        "market_lines": {
+            "spread": {"home": -3.0, "away": 3.0, "range": [-3.5, -2.5], "books": 6},
+            "total": {"home": 44.5, "away": None, "range": [44.0, 45.5], "books": 6},
+            "moneyline": {"home": -150.0, "away": 130.0, "range": [-160.0, -140.0], "books": 6},
+        },
+    }
+
+
+def _time(fn: Callable[[], object], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main(args: argparse.Namespace) -> List[Dict]:
+    rng = random.Random(args.seed)
+    predictions = [_prediction(game_id, rng) for game_id in range(1, args.games + 1)]
+    body = PREDICTION_LIST_ADAPTER.dump_json(PREDICTION_LIST_ADAPTER.validate_python(predictions))
+
+    legacy = json.dumps(jsonable_encoder(predictions))
+
+    def legacy_hit():
+        models = PREDICTION_LIST_ADAPTER.validate_python(json.loads(legacy))
+        return json.dumps(PREDICTION_LIST_ADAPTER.dump_python(models, mode="json")).encode()
+
+    variants = {
+        "json": (legacy.encode(), legacy_hit),
+    }
+    raw = codec.RAW + body
+    variants["orjson"] = (raw, lambda: codec.unpack(raw))
+    if zstandard is not None:
+        compressed = codec.ZSTD + zstandard.ZstdCompressor(level=args.zstd_level).compress(body)
+        variants["orjson+zstd"] = (compressed, lambda: codec.unpack(compressed))
+    else:
+        print("zstandard is not installed; skipping orjson+zstd")
+
+    results = []
+    for name, (stored, hit) in variants.items():
+        timings = _time(hit, args.iterations)
+        result = {
+            "codec": name,
+            "games": args.games,
+            "stored_bytes": len(stored),
+            "hit_p50_us": round(statistics.median(timings) * 1e6, 1),
+            "hit_p99_us": round(_percentile(timings, 99) * 1e6, 1),
+        }
+        results.append(result)
+        print(
+            f"{name:<12} stored={result['stored_bytes']:>8}B "
+            f"p50={result['hit_p50_us']:>9.1f}us p99={result['hit_p99_us']:>9.1f}us"
+        )
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark cached prediction payload codecs")
+    parser.add_argument("--games", type=int, default=16, help="Predictions in the cached list")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--zstd-level", type=int, default=codec.CACHE_ZSTD_LEVEL)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="Write results to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    cli_args = _parse_args()
+    benchmark_results = main(cli_args)
+    if cli_args.json:
+        Path(cli_args.json).write_text(json.dumps(benchmark_results, indent=2))
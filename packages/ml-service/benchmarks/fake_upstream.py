@@ -0,0 +1,317 @@
+"""
+Local stand-in for the ESPN, The Odds API and OpenWeather endpoints used by DataService.
+
+Payloads follow the shape of the real APIs closely enough for the ingestion parsers,
+with configurable latency, error rate and size. Point DataService at it with:
+
+    ESPN_BASE_URL=http://127.0.0.1:8765/espn
+    ODDS_API_BASE_URL=http://127.0.0.1:8765/odds
+    WEATHER_API_BASE_URL=http://127.0.0.1:8765/weather
+
+Run standalone with ``python -m benchmarks.fake_upstream --port 8765``.
+"""
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+# (abbreviation, display name, venue, city, state) - abbreviations match the teams seed
+TEAMS = [
+    ("ARI", "Arizona Cardinals", "State Farm Stadium", "Glendale", "AZ"),
+    ("ATL", "Atlanta Falcons", "Mercedes-Benz Stadium", "Atlanta", "GA"),
+    ("BAL", "Baltimore Ravens", "M&T Bank Stadium", "Baltimore", "MD"),
+    ("BUF", "Buffalo Bills", "Highmark Stadium", "Orchard Park", "NY"),
+    ("CAR", "Carolina Panthers", "Bank of America Stadium", "Charlotte", "NC"),
+    ("CHI", "Chicago Bears", "Soldier Field", "Chicago", "IL"),
+    ("CIN", "Cincinnati Bengals", "Paycor Stadium", "Cincinnati", "OH"),
+    ("CLE", "Cleveland Browns", "Cleveland Browns Stadium", "Cleveland", "OH"),
+    ("DAL", "Dallas Cowboys", "AT&T Stadium", "Arlington", "TX"),
+    ("DEN", "Denver Broncos", "Empower Field at Mile High", "Denver", "CO"),
+    ("DET", "Detroit Lions", "Ford Field", "Detroit", "MI"),
+    ("GB", "Green Bay Packers", "Lambeau Field", "Green Bay", "WI"),
+    ("HOU", "Houston Texans", "NRG Stadium", "Houston", "TX"),
+    ("IND", "Indianapolis Colts", "Lucas Oil Stadium", "Indianapolis", "IN"),
+    ("JAX", "Jacksonville Jaguars", "TIAA Bank Field", "Jacksonville", "FL"),
+    ("KC", "Kansas City Chiefs", "GEHA Field at Arrowhead Stadium", "Kansas City", "MO"),
+    ("LV", "Las Vegas Raiders", "Allegiant Stadium", "Las Vegas", "NV"),
+    ("LAC", "Los Angeles Chargers", "SoFi Stadium", "Inglewood", "CA"),
+    ("LAR", "Los Angeles Rams", "SoFi Stadium", "Inglewood", "CA"),
+    ("MIA", "Miami Dolphins", "Hard Rock Stadium", "Miami Gardens", "FL"),
+    ("MIN", "Minnesota Vikings", "U.S. Bank Stadium", "Minneapolis", "MN"),
+    ("NE", "New England Patriots", "Gillette Stadium", "Foxborough", "MA"),
+    ("NO", "New Orleans Saints", "Caesars Superdome", "New Orleans", "LA"),
+    ("NYG", "New York Giants", "MetLife Stadium", "East Rutherford", "NJ"),
+    ("NYJ", "New York Jets", "MetLife Stadium", "East Rutherford", "NJ"),
+    ("PHI", "Philadelphia Eagles", "Lincoln Financial Field", "Philadelphia", "PA"),
+    ("PIT", "Pittsburgh Steelers", "Acrisure Stadium", "Pittsburgh", "PA"),
+    ("SF", "San Francisco 49ers", "Levi's Stadium", "Santa Clara", "CA"),
+    ("SEA", "Seattle Seahawks", "Lumen Field", "Seattle", "WA"),
+    ("TB", "Tampa Bay Buccaneers", "Raymond James Stadium", "Tampa", "FL"),
+    ("TEN", "Tennessee Titans", "Nissan Stadium", "Nashville", "TN"),
+    ("WAS", "Washington Commanders", "FedExField", "Landover", "MD"),
+]
+
+TEAM_STATS = [
+    ("pointsFor", 20, 32), ("pointsAgainst", 17, 30), ("yardsPerGame", 290, 400),
+    ("passingYardsPerGame", 180, 280), ("rushingYardsPerGame", 80, 150), ("turnovers", 5, 25),
+    ("sacks", 15, 55), ("thirdDownPct", 32, 48), ("redZonePct", 45, 70),
+    ("timeOfPossession", 28, 32),
+]
+
+BOOKMAKERS = ["draftkings", "fanduel", "betmgm", "caesars", "pointsbetus", "betrivers", "bovada", "unibet"]
+# Limited to the values allowed by the injuries.status CHECK constraint
+INJURY_STATUSES = ["Out", "Doubtful", "Questionable", "Probable", "IR"]
+
+
+@dataclass
+class UpstreamProfile:
+    """Behaviour of the stand-in upstream"""
+
+    latency_ms: float = 50.0
+    jitter_ms: float = 25.0
+    error_rate: float = 0.0
+    games_per_week: int = 16
+    injuries_per_team: int = 6
+    bookmakers: int = 6
+    # The odds endpoint has no week parameter; it lists this week's slate as "upcoming"
+    odds_season: int = 2024
+    odds_week: int = 1
+    seed: int = 7
+
+
+class FakeUpstream:
+    """aiohttp application serving deterministic NFL payloads"""
+
+    def __init__(self, profile: Optional[UpstreamProfile] = None):
+        self.profile = profile or UpstreamProfile()
+        self.requests = 0
+        self.errors = 0
+        self.base_url = ""
+        self._rng = random.Random(self.profile.seed)
+        self._runner: Optional[web.AppRunner] = None
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._behaviour])
+        app.router.add_get("/espn/scoreboard", self.scoreboard)
+        app.router.add_get("/espn/teams", self.teams)
+        app.router.add_get("/espn/teams/{abbr}/statistics", self.team_statistics)
+        app.router.add_get("/espn/injuries", self.injuries)
+        app.router.add_get("/odds/sports/americanfootball_nfl/odds/", self.odds)
+        app.router.add_get("/weather/weather", self.weather)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving in the running loop; returns the root URL"""
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def service_urls(self) -> Dict[str, str]:
+        """DataService keyword arguments pointing every feed at this server"""
+        return {
+            "espn_base_url": f"{self.base_url}/espn",
+            "odds_base_url": f"{self.base_url}/odds",
+            "weather_base_url": f"{self.base_url}/weather",
+        }
+
+    @web.middleware
+    async def _behaviour(self, request: web.Request, handler):
+        self.requests += 1
+        delay = max(0.0, self.profile.latency_ms + self._rng.uniform(-1, 1) * self.profile.jitter_ms)
+        await asyncio.sleep(delay / 1000)
+        if self._rng.random() < self.profile.error_rate:
+            self.errors += 1
+            return web.json_response({"error": "injected failure"}, status=503)
+        return await handler(request)
+
+    def schedule(self, season: int, week: int) -> List[Dict]:
+        """Deterministic pairings for a week: rotate the team list by week"""
+        games = max(1, min(self.profile.games_per_week, len(TEAMS) // 2))
+        shift = (week - 1) % (len(TEAMS) - 1)
+        rotated = [TEAMS[0]] + TEAMS[1:][shift:] + TEAMS[1:][:shift]
+        kickoff = datetime(season, 9, 7, 17, 0) + timedelta(weeks=week - 1)
+        slate = []
+        for index in range(games):
+            home, away = rotated[index], rotated[-(index + 1)]
+            slate.append({
+                "id": f"{season}{week:02d}{index:02d}",
+                "home": home,
+                "away": away,
+                "kickoff": kickoff + timedelta(hours=3 * (index % 4)),
+            })
+        return slate
+
+    async def scoreboard(self, request: web.Request) -> web.Response:
+        dates = request.query.get("dates") or "2024"
+        if "-" in dates:
+            # Date-range query (season ingestion): every regular-season week at once
+            season = int(dates[:4])
+            weeks = range(1, 19)
+        else:
+            season = int(dates)
+            weeks = [int(request.query.get("week") or 1)]
+
+        events = [
+            self._event(season, week, game)
+            for week in weeks
+            for game in self.schedule(season, week)
+        ]
+        return web.json_response({
+            "season": {"year": season, "type": 2},
+            "week": {"number": weeks[0]},
+            "events": events,
+        })
+
+    def _event(self, season: int, week: int, game: Dict) -> Dict:
+        rng = random.Random(game["id"])
+        home, away = game["home"], game["away"]
+        return {
+            "id": game["id"],
+            "date": game["kickoff"].strftime("%Y-%m-%dT%H:%MZ"),
+            "season": {"year": season, "type": 2},
+            "week": {"number": week},
+            "status": {"type": {"name": "STATUS_FINAL"}},
+            "competitions": [{
+                "attendance": rng.randint(55000, 80000),
+                "venue": {"fullName": home[2], "address": {"city": home[3], "state": home[4]}},
+                "competitors": [
+                    self._competitor(home, "home", rng),
+                    self._competitor(away, "away", rng),
+                ],
+                "odds": [{
+                    "details": f"{home[0]} -{rng.randint(1, 10)}.5",
+                    "overUnder": rng.randint(38, 54) + 0.5,
+                }],
+            }],
+        }
+
+    async def teams(self, request: web.Request) -> web.Response:
+        teams = [
+            {
+                "team": {
+                    "abbreviation": abbr,
+                    "displayName": name,
+                    "record": {"items": [{"type": "total", "summary": "9-8"}]},
+                    "links": [{
+                        "rel": ["statistics", "desktop"],
+                        "href": f"{self.base_url}/espn/teams/{abbr}/statistics",
+                    }],
+                }
+            }
+            for abbr, name, *_ in TEAMS
+        ]
+        return web.json_response({"sports": [{"leagues": [{"teams": teams}]}]})
+
+    async def team_statistics(self, request: web.Request) -> web.Response:
+        rng = random.Random(request.path_qs)
+        stats = [{"name": name, "value": round(rng.uniform(low, high), 1)} for name, low, high in TEAM_STATS]
+        return web.json_response({"splits": {"categories": [{"name": "general", "stats": stats}]}})
+
+    async def injuries(self, request: web.Request) -> web.Response:
+        rng = random.Random(len(TEAMS))
+        payload = []
+        for abbr, *_ in TEAMS:
+            payload.append({
+                "team": {"abbreviation": abbr},
+                "injuries": [
+                    {
+                        "athlete": {
+                            "displayName": f"{abbr} Player {index}",
+                            "position": {"abbreviation": rng.choice(["QB", "RB", "WR", "TE", "OL", "DL", "LB", "CB", "S"])},
+                        },
+                        "details": {"detail": rng.choice(["Knee", "Ankle", "Hamstring", "Concussion", "Shoulder"])},
+                        "status": {"type": rng.choice(INJURY_STATUSES)},
+                    }
+                    for index in range(self.profile.injuries_per_team)
+                ],
+            })
+        return web.json_response({"injuries": payload})
+
+    async def odds(self, request: web.Request) -> web.Response:
+        season, week = self.profile.odds_season, self.profile.odds_week
+        rng = random.Random(f"odds-{season}-{week}")
+        events = []
+        for game in self.schedule(season, week):
+            spread = rng.randint(1, 10) + 0.5
+            total = rng.randint(38, 54) + 0.5
+            bookmakers = []
+            for book in BOOKMAKERS[:self.profile.bookmakers]:
+                bookmakers.append({
+                    "key": book,
+                    "markets": [
+                        {"key": "spreads", "outcomes": [
+                            {"name": game["home"][1], "type": "home", "point": -spread, "price": -110},
+                            {"name": game["away"][1], "type": "away", "point": spread, "price": -110},
+                        ]},
+                        {"key": "totals", "outcomes": [
+                            {"name": "Over", "point": total, "price": -110},
+                            {"name": "Under", "point": total, "price": -110},
+                        ]},
+                        {"key": "h2h", "outcomes": [
+                            {"name": game["home"][1], "type": "home", "price": -rng.randint(120, 400)},
+                            {"name": game["away"][1], "type": "away", "price": rng.randint(100, 340)},
+                        ]},
+                    ],
+                })
+            events.append({
+                "id": f"odds-{game['id']}",
+                "commence_time": game["kickoff"].strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "home_team": game["home"][1],
+                "away_team": game["away"][1],
+                "bookmakers": bookmakers,
+            })
+        return web.json_response(events)
+
+    async def weather(self, request: web.Request) -> web.Response:
+        rng = random.Random(request.query.get("q"))
+        return web.json_response({
+            "main": {"temp": round(rng.uniform(20, 90), 1), "humidity": rng.randint(20, 95)},
+            "weather": [{"description": rng.choice(["clear sky", "light rain", "overcast clouds", "snow"])}],
+            "wind": {"speed": round(rng.uniform(0, 25), 1)},
+        })
+
+    def _competitor(self, team, home_away: str, rng: random.Random) -> Dict:
+        return {
+            "homeAway": home_away,
+            "score": str(rng.randint(3, 42)),
+            "team": {"abbreviation": team[0], "displayName": team[1]},
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake NFL upstream APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=25.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--injuries-per-team", type=int, default=6)
+    parser.add_argument("--bookmakers", type=int, default=6)
+    args = parser.parse_args()
+
+    upstream = FakeUpstream(UpstreamProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        injuries_per_team=args.injuries_per_team,
+        bookmakers=args.bookmakers,
+    ))
+    upstream.base_url = f"http://{args.host}:{args.port}"
+    web.run_app(upstream.build_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
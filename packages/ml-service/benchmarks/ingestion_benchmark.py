@@ -0,0 +1,154 @@
+"""
+Ingestion throughput benchmark against the local fake upstream.
+
+Starts benchmarks.fake_upstream in-process, points DataService at it and ingests
+the same weeks once per concurrency level, reporting rows/second and per-week
+latency. Writes go to the database configured by DATABASE_URL (the teams table must
+be seeded), so run it against a scratch database.
+
+    python -m benchmarks.ingestion_benchmark --weeks 8 --concurrency 1,2,4,8
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+env_path = Path(__file__).resolve().parents[1] / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+from benchmarks.fake_upstream import FakeUpstream, UpstreamProfile  # noqa: E402
+from services.data_service import DataService  # noqa: E402
+from utils.http_policy import upstream_policies  # noqa: E402
+
+FEED_ROW_KEYS = {"games": "fetched", "team_stats": "processed", "injuries": "processed", "odds": "processed"}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _rows_written(result: Dict) -> int:
+    return sum(
+        int((result.get(feed) or {}).get(key) or 0)
+        for feed, key in FEED_ROW_KEYS.items()
+    )
+
+
+async def _run_level(service: DataService, upstream: FakeUpstream, args, concurrency: int) -> Dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    rows = 0
+    failed_feeds = 0
+    requests_before, errors_before = upstream.requests, upstream.errors
+
+    async def _week(week: int):
+        nonlocal rows, failed_feeds
+        async with semaphore:
+            started = time.perf_counter()
+            result = await service.update_all(
+                season=args.season,
+                week=week,
+                include_weather=args.weather,
+                include_odds=args.odds,
+            )
+            latencies.append(time.perf_counter() - started)
+            rows += _rows_written(result)
+            failed_feeds += len(result["failed_feeds"])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_week(week) for week in range(1, args.weeks + 1)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "weeks": args.weeks,
+        "rows": rows,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+        "week_latency_p50": round(statistics.median(latencies), 3) if latencies else 0.0,
+        "week_latency_p95": round(_percentile(latencies, 95), 3),
+        "upstream_requests": upstream.requests - requests_before,
+        "upstream_errors": upstream.errors - errors_before,
+        "failed_feeds": failed_feeds,
+    }
+
+
+async def main(args: argparse.Namespace) -> List[Dict]:
+    upstream = FakeUpstream(UpstreamProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        injuries_per_team=args.injuries_per_team,
+        bookmakers=args.bookmakers,
+    ))
+    await upstream.start()
+
+    host = upstream.base_url.split("://", 1)[1]
+    if not args.rate_limited:
+        # Measure ingestion, not the production per-host throttle
+        upstream_policies.configure(host, rate=10_000.0, burst=10_000, backoff_base=0.05)
+
+    service = DataService(**upstream.service_urls())
+    service.odds_api_key = service.odds_api_key or "benchmark"
+    service.weather_api_key = service.weather_api_key or "benchmark"
+
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            result = await _run_level(service, upstream, args, concurrency)
+            results.append(result)
+            print(
+                f"concurrency={concurrency:<3} rows={result['rows']:<6} "
+                f"elapsed={result['elapsed_seconds']:>7.2f}s rows/s={result['rows_per_second']:>8.1f} "
+                f"p50={result['week_latency_p50']:.3f}s p95={result['week_latency_p95']:.3f}s "
+                f"requests={result['upstream_requests']} errors={result['upstream_errors']}"
+            )
+    finally:
+        await upstream.stop()
+
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark DataService ingestion throughput")
+    parser.add_argument("--season", type=int, default=2024)
+    parser.add_argument("--weeks", type=int, default=8, help="Weeks ingested per concurrency level")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(part) for part in value.split(",")],
+        default=[1, 2, 4, 8],
+        help="Comma separated concurrency levels",
+    )
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mean upstream latency")
+    parser.add_argument("--jitter-ms", type=float, default=25.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered 503")
+    parser.add_argument("--injuries-per-team", type=int, default=6)
+    parser.add_argument("--bookmakers", type=int, default=6)
+    parser.add_argument("--no-weather", dest="weather", action="store_false")
+    parser.add_argument("--no-odds", dest="odds", action="store_false")
+    parser.add_argument(
+        "--rate-limited",
+        action="store_true",
+        help="Keep the default per-host rate limit for the fake upstream",
+    )
+    parser.add_argument("--json", help="Write results to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.getLogger("nfl_ml_service").setLevel(logging.WARNING)
+    cli_args = _parse_args()
+    benchmark_results = asyncio.run(main(cli_args))
+    if cli_args.json:
+        Path(cli_args.json).write_text(json.dumps(benchmark_results, indent=2))
@@ -0,0 +1,165 @@
+"""
+Line history latency as seasons of history accumulate.
+
+Seeds synthetic seasons of games and line events into the database configured by
+DATABASE_URL, one season partition each, and after every added season times the
+line-movement query for games in the newest season, with and without the season
+predicate that enables partition pruning. Synthetic rows use seasons from 9000 up
+and are removed (games deleted, partitions dropped) when the run ends, so use a
+scratch database with migration 016 applied.
+
+    python -m benchmarks.partition_benchmark --seasons 10 --games 285 --books 6
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+env_path = Path(__file__).resolve().parents[1] / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+from sqlalchemy import text  # noqa: E402
+
+from benchmarks.ingestion_benchmark import _percentile  # noqa: E402
+from services.line_history import LineHistory  # noqa: E402
+from utils.database import SessionLocal  # noqa: E402
+
+FIRST_SEASON = 9000
+
+SEED_GAMES = text(
+    """
+    INSERT INTO games (espn_game_id, season, week, home_team, away_team, game_date, status)
+    SELECT 'bench-' || CAST(:season AS INTEGER) || '-' || n, CAST(:season AS INTEGER),
+           n % 18 + 1, 'Bench Home', 'Bench Away',
+           TIMESTAMP '2000-09-01' + n * INTERVAL '1 hour', 'final'
+    FROM generate_series(1, :games) AS n
+    """
+)
+
+SEED_EVENTS = text(
+    """
+    INSERT INTO betting_line_events (
+        season, game_id, sportsbook, market, home_value, away_value, recorded_at
+    )
+    SELECT g.season, g.id, 'book' || b, m.market,
+           -3 + (c % 7) * 0.5, 3 - (c % 7) * 0.5,
+           g.game_date - c * INTERVAL '1 hour'
+    FROM games g
+    CROSS JOIN generate_series(1, :books) AS b
+    CROSS JOIN (VALUES ('spread'), ('total'), ('moneyline')) AS m(market)
+    CROSS JOIN generate_series(1, :changes) AS c
+    WHERE g.season = :season AND g.espn_game_id LIKE 'bench-%'
+    """
+)
+
+UNPRUNED_MOVEMENT = text(
+    """
+    SELECT market, sportsbook, home_value, away_value, recorded_at
+    FROM betting_line_events
+    WHERE game_id = :game_id
+    ORDER BY market, recorded_at, id
+    """
+)
+
+
+async def _seed_season(session, season: int, args) -> List[int]:
+    await session.execute(
+        text("SELECT ensure_season_partition('betting_line_events', CAST(:season AS INTEGER))"),
+        {"season": season},
+    )
+    await session.execute(SEED_GAMES, {"season": season, "games": args.games})
+    await session.execute(
+        SEED_EVENTS,
+        {"season": season, "books": args.books, "changes": args.changes},
+    )
+    await session.execute(text("ANALYZE betting_line_events"))
+    await session.commit()
+
+    result = await session.execute(
+        text("SELECT id FROM games WHERE season = :season AND espn_game_id LIKE 'bench-%'"),
+        {"season": season},
+    )
+    return [row.id for row in result]
+
+
+async def _time_queries(session, game_ids: List[int], args) -> Dict[str, List[float]]:
+    history = LineHistory()
+    timings = {"pruned": [], "unpruned": []}
+    for game_id in random.sample(game_ids, min(args.queries, len(game_ids))):
+        started = time.perf_counter()
+        await history.movement(session, game_id)
+        timings["pruned"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        (await session.execute(UNPRUNED_MOVEMENT, {"game_id": game_id})).fetchall()
+        timings["unpruned"].append(time.perf_counter() - started)
+    return timings
+
+
+async def _cleanup(session, seasons: List[int]) -> None:
+    await session.rollback()
+    await session.execute(
+        text("DELETE FROM games WHERE season >= :first AND espn_game_id LIKE 'bench-%'"),
+        {"first": FIRST_SEASON},
+    )
+    for season in seasons:
+        await session.execute(text(f"DROP TABLE IF EXISTS betting_line_events_{int(season)}"))
+    await session.commit()
+
+
+async def main(args: argparse.Namespace) -> List[Dict]:
+    results = []
+    seasons: List[int] = []
+    async with SessionLocal() as session:
+        try:
+            for offset in range(args.seasons):
+                season = FIRST_SEASON + offset
+                seasons.append(season)
+                game_ids = await _seed_season(session, season, args)
+                timings = await _time_queries(session, game_ids, args)
+
+                rows = (await session.execute(
+                    text("SELECT COUNT(*) FROM betting_line_events WHERE season >= :first"),
+                    {"first": FIRST_SEASON},
+                )).scalar_one()
+                result = {"seasons": len(seasons), "event_rows": rows}
+                for name, values in timings.items():
+                    result[f"{name}_p50_ms"] = round(statistics.median(values) * 1000, 3)
+                    result[f"{name}_p95_ms"] = round(_percentile(values, 95) * 1000, 3)
+                results.append(result)
+                print(
+                    f"seasons={result['seasons']:<3} rows={rows:<9} "
+                    f"pruned p50={result['pruned_p50_ms']:.3f}ms p95={result['pruned_p95_ms']:.3f}ms  "
+                    f"unpruned p50={result['unpruned_p50_ms']:.3f}ms p95={result['unpruned_p95_ms']:.3f}ms"
+                )
+        finally:
+            await _cleanup(session, seasons)
+
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark line history queries as history grows")
+    parser.add_argument("--seasons", type=int, default=10, help="Seasons of history to build up")
+    parser.add_argument("--games", type=int, default=285, help="Games per season")
+    parser.add_argument("--books", type=int, default=6)
+    parser.add_argument("--changes", type=int, default=20, help="Line changes per book and market")
+    parser.add_argument("--queries", type=int, default=200, help="Timed queries per history size")
+    parser.add_argument("--json", help="Write results to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.getLogger("nfl_ml_service").setLevel(logging.WARNING)
+    cli_args = _parse_args()
+    benchmark_results = asyncio.run(main(cli_args))
+    if cli_args.json:
+        Path(cli_args.json).write_text(json.dumps(benchmark_results, indent=2))
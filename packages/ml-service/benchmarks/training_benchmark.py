@@ -0,0 +1,65 @@
+"""
+Wall-clock time of training the three production models, one after another vs in
+parallel worker processes.
+
+Fits the NFLModelTrainer jobs on synthetic features shaped like the training set:
+first in-process and sequentially (the previous pipeline), then with one spawned
+process per model under the per-model core budgets. Parallel time should approach
+the slowest single fit plus process start-up; it can only beat sequential on a
+machine with more than one core.
+
+    python -m benchmarks.training_benchmark --games 5000 --cores 8
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from training.train_models import TRAINING_JOBS
+from utils.training_pool import TRAINING_CORES, train_in_parallel
+
+
+def _dataset(games: int, seed: int):
+    rng = np.random.default_rng(seed)
+    X = rng.random((games, 7))
+    y = (X[:, 0] + X[:, 4] + rng.random(games) * 0.5 > 1.0).astype(int)
+    split = int(games * 0.8)
+    return X[:split], y[:split], X[split:], y[split:]
+
+
+def main(args: argparse.Namespace) -> List[Dict]:
+    data = _dataset(args.games, args.seed)
+
+    results = []
+    for mode, processes in (("sequential", 1), ("parallel", len(TRAINING_JOBS))):
+        started = time.perf_counter()
+        fitted = train_in_parallel(TRAINING_JOBS, *data, total_cores=args.cores, processes=processes)
+        result = {
+            "mode": mode,
+            "games": args.games,
+            "cores": args.cores,
+            "wall_seconds": round(time.perf_counter() - started, 3),
+            "fit_seconds": {name: item["seconds"] for name, item in fitted.items()},
+        }
+        results.append(result)
+        print(f"{mode:<11} wall={result['wall_seconds']:>7.2f}s fits={result['fit_seconds']}")
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs parallel model training")
+    parser.add_argument("--games", type=int, default=5000, help="Synthetic games to train on")
+    parser.add_argument("--cores", type=int, default=TRAINING_CORES, help="Total core budget")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="Write results to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    cli_args = _parse_args()
+    benchmark_results = main(cli_args)
+    if cli_args.json:
+        Path(cli_args.json).write_text(json.dumps(benchmark_results, indent=2))
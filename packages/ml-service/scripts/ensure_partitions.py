@@ -0,0 +1,75 @@
+"""
+Attach season partitions for the season-partitioned tables (migration 016).
+
+Run before a season starts (and it is safe to re-run). Rows already written for a
+season without its own partition are moved out of the default partition.
+
+    python -m scripts.ensure_partitions                # current and next season
+    python -m scripts.ensure_partitions --season 2025 --season 2026
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+env_path = Path(__file__).resolve().parents[1] / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+from sqlalchemy import text  # noqa: E402
+
+from utils.database import SessionLocal  # noqa: E402
+
+PARTITIONED_TABLES = ("betting_line_events",)
+
+
+def _default_seasons() -> list:
+    today = date.today()
+    # January/February games belong to the season that started the previous year
+    current = today.year if today.month >= 3 else today.year - 1
+    return [current, current + 1]
+
+
+async def main(args: argparse.Namespace):
+    async with SessionLocal() as session:
+        for table in args.table:
+            for season in args.season:
+                result = await session.execute(
+                    text("SELECT ensure_season_partition(:table, CAST(:season AS INTEGER))"),
+                    {"table": table, "season": season},
+                )
+                logger.info(f"{table}: season {season} -> {result.scalar_one()}")
+        await session.commit()
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Attach season partitions")
+    parser.add_argument(
+        "--season",
+        type=int,
+        action="append",
+        help="Season to attach (repeatable; defaults to the current and next season)",
+    )
+    parser.add_argument(
+        "--table",
+        action="append",
+        choices=PARTITIONED_TABLES,
+        help="Partitioned table (repeatable; defaults to all)",
+    )
+    args = parser.parse_args()
+    args.season = args.season or _default_seasons()
+    args.table = args.table or list(PARTITIONED_TABLES)
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
@@ -1,14 +1,15 @@
 """
 Populate database with historical NFL data for ML training.
-This script fetches data from ESPN for multiple seasons and weeks.
+This script backfills ESPN data for multiple seasons and weeks in parallel,
+checkpointing each week so an interrupted run resumes where it left off.
 """
+import argparse
 import asyncio
 import sys
 import logging
 from pathlib import Path
 
 from dotenv import load_dotenv
-from services.data_service import DataService
 
 # Setup logging
 logging.basicConfig(
@@ -17,71 +18,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Load environment
+# Load environment before the service modules read DATABASE_URL
 env_path = Path(__file__).resolve().parents[1] / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
-async def populate_season(service: DataService, season: int, start_week: int = 1, end_week: int = 18):
-    """Populate data for a single season."""
-    logger.info(f"Starting season {season} (weeks {start_week}-{end_week})")
-
-    total_games = 0
-    for week in range(start_week, end_week + 1):
-        try:
-            logger.info(f"Fetching {season} Week {week}...")
-            result = await service.update_all(
-                season=season,
-                week=week,
-                include_weather=False,  # Skip weather for historical data
-                include_odds=False  # Skip odds for historical data
-            )
-
-            games_count = result.get('games', {}).get('inserted', 0) + result.get('games', {}).get('updated', 0)
-            total_games += games_count
-            logger.info(f"  ✓ Week {week}: {games_count} games")
-
-            # Small delay to avoid overwhelming the API
-            await asyncio.sleep(2)
-
-        except Exception as e:
-            logger.error(f"  ✗ Week {week} failed: {e}")
-            continue
-
-    logger.info(f"Season {season} complete: {total_games} total games\n")
-    return total_games
-
-async def main():
+from services.backfill import BackfillEngine  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Backfill historical NFL data")
+    parser.add_argument("--start-season", type=int, default=2015, help="First season to fetch")
+    parser.add_argument("--end-season", type=int, default=2024, help="Last season to fetch")
+    parser.add_argument("--start-week", type=int, default=1, help="First week of each season")
+    parser.add_argument("--end-week", type=int, default=18, help="Last week of each season")
+    parser.add_argument("--concurrency", type=int, default=4, help="Weeks fetched in parallel")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=1.0,
+        help="Maximum new weeks started per second",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore checkpoints and refetch every week",
+    )
+    parser.add_argument("--yes", action="store_true", help="Do not prompt for confirmation")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
     """Main function to populate historical data."""
     logger.info("=" * 60)
     logger.info("NFL Historical Data Population")
     logger.info("=" * 60)
 
-    # Define seasons to fetch (2015-2024)
-    seasons = list(range(2015, 2025))
+    seasons = list(range(args.start_season, args.end_season + 1))
+    weeks = range(args.start_week, args.end_week + 1)
 
     logger.info(f"Will fetch {len(seasons)} seasons: {seasons[0]}-{seasons[-1]}")
-    logger.info(f"Estimated time: {len(seasons) * 18 * 2 / 60:.1f} minutes")
+    logger.info(f"Concurrency: {args.concurrency} weeks, rate limit: {args.rate} weeks/s")
+    logger.info(f"Resume from checkpoints: {not args.restart}")
     logger.info("=" * 60)
 
-    proceed = input("\nProceed with data population? (y/n): ")
-    if proceed.lower() != 'y':
-        logger.info("Aborted by user")
-        return
-
-    service = DataService()
-    grand_total = 0
+    if not args.yes:
+        proceed = input("\nProceed with data population? (y/n): ")
+        if proceed.lower() != 'y':
+            logger.info("Aborted by user")
+            return
 
-    for season in seasons:
-        try:
-            total = await populate_season(service, season)
-            grand_total += total
-        except Exception as e:
-            logger.error(f"Season {season} failed completely: {e}")
-            continue
+    engine = BackfillEngine(concurrency=args.concurrency, weeks_per_second=args.rate)
+    result = await engine.run(seasons, weeks, resume=not args.restart)
 
     logger.info("=" * 60)
-    logger.info(f"COMPLETE! Total games populated: {grand_total}")
+    logger.info(f"COMPLETE! Total games populated: {result['games_written']}")
+    logger.info(
+        f"Weeks completed: {result['completed']}, skipped (checkpointed): {result['skipped']}, "
+        f"failed: {len(result['failed'])}"
+    )
+    if result["failed"]:
+        logger.info("Re-run the script to retry failed weeks")
     logger.info("=" * 60)
     logger.info("\nNext steps:")
     logger.info("1. Verify data: curl http://localhost:4100/api/nfl-data/games/2024/8")
@@ -90,7 +87,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(_parse_args()))
     except KeyboardInterrupt:
-        logger.info("\nInterrupted by user")
+        logger.info("\nInterrupted by user - re-run to resume from the last checkpoint")
         sys.exit(0)
@@ -0,0 +1,97 @@
+"""
+Replay archived upstream payloads into the database without touching the network.
+Every payload fetched while PAYLOAD_ARCHIVE_DIR is set is archived; this script
+re-runs the parsers and bulk upserts over that archive, week by week.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Load environment before the service modules read DATABASE_URL
+env_path = Path(__file__).resolve().parents[1] / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+from services.data_service import DataService  # noqa: E402
+from services.payload_archive import PayloadArchive  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay archived upstream payloads")
+    parser.add_argument(
+        "--archive-dir",
+        default=os.getenv("PAYLOAD_ARCHIVE_DIR"),
+        help="Archive root (defaults to PAYLOAD_ARCHIVE_DIR)",
+    )
+    parser.add_argument("--season", type=int, help="Only replay this season")
+    parser.add_argument("--week", type=int, help="Only replay this week")
+    parser.add_argument("--no-weather", action="store_true", help="Skip archived weather payloads")
+    parser.add_argument(
+        "--historical",
+        action="store_true",
+        help="Skip live-only feeds (injuries and odds)",
+    )
+    args = parser.parse_args()
+    if not args.archive_dir:
+        parser.error("--archive-dir or PAYLOAD_ARCHIVE_DIR is required")
+    return args
+
+
+async def main(args: argparse.Namespace):
+    archive = PayloadArchive(Path(args.archive_dir))
+    service = DataService(archive=archive, replay=True)
+
+    weeks = sorted({
+        (entry["season"], entry["week"])
+        for entry in archive.entries(feed="scoreboard", season=args.season, week=args.week)
+        if entry["season"] is not None and entry["week"] is not None
+    })
+    if not weeks:
+        logger.info("No archived scoreboard payloads match the selection")
+        return
+
+    logger.info(f"Replaying {len(weeks)} weeks from {args.archive_dir}")
+    started = time.perf_counter()
+    failed = {}
+    games = 0
+
+    for season, week in weeks:
+        result = await service.update_all(
+            season=season,
+            week=week,
+            include_weather=not args.no_weather,
+            historical=args.historical,
+        )
+        games += result["games"].get("fetched", 0)
+        if result["failed_feeds"]:
+            failed[(season, week)] = result["failed_feeds"]
+        logger.info(f"Season {season} week {week}: {result['games'].get('fetched', 0)} games")
+
+    logger.info("=" * 60)
+    logger.info(
+        f"Replayed {len(weeks)} weeks, {games} games in {time.perf_counter() - started:.1f}s"
+    )
+    for (season, week), feeds in failed.items():
+        logger.info(f"Season {season} week {week}: missing or failed feeds {feeds}")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(_parse_args()))
+    except KeyboardInterrupt:
+        logger.info("\nInterrupted by user")
+        sys.exit(0)
@@ -18,6 +18,12 @@ def _load_environment() -> None:
 
 async def _run_update(args: argparse.Namespace) -> dict:
     service = DataService()
+    if args.full_season:
+        return await service.fetch_season_games(
+            args.season,
+            include_postseason=args.postseason,
+            include_weather=not args.no_weather,
+        )
     return await service.update_all(
         season=args.season,
         week=args.week,
@@ -42,8 +48,20 @@ def main() -> None:
         action="store_true",
         help="Skip odds ingestion even if ODDS_API_KEY is configured",
     )
+    parser.add_argument(
+        "--full-season",
+        action="store_true",
+        help="Load the whole season schedule in one request instead of a single week",
+    )
+    parser.add_argument(
+        "--postseason",
+        action="store_true",
+        help="With --full-season, also load playoff games",
+    )
 
     args = parser.parse_args()
+    if args.full_season and args.season is None:
+        parser.error("--full-season requires --season")
 
     _load_environment()
 
@@ -0,0 +1,191 @@
+import asyncio
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from services.data_service import DataService
+from utils.database import SessionLocal
+from utils.logger import logger
+from utils.rate_limit import TokenBucket
+
+
+class BackfillEngine:
+    """Parallel, resumable historical ingestion over (season, week) tasks.
+
+    Up to ``concurrency`` weeks run at once, and new weeks start no faster than
+    ``weeks_per_second`` (a token bucket, so short bursts are allowed). Because weeks
+    finish out of order, each season's derived team stats are rebuilt as soon as all of
+    its pending weeks have landed, and its weeks are checkpointed then. A week is
+    ``completed`` only after its games and team stats feeds and that rebuild succeed;
+    completed weeks are skipped on resume, so an interrupted run keeps every finished
+    season.
+    """
+
+    def __init__(
+        self,
+        service: DataService = None,
+        *,
+        concurrency: int = 4,
+        weeks_per_second: float = 1.0
+    ):
+        self.service = service or DataService()
+        self.concurrency = max(concurrency, 1)
+        self.bucket = TokenBucket(weeks_per_second, capacity=self.concurrency)
+
+    async def run(
+        self,
+        seasons: Iterable[int],
+        weeks: Iterable[int] = range(1, 19),
+        *,
+        resume: bool = True
+    ) -> Dict:
+        """Backfill every (season, week) pair not already checkpointed as completed"""
+
+        week_list = list(weeks)
+        tasks = [(season, week) for season in seasons for week in week_list]
+        completed = await self._load_completed() if resume else set()
+        pending = [task for task in tasks if task not in completed]
+
+        logger.info(
+            "Backfill: %s weeks requested, %s already completed, %s pending",
+            len(tasks),
+            len(tasks) - len(pending),
+            len(pending)
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        outstanding = Counter(season for season, _ in pending)
+        landed: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        failed: List[Dict] = []
+        games_written = 0
+
+        async def _bounded(season: int, week: int) -> None:
+            nonlocal games_written
+            async with semaphore:
+                await self.bucket.acquire()
+                ok, games = await self._run_week(season, week)
+
+            if ok:
+                landed[season].append((week, games))
+            else:
+                failed.append({"season": season, "week": week})
+
+            outstanding[season] -= 1
+            if outstanding[season] == 0:
+                # Checkpoint each season as soon as it is done, so an interrupted run keeps it
+                season_failed, season_games = await self._finish_season(season, landed.pop(season, []))
+                failed.extend(season_failed)
+                games_written += season_games
+
+        await asyncio.gather(*(_bounded(season, week) for season, week in pending))
+
+        return {
+            "requested": len(tasks),
+            "skipped": len(tasks) - len(pending),
+            "completed": len(pending) - len(failed),
+            "failed": failed,
+            "games_written": games_written,
+        }
+
+    async def _finish_season(self, season: int, landed: List[Tuple[int, int]]) -> Tuple[List[Dict], int]:
+        """Rebuild a season's stats, then checkpoint its landed weeks; returns (failed, games)"""
+        if not landed:
+            return [], 0
+
+        failed = []
+        games_written = 0
+        error = await self._rebuild_season_stats(season)
+        for week, games in sorted(landed):
+            if error:
+                await self._checkpoint(season, week, "failed", error=error)
+                failed.append({"season": season, "week": week})
+            else:
+                await self._checkpoint(season, week, "completed", games_written=games)
+                games_written += games
+        return failed, games_written
+
+    async def _run_week(self, season: int, week: int) -> Tuple[bool, int]:
+        await self._checkpoint(season, week, "running")
+        try:
+            result = await self.service.update_all(
+                season=season,
+                week=week,
+                include_weather=False,
+                include_odds=False,
+                historical=True
+            )
+            for feed in ("games", "team_stats"):
+                if feed in result.get("failed_feeds", []):
+                    raise RuntimeError(result[feed].get("error", f"{feed} feed failed"))
+
+            # Checkpointed as completed once the season's derived stats are rebuilt
+            games = result["games"].get("inserted", 0) + result["games"].get("updated", 0)
+            logger.info("  ✓ %s Week %s: %s games", season, week, games)
+            return True, games
+
+        except Exception as exc:
+            await self._checkpoint(season, week, "failed", error=str(exc))
+            logger.error("  ✗ %s Week %s failed: %s", season, week, exc)
+            return False, 0
+
+    async def _rebuild_season_stats(self, season: int) -> Optional[str]:
+        """Recompute a season's as-of team stats from its stored games; returns an error or None"""
+        try:
+            await self.service.fetch_team_stats(season, include_upstream=False)
+            return None
+        except Exception as exc:
+            logger.error("  ✗ %s team stats rebuild failed: %s", season, exc)
+            return f"team stats rebuild failed: {exc}"
+
+    async def _load_completed(self) -> Set[Tuple[int, int]]:
+        async with SessionLocal() as session:
+            result = await session.execute(
+                text("SELECT season, week FROM backfill_checkpoints WHERE status = 'completed'")
+            )
+            return {(row.season, row.week) for row in result}
+
+    async def _checkpoint(
+        self,
+        season: int,
+        week: int,
+        status: str,
+        *,
+        games_written: int = 0,
+        error: str = None
+    ) -> None:
+        async with SessionLocal() as session:
+            await session.execute(
+                text(
+                    """
+                    INSERT INTO backfill_checkpoints (
+                        season, week, status, attempts, games_written,
+                        last_error, started_at, completed_at, updated_at
+                    ) VALUES (
+                        :season, :week, :status, 1, :games_written,
+                        :error, NOW(),
+                        CASE WHEN :status = 'completed' THEN NOW() END,
+                        NOW()
+                    )
+                    ON CONFLICT (season, week)
+                    DO UPDATE SET
+                        status = EXCLUDED.status,
+                        attempts = backfill_checkpoints.attempts
+                            + CASE WHEN EXCLUDED.status = 'running' THEN 1 ELSE 0 END,
+                        games_written = EXCLUDED.games_written,
+                        last_error = EXCLUDED.last_error,
+                        started_at = CASE WHEN EXCLUDED.status = 'running'
+                            THEN NOW() ELSE backfill_checkpoints.started_at END,
+                        completed_at = EXCLUDED.completed_at,
+                        updated_at = NOW()
+                    """
+                ),
+                {
+                    "season": season,
+                    "week": week,
+                    "status": status,
+                    "games_written": games_written,
+                    "error": error,
+                },
+            )
+            await session.commit()
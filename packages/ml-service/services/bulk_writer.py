@@ -0,0 +1,350 @@
+import hashlib
+import json
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import text
+
+# Rows per statement. asyncpg binds each column as one array parameter, so this only
+# bounds statement memory - a full season of games fits in a single chunk.
+CHUNK_SIZE = 5000
+
+GAME_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("espn_game_id", "VARCHAR"),
+    ("season", "INTEGER"),
+    ("week", "INTEGER"),
+    ("game_type", "VARCHAR"),
+    ("home_team_id", "INTEGER"),
+    ("away_team_id", "INTEGER"),
+    ("home_team", "VARCHAR"),
+    ("away_team", "VARCHAR"),
+    ("home_score", "INTEGER"),
+    ("away_score", "INTEGER"),
+    ("game_date", "TIMESTAMP"),
+    ("venue", "VARCHAR"),
+    ("venue_name", "VARCHAR"),
+    ("status", "VARCHAR"),
+    ("spread", "DOUBLE PRECISION"),
+    ("over_under", "DOUBLE PRECISION"),
+    ("weather_conditions", "TEXT"),
+    ("attendance", "INTEGER"),
+    ("payload_hash", "VARCHAR"),
+)
+
+TEAM_STAT_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("team_id", "INTEGER"),
+    ("season", "INTEGER"),
+    ("week", "INTEGER"),
+    ("total_yards", "DOUBLE PRECISION"),
+    ("passing_yards", "DOUBLE PRECISION"),
+    ("rushing_yards", "DOUBLE PRECISION"),
+    ("turnovers", "DOUBLE PRECISION"),
+    ("sacks", "DOUBLE PRECISION"),
+    ("third_down_pct", "DOUBLE PRECISION"),
+    ("red_zone_pct", "DOUBLE PRECISION"),
+    ("time_of_possession", "DOUBLE PRECISION"),
+    ("payload_hash", "VARCHAR"),
+)
+
+INJURY_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("player_name", "VARCHAR"),
+    ("team_id", "INTEGER"),
+    ("position", "VARCHAR"),
+    ("injury_type", "VARCHAR"),
+    ("status", "VARCHAR"),
+    ("week", "INTEGER"),
+    ("season", "INTEGER"),
+)
+
+BETTING_LINE_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("game_id", "INTEGER"),
+    ("sportsbook", "VARCHAR"),
+    ("market", "VARCHAR"),
+    ("home_value", "DOUBLE PRECISION"),
+    ("away_value", "DOUBLE PRECISION"),
+)
+
+
+def _chunks(rows: List[Dict], size: int = CHUNK_SIZE) -> Iterable[List[Dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _unnest(columns: Sequence[Tuple[str, str]]) -> str:
+    """Build ``UNNEST(CAST(:col AS type[]), ...) AS u(col, ...)`` for the given columns"""
+    arrays = ", ".join(f"CAST(:{name} AS {pg_type}[])" for name, pg_type in columns)
+    names = ", ".join(name for name, _ in columns)
+    return f"UNNEST({arrays}) AS u({names})"
+
+
+def _column_arrays(rows: List[Dict], columns: Sequence[Tuple[str, str]]) -> Dict[str, List]:
+    return {name: [row.get(name) for row in rows] for name, _ in columns}
+
+
+def fingerprint(row: Dict, columns: Sequence[Tuple[str, str]]) -> str:
+    """SHA-256 over the row's column values in a canonical form.
+
+    Floats are rounded so representation noise from upstream does not register as a
+    change; the fingerprint column itself is excluded.
+    """
+    values = []
+    for name, _ in columns:
+        if name == "payload_hash":
+            continue
+        value = row.get(name)
+        if isinstance(value, float):
+            value = round(value, 6)
+        values.append(value)
+    canonical = json.dumps(values, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _with_fingerprints(rows: List[Dict], columns: Sequence[Tuple[str, str]]) -> List[Dict]:
+    return [{**row, "payload_hash": fingerprint(row, columns)} for row in rows]
+
+
+def _dedupe(rows: List[Dict], key: Tuple[str, ...]) -> List[Dict]:
+    """Keep the last row per conflict key.
+
+    Postgres rejects an ``ON CONFLICT DO UPDATE`` that touches the same row twice in
+    one statement, so duplicates in a payload must be collapsed before the write.
+    Rows with a NULL key never conflict and are passed through untouched.
+    """
+    keyed: Dict[Tuple, Dict] = {}
+    passthrough: List[Dict] = []
+    for row in rows:
+        values = tuple(row.get(column) for column in key)
+        if any(value is None for value in values):
+            passthrough.append(row)
+        else:
+            keyed[values] = row
+    return list(keyed.values()) + passthrough
+
+
+class BulkWriter:
+    """Set-based writers that persist a whole feed in one statement per table chunk"""
+
+    async def upsert_games(self, session, rows: List[Dict]) -> Tuple[int, int, int]:
+        """Upsert games keyed on ``espn_game_id``; returns ``(inserted, updated, unchanged)``.
+
+        Rows whose fingerprint matches the stored ``payload_hash`` are left untouched,
+        so ``updated_at`` only moves when the upstream data actually changed. A trigger
+        on ``games`` (migration 017) mirrors written rows into ``team_games``.
+        """
+        rows = _with_fingerprints(_dedupe(rows, ("espn_game_id",)), GAME_COLUMNS)
+        statement = text(
+            f"""
+            INSERT INTO games (
+                espn_game_id, season, week, game_type,
+                home_team_id, away_team_id,
+                home_team, away_team,
+                home_score, away_score,
+                game_date, venue, venue_name,
+                status, spread, over_under,
+                weather_conditions, attendance,
+                payload_hash, updated_at
+            )
+            SELECT
+                u.espn_game_id, u.season, u.week, u.game_type,
+                u.home_team_id, u.away_team_id,
+                u.home_team, u.away_team,
+                u.home_score, u.away_score,
+                u.game_date, u.venue, u.venue_name,
+                u.status, u.spread, u.over_under,
+                CAST(u.weather_conditions AS JSONB), u.attendance,
+                u.payload_hash, NOW()
+            FROM {_unnest(GAME_COLUMNS)}
+            ON CONFLICT (espn_game_id)
+            DO UPDATE SET
+                season = EXCLUDED.season,
+                week = EXCLUDED.week,
+                game_type = EXCLUDED.game_type,
+                home_team_id = COALESCE(EXCLUDED.home_team_id, games.home_team_id),
+                away_team_id = COALESCE(EXCLUDED.away_team_id, games.away_team_id),
+                home_team = EXCLUDED.home_team,
+                away_team = EXCLUDED.away_team,
+                home_score = EXCLUDED.home_score,
+                away_score = EXCLUDED.away_score,
+                game_date = EXCLUDED.game_date,
+                venue = EXCLUDED.venue,
+                venue_name = EXCLUDED.venue_name,
+                status = EXCLUDED.status,
+                spread = EXCLUDED.spread,
+                over_under = EXCLUDED.over_under,
+                weather_conditions = EXCLUDED.weather_conditions,
+                attendance = EXCLUDED.attendance,
+                payload_hash = EXCLUDED.payload_hash,
+                updated_at = NOW()
+            WHERE games.payload_hash IS DISTINCT FROM EXCLUDED.payload_hash
+            RETURNING (xmax = 0) AS inserted
+            """
+        )
+        return await self._execute_upsert(session, statement, rows, GAME_COLUMNS)
+
+    async def upsert_team_stats(self, session, rows: List[Dict]) -> Tuple[int, int, int]:
+        """Upsert upstream-only team_stats columns keyed on ``(team_id, season, week)``.
+
+        Record and points are derived locally by ``TeamStatsAggregator`` and are not
+        written here. Returns ``(inserted, updated, unchanged)``.
+        """
+        rows = _with_fingerprints(_dedupe(rows, ("team_id", "season", "week")), TEAM_STAT_COLUMNS)
+        statement = text(
+            f"""
+            INSERT INTO team_stats (
+                team_id, season, week,
+                total_yards, passing_yards, rushing_yards,
+                turnovers, sacks, third_down_pct, red_zone_pct,
+                time_of_possession, payload_hash, updated_at
+            )
+            SELECT
+                u.team_id, u.season, u.week,
+                u.total_yards, u.passing_yards, u.rushing_yards,
+                u.turnovers, u.sacks, u.third_down_pct, u.red_zone_pct,
+                u.time_of_possession, u.payload_hash, NOW()
+            FROM {_unnest(TEAM_STAT_COLUMNS)}
+            ON CONFLICT (team_id, season, week)
+            DO UPDATE SET
+                total_yards = EXCLUDED.total_yards,
+                passing_yards = EXCLUDED.passing_yards,
+                rushing_yards = EXCLUDED.rushing_yards,
+                turnovers = EXCLUDED.turnovers,
+                sacks = EXCLUDED.sacks,
+                third_down_pct = EXCLUDED.third_down_pct,
+                red_zone_pct = EXCLUDED.red_zone_pct,
+                time_of_possession = EXCLUDED.time_of_possession,
+                payload_hash = EXCLUDED.payload_hash,
+                updated_at = NOW()
+            WHERE team_stats.payload_hash IS DISTINCT FROM EXCLUDED.payload_hash
+            RETURNING (xmax = 0) AS inserted
+            """
+        )
+        return await self._execute_upsert(session, statement, rows, TEAM_STAT_COLUMNS)
+
+    async def merge_injuries(self, session, season: int, rows: List[Dict]) -> Dict:
+        """Make the season's injuries match ``rows`` keyed on ``(team_id, player_name, season)``.
+
+        New players are inserted, changed reports updated and players missing from the
+        feed deleted, all in one statement; identical rows are not touched. Returns the
+        counts and the ids of teams whose injury report changed.
+        """
+        rows = _dedupe(
+            [row for row in rows if row.get("player_name") and row.get("team_id")],
+            ("team_id", "player_name", "season"),
+        )
+        statement = text(
+            f"""
+            WITH incoming AS (
+                SELECT * FROM {_unnest(INJURY_COLUMNS)}
+            ),
+            upserted AS (
+                INSERT INTO injuries (
+                    player_name, team_id, position,
+                    injury_type, status, week, season
+                )
+                SELECT
+                    u.player_name, u.team_id, u.position,
+                    u.injury_type, u.status, u.week, u.season
+                FROM incoming u
+                ON CONFLICT (team_id, player_name, season)
+                DO UPDATE SET
+                    position = EXCLUDED.position,
+                    injury_type = EXCLUDED.injury_type,
+                    status = EXCLUDED.status,
+                    week = EXCLUDED.week,
+                    updated_at = NOW()
+                WHERE (injuries.position, injuries.injury_type, injuries.status, injuries.week)
+                    IS DISTINCT FROM
+                    (EXCLUDED.position, EXCLUDED.injury_type, EXCLUDED.status, EXCLUDED.week)
+                RETURNING team_id, CASE WHEN xmax = 0 THEN 'inserted' ELSE 'updated' END AS action
+            ),
+            removed AS (
+                DELETE FROM injuries i
+                WHERE i.season = :season
+                  AND NOT EXISTS (
+                      SELECT 1 FROM incoming u
+                      WHERE u.team_id = i.team_id AND u.player_name = i.player_name
+                  )
+                RETURNING i.team_id, 'removed' AS action
+            )
+            SELECT team_id, action FROM upserted
+            UNION ALL
+            SELECT team_id, action FROM removed
+            """
+        )
+        result = await session.execute(statement, {**_column_arrays(rows, INJURY_COLUMNS), "season": season})
+
+        counts = {"inserted": 0, "updated": 0, "removed": 0}
+        affected_teams = set()
+        for row in result:
+            counts[row.action] += 1
+            if row.team_id is not None:
+                affected_teams.add(row.team_id)
+
+        return {
+            **counts,
+            "unchanged": len(rows) - counts["inserted"] - counts["updated"],
+            "affected_teams": sorted(affected_teams),
+        }
+
+    async def record_line_changes(self, session, rows: List[Dict]) -> Tuple[int, List[int]]:
+        """Record betting lines as change-only events per ``(game_id, sportsbook, market)``.
+
+        ``betting_lines_latest`` holds the current line per key; only rows that differ
+        from it are updated there and appended to ``betting_line_events`` (partitioned
+        by the game's season), in the same statement. Returns the number of line
+        changes recorded and the ids of the games they belong to.
+        """
+        rows = _dedupe(rows, ("game_id", "sportsbook", "market"))
+        statement = text(
+            f"""
+            WITH changed AS (
+                INSERT INTO betting_lines_latest (
+                    game_id, sportsbook, market, home_value, away_value, updated_at
+                )
+                SELECT u.game_id, u.sportsbook, u.market, u.home_value, u.away_value, NOW()
+                FROM {_unnest(BETTING_LINE_COLUMNS)}
+                WHERE u.home_value IS NOT NULL OR u.away_value IS NOT NULL
+                ON CONFLICT (game_id, market, sportsbook)
+                DO UPDATE SET
+                    home_value = EXCLUDED.home_value,
+                    away_value = EXCLUDED.away_value,
+                    updated_at = NOW()
+                WHERE (betting_lines_latest.home_value, betting_lines_latest.away_value)
+                    IS DISTINCT FROM (EXCLUDED.home_value, EXCLUDED.away_value)
+                RETURNING game_id, sportsbook, market, home_value, away_value, updated_at
+            )
+            INSERT INTO betting_line_events (
+                season, game_id, sportsbook, market, home_value, away_value, recorded_at
+            )
+            SELECT g.season, c.game_id, c.sportsbook, c.market, c.home_value, c.away_value, c.updated_at
+            FROM changed c
+            JOIN games g ON g.id = c.game_id
+            RETURNING game_id
+            """
+        )
+        changes = 0
+        game_ids = set()
+        for chunk in _chunks(rows):
+            result = await session.execute(statement, _column_arrays(chunk, BETTING_LINE_COLUMNS))
+            for row in result:
+                changes += 1
+                game_ids.add(row.game_id)
+        return changes, sorted(game_ids)
+
+    async def _execute_upsert(
+        self,
+        session,
+        statement,
+        rows: List[Dict],
+        columns: Sequence[Tuple[str, str]]
+    ) -> Tuple[int, int, int]:
+        inserted = 0
+        updated = 0
+        for chunk in _chunks(rows):
+            result = await session.execute(statement, _column_arrays(chunk, columns))
+            for row in result:
+                if row.inserted:
+                    inserted += 1
+                else:
+                    updated += 1
+        # Conflicting rows skipped by the fingerprint guard are not returned
+        return inserted, updated, len(rows) - inserted - updated
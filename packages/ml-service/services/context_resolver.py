@@ -0,0 +1,175 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional, Tuple
+
+from sqlalchemy import text
+
+from utils.database import SessionLocal, get_redis
+from utils.logger import logger
+
+CONTEXT_CACHE_KEY = "ml:context:current"
+
+# NFL weeks run Thursday through Monday night; the scoreboard rolls to the next week
+# on Tuesday. Cache until then, but never longer than a day so season-type changes
+# (preseason -> regular -> playoffs) are picked up promptly.
+WEEK_ROLLOVER_WEEKDAY = 1  # Tuesday
+WEEK_ROLLOVER_HOUR_UTC = 12
+MAX_CONTEXT_TTL = 24 * 3600
+MIN_CONTEXT_TTL = 300
+
+ScoreboardContextFetcher = Callable[[], Awaitable[Tuple[Optional[int], Optional[int]]]]
+
+
+def seconds_until_week_rollover(now: Optional[datetime] = None) -> int:
+    """Seconds until the next NFL week rollover, clamped to the TTL bounds"""
+    now = now or datetime.now(timezone.utc)
+    rollover = now.replace(hour=WEEK_ROLLOVER_HOUR_UTC, minute=0, second=0, microsecond=0)
+    rollover += timedelta(days=(WEEK_ROLLOVER_WEEKDAY - now.weekday()) % 7)
+    if rollover <= now:
+        rollover += timedelta(days=7)
+    seconds = int((rollover - now).total_seconds())
+    return max(MIN_CONTEXT_TTL, min(seconds, MAX_CONTEXT_TTL))
+
+
+class SeasonContextResolver:
+    """Process-wide cache of the current (season, week).
+
+    Resolution order: in-process value, Redis, then one scoreboard fetch shared by
+    all concurrent callers. If ESPN fails or omits the week, the local games
+    schedule is used instead.
+    """
+
+    def __init__(self):
+        self._value: Optional[Tuple[int, int]] = None
+        self._expires_at = 0.0
+        self._inflight: Optional[asyncio.Future] = None
+
+    def invalidate(self) -> None:
+        self._value = None
+        self._expires_at = 0.0
+
+    async def resolve(self, fetch_scoreboard: ScoreboardContextFetcher) -> Tuple[int, int]:
+        if self._value and time.monotonic() < self._expires_at:
+            return self._value
+
+        cached, remaining = await self._read_redis()
+        if cached:
+            # Never keep it locally past the Redis expiry (short for schedule fallbacks)
+            self._remember(cached, min(remaining, seconds_until_week_rollover()))
+            return cached
+
+        while self._inflight is not None:
+            inflight = self._inflight
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the refresh we were waiting on was cancelled: take it over
+                if not inflight.cancelled():
+                    raise
+
+        future = self._inflight = asyncio.get_running_loop().create_future()
+        try:
+            context = await self._refresh(fetch_scoreboard)
+            future.set_result(context)
+            return context
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()
+            raise
+        except BaseException:
+            # Cancelled: release waiters so they retry instead of hanging
+            future.cancel()
+            raise
+        finally:
+            if self._inflight is future:
+                self._inflight = None
+
+    async def _refresh(self, fetch_scoreboard: ScoreboardContextFetcher) -> Tuple[int, int]:
+        season = week = None
+        try:
+            season, week = await fetch_scoreboard()
+        except Exception as exc:
+            logger.warning("Scoreboard context lookup failed, using local schedule: %s", exc)
+
+        if season and week:
+            context = (int(season), int(week))
+            ttl = seconds_until_week_rollover()
+        else:
+            context = await self._from_schedule()
+            # Re-check ESPN soon when we had to fall back
+            ttl = MIN_CONTEXT_TTL
+
+        self._remember(context, ttl)
+        await self._write_redis(context, ttl)
+        return context
+
+    async def _from_schedule(self) -> Tuple[int, int]:
+        """Derive the current week from the nearest game in the local schedule"""
+        try:
+            async with SessionLocal() as session:
+                result = await session.execute(
+                    text(
+                        """
+                        SELECT season, week FROM (
+                            (SELECT season, week, 0 AS rank, game_date
+                             FROM games
+                             WHERE game_date >= NOW() - INTERVAL '2 days'
+                             ORDER BY game_date ASC
+                             LIMIT 1)
+                            UNION ALL
+                            (SELECT season, week, 1 AS rank, game_date
+                             FROM games
+                             ORDER BY game_date DESC
+                             LIMIT 1)
+                        ) nearest
+                        ORDER BY rank
+                        LIMIT 1
+                        """
+                    )
+                )
+                row = result.first()
+                if row:
+                    return row.season, row.week
+        except Exception as exc:
+            logger.warning("Schedule context lookup failed: %s", exc)
+
+        return datetime.now().year, 1
+
+    def _remember(self, context: Tuple[int, int], ttl: int) -> None:
+        self._value = context
+        self._expires_at = time.monotonic() + ttl
+
+    async def _read_redis(self) -> Tuple[Optional[Tuple[int, int]], int]:
+        """Cached context and its remaining TTL in seconds, or (None, 0)"""
+        redis = get_redis()
+        if not redis:
+            return None, 0
+        try:
+            cached = await redis.get(CONTEXT_CACHE_KEY)
+            if cached:
+                payload = json.loads(cached)
+                ttl = await redis.ttl(CONTEXT_CACHE_KEY)
+                # -1: no expiry set; -2: expired since the read
+                remaining = MAX_CONTEXT_TTL if ttl == -1 else max(ttl, 0)
+                return (payload["season"], payload["week"]), remaining
+        except Exception as exc:
+            logger.debug("Context cache read failed: %s", exc)
+        return None, 0
+
+    async def _write_redis(self, context: Tuple[int, int], ttl: int) -> None:
+        redis = get_redis()
+        if not redis:
+            return
+        try:
+            await redis.setex(
+                CONTEXT_CACHE_KEY,
+                ttl,
+                json.dumps({"season": context[0], "week": context[1]})
+            )
+        except Exception as exc:
+            logger.debug("Context cache write failed: %s", exc)
+
+
+context_resolver = SeasonContextResolver()
@@ -1,26 +1,73 @@
+import asyncio
 import json
 import os
-from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
-from aiohttp import ClientResponseError, ClientTimeout
+from aiohttp import ClientTimeout
 from sqlalchemy import text
 
+from services.bulk_writer import BulkWriter
+from services.context_resolver import context_resolver
+from services.feed_orchestrator import FeedOrchestrator
+from services.game_matcher import GameMatchIndex
+from services.payload_archive import PayloadArchive
+from services.prediction_cache import invalidate_game_predictions, invalidate_team_predictions
+from services.team_stats_aggregator import TeamStatsAggregator
+from services.weather_cache import WeatherCache
 from utils.database import SessionLocal
+from utils.http_policy import upstream_policies
 from utils.logger import logger
 
 
+ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+ESPN_CORE_BASE_URL = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
+ODDS_API_BASE_URL = "https://api.the-odds-api.com/v4"
+WEATHER_API_BASE_URL = "https://api.openweathermap.org/data/2.5"
+
+# One date-range scoreboard request covers a full season (~285 games incl. preseason)
+SEASON_SCOREBOARD_LIMIT = 1000
+REGULAR_SEASON_WEEKS = 18
+
+
 class DataService:
     """Service for fetching and persisting external NFL data"""
 
-    def __init__(self):
-        self.espn_base_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
-        self.core_base_url = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
+    def __init__(
+        self,
+        *,
+        archive: Optional[PayloadArchive] = None,
+        replay: bool = False,
+        espn_base_url: Optional[str] = None,
+        core_base_url: Optional[str] = None,
+        odds_base_url: Optional[str] = None,
+        weather_base_url: Optional[str] = None
+    ):
+        # Base URLs are overridable so ingestion can run against a local stand-in upstream
+        self.espn_base_url = (espn_base_url or os.getenv("ESPN_BASE_URL", ESPN_BASE_URL)).rstrip("/")
+        self.core_base_url = (
+            core_base_url or os.getenv("ESPN_CORE_BASE_URL", ESPN_CORE_BASE_URL)
+        ).rstrip("/")
+        self.odds_base_url = (odds_base_url or os.getenv("ODDS_API_BASE_URL", ODDS_API_BASE_URL)).rstrip("/")
+        self.weather_base_url = (
+            weather_base_url or os.getenv("WEATHER_API_BASE_URL", WEATHER_API_BASE_URL)
+        ).rstrip("/")
         self.odds_api_key = os.getenv("ODDS_API_KEY")
         self.weather_api_key = os.getenv("WEATHER_API_KEY")
-        self.weather_cache: Dict[str, Dict] = {}
+        self.archive = archive or PayloadArchive.from_env()
+        self.replay = replay
+        if replay:
+            if not self.archive:
+                raise ValueError("Replay mode requires a payload archive (PAYLOAD_ARCHIVE_DIR)")
+            # Archived URLs are indexed with keys redacted, so any placeholder matches
+            self.odds_api_key = self.odds_api_key or "replay"
+            self.weather_api_key = self.weather_api_key or "replay"
+        self.weather_cache = WeatherCache(self._request_weather, shared=not replay)
         self.http_timeout = ClientTimeout(total=25)
+        self.bulk_writer = BulkWriter()
+        self.stats_aggregator = TeamStatsAggregator()
+        self.orchestrator = FeedOrchestrator()
 
     async def fetch_games(
         self,
@@ -53,139 +100,39 @@ class DataService:
 
         try:
             async with aiohttp.ClientSession(timeout=self.http_timeout) as http:
-                scoreboard = await self._fetch_json(http, scoreboard_url)
+                scoreboard = await self._fetch_json(
+                    http, scoreboard_url, feed="scoreboard", season=season_val, week=week_val
+                )
 
                 events = scoreboard.get("events", [])
                 if not events:
                     logger.warning("No events returned from ESPN scoreboard")
 
                 team_map = await self._load_team_map(session)
-                inserted = 0
-                updated = 0
-
-                for event in events:
-                    competition = (event.get("competitions") or [{}])[0]
-                    home_team = self._get_competitor(competition, "home")
-                    away_team = self._get_competitor(competition, "away")
-
-                    if not home_team or not away_team:
-                        logger.warning("Skipping event without home/away team: %s", event.get("id"))
-                        continue
-
-                    game_date = self._parse_game_date(event.get("date"))
-                    venue = competition.get("venue", {}) or {}
-                    venue_name = venue.get("fullName")
-                    venue_city = (venue.get("address") or {}).get("city")
-                    venue_state = (venue.get("address") or {}).get("state")
-
-                    weather_data = None
-                    if include_weather and self.weather_api_key and venue_city:
-                        weather_data = await self._fetch_weather(venue_city, venue_state)
-
-                    odds = (competition.get("odds") or [])
-                    spread = None
-                    over_under = None
-                    if odds:
-                        spread = odds[0].get("details")
-                        over_under = odds[0].get("overUnder")
-
-                    home_abbr = (home_team.get("team") or {}).get("abbreviation")
-                    away_abbr = (away_team.get("team") or {}).get("abbreviation")
-                    home_team_id = team_map.get(home_abbr.upper()) if home_abbr else None
-                    away_team_id = team_map.get(away_abbr.upper()) if away_abbr else None
-
-                    if not home_team_id or not away_team_id:
-                        logger.warning(
-                            "Team mapping missing for %s vs %s - ensure teams table is populated",
-                            home_abbr,
-                            away_abbr
-                        )
+                rows = []
 
-                    params = {
-                        "espn_game_id": event.get("id"),
-                        "season": season_val,
-                        "week": week_val,
-                        "game_type": self._map_season_type(scoreboard.get("season", {}).get("type")),
-                        "home_team_id": home_team_id,
-                        "away_team_id": away_team_id,
-                        "home_team": (home_team.get("team") or {}).get("displayName"),
-                        "away_team": (away_team.get("team") or {}).get("displayName"),
-                        "home_score": self._safe_int(home_team.get("score")),
-                        "away_score": self._safe_int(away_team.get("score")),
-                        "game_date": game_date,
-                        "venue": venue_city,
-                        "venue_name": venue_name,
-                        "status": self._map_game_status((event.get("status") or {}).get("type", {}).get("name")),
-                        "spread": self._parse_spread(spread),
-                        "over_under": self._safe_float(over_under),
-                        "weather_conditions": weather_data,
-                        "attendance": competition.get("attendance"),
-                    }
-
-                    result = await session.execute(
-                        text(
-                            """
-                            INSERT INTO games (
-                                espn_game_id, season, week, game_type,
-                                home_team_id, away_team_id,
-                                home_team, away_team,
-                                home_score, away_score,
-                                game_date, venue, venue_name,
-                                status, spread, over_under,
-                                weather_conditions, attendance,
-                                updated_at
-                            ) VALUES (
-                                :espn_game_id, :season, :week, :game_type,
-                                :home_team_id, :away_team_id,
-                                :home_team, :away_team,
-                                :home_score, :away_score,
-                                :game_date, :venue, :venue_name,
-                                :status, :spread, :over_under,
-                                CAST(:weather_conditions AS JSONB), :attendance,
-                                NOW()
-                            )
-                            ON CONFLICT (espn_game_id)
-                            DO UPDATE SET
-                                season = EXCLUDED.season,
-                                week = EXCLUDED.week,
-                                game_type = EXCLUDED.game_type,
-                                home_team_id = COALESCE(EXCLUDED.home_team_id, games.home_team_id),
-                                away_team_id = COALESCE(EXCLUDED.away_team_id, games.away_team_id),
-                                home_team = EXCLUDED.home_team,
-                                away_team = EXCLUDED.away_team,
-                                home_score = EXCLUDED.home_score,
-                                away_score = EXCLUDED.away_score,
-                                game_date = EXCLUDED.game_date,
-                                venue = EXCLUDED.venue,
-                                venue_name = EXCLUDED.venue_name,
-                                status = EXCLUDED.status,
-                                spread = EXCLUDED.spread,
-                                over_under = EXCLUDED.over_under,
-                                weather_conditions = EXCLUDED.weather_conditions,
-                                attendance = EXCLUDED.attendance,
-                                updated_at = NOW()
-                            RETURNING (xmax = 0) AS inserted
-                            """
-                        ),
-                        {
-                            **params,
-                            "weather_conditions": json.dumps(params["weather_conditions"]) if params["weather_conditions"] else None,
-                        }
+                weather_by_venue = {}
+                if include_weather and self.weather_api_key:
+                    weather_by_venue = await self.weather_cache.prefetch(
+                        venue for venue in map(self._get_venue_location, events) if venue[0]
                     )
 
-                    row = result.first()
-                    if row and row.inserted:
-                        inserted += 1
-                    else:
-                        updated += 1
+                game_type = self._map_season_type(scoreboard.get("season", {}).get("type"))
+                for event in events:
+                    row = self._build_game_row(event, season_val, week_val, game_type, team_map, weather_by_venue)
+                    if row:
+                        rows.append(row)
+
+                inserted, updated, unchanged = await self.bulk_writer.upsert_games(session, rows)
 
                 await session.commit()
 
                 logger.info(
-                    "Games persisted - fetched: %s, new: %s, updated: %s",
+                    "Games persisted - fetched: %s, new: %s, updated: %s, unchanged: %s",
                     len(events),
                     inserted,
-                    updated
+                    updated,
+                    unchanged
                 )
 
                 return {
@@ -194,30 +141,157 @@ class DataService:
                     "fetched": len(events),
                     "inserted": inserted,
                     "updated": updated,
+                    "unchanged": unchanged,
                 }
 
         except Exception as exc:
             logger.error(f"Error fetching games: {exc}")
             raise
 
+    async def fetch_season_games(
+        self,
+        season: int,
+        *,
+        include_postseason: bool = False,
+        include_weather: bool = False,
+        session=None
+    ) -> Dict:
+        """Fetch a whole season's schedule in one date-range request and upsert it in one transaction.
+
+        Weeks come from each event (or the league calendar when an event omits it).
+        Postseason weeks are stored after the regular season (week 19 onwards).
+        ``fetch_games`` remains the per-week path for live refreshes.
+        """
+
+        if session is None:
+            async with SessionLocal() as db_session:
+                return await self.fetch_season_games(
+                    season,
+                    include_postseason=include_postseason,
+                    include_weather=include_weather,
+                    session=db_session
+                )
+
+        logger.info(f"Fetching full schedule for season {season}")
+
+        # NFL seasons run from preseason in August to the Super Bowl in February
+        scoreboard_url = (
+            f"{self.espn_base_url}/scoreboard"
+            f"?dates={season}0801-{season + 1}0228&limit={SEASON_SCOREBOARD_LIMIT}"
+        )
+
+        async with aiohttp.ClientSession(timeout=self.http_timeout) as http:
+            scoreboard = await self._fetch_json(http, scoreboard_url, feed="scoreboard", season=season)
+
+        events = scoreboard.get("events", [])
+        if len(events) >= SEASON_SCOREBOARD_LIMIT:
+            logger.warning("Season scoreboard hit the %s event limit; schedule may be incomplete", len(events))
+
+        calendar = ((scoreboard.get("leagues") or [{}])[0]).get("calendar") or []
+        season_types = {2, 3} if include_postseason else {2}
+
+        team_map = await self._load_team_map(session)
+        weather_by_venue = {}
+        if include_weather and self.weather_api_key:
+            weather_by_venue = await self.weather_cache.prefetch(
+                venue for venue in map(self._get_venue_location, events) if venue[0]
+            )
+
+        rows = []
+        games_per_week: Dict[int, int] = {}
+        skipped = 0
+        for event in events:
+            season_type = self._safe_int((event.get("season") or {}).get("type"))
+            if season_type not in season_types:
+                continue
+
+            week = self._safe_int((event.get("week") or {}).get("number"))
+            if week is None:
+                week = self._week_from_calendar(calendar, season_type, self._parse_game_date(event.get("date")))
+            if week is None:
+                logger.warning("Skipping event %s without a resolvable week", event.get("id"))
+                skipped += 1
+                continue
+            if season_type == 3:
+                week += REGULAR_SEASON_WEEKS
+
+            row = self._build_game_row(
+                event, season, week, self._map_season_type(season_type), team_map, weather_by_venue
+            )
+            if row:
+                rows.append(row)
+                games_per_week[week] = games_per_week.get(week, 0) + 1
+
+        inserted, updated, unchanged = await self.bulk_writer.upsert_games(session, rows)
+
+        await session.commit()
+
+        logger.info(
+            "Season %s schedule persisted - games: %s, weeks: %s, new: %s, updated: %s, unchanged: %s",
+            season,
+            len(rows),
+            len(games_per_week),
+            inserted,
+            updated,
+            unchanged
+        )
+
+        return {
+            "season": season,
+            "fetched": len(events),
+            "games": len(rows),
+            "skipped": skipped,
+            "weeks": dict(sorted(games_per_week.items())),
+            "inserted": inserted,
+            "updated": updated,
+            "unchanged": unchanged,
+        }
+
     async def fetch_team_stats(
         self,
         season: Optional[int] = None,
         week: Optional[int] = None,
         *,
+        include_upstream: bool = True,
         session=None
     ) -> Dict:
-        """Fetch team statistics and upsert into database"""
+        """Derive team records from stored games, then fetch the stats only ESPN has.
+
+        Record, points, streak and home/away splits come from the games table as of
+        each week's kickoff. ESPN is only asked for yardage, turnover and efficiency
+        stats, and is skipped entirely with ``include_upstream=False``.
+        """
 
         if session is None:
             async with SessionLocal() as db_session:
-                return await self.fetch_team_stats(season, week, session=db_session)
+                return await self.fetch_team_stats(
+                    season,
+                    week,
+                    include_upstream=include_upstream,
+                    session=db_session
+                )
 
         season_val = season or (await self._get_current_context())[0]
         logger.info(f"Fetching team stats for season {season_val}, week {week}")
 
+        derived = await self.stats_aggregator.rebuild(session, season_val, week)
+
+        if not include_upstream:
+            await session.commit()
+            return {
+                "season": season_val,
+                "week": week,
+                "processed": 0,
+                "inserted": 0,
+                "updated": 0,
+                "unchanged": 0,
+                "derived": derived,
+            }
+
         async with aiohttp.ClientSession(timeout=self.http_timeout) as http:
-            teams_data = await self._fetch_json(http, f"{self.espn_base_url}/teams")
+            teams_data = await self._fetch_json(
+                http, f"{self.espn_base_url}/teams", feed="teams", season=season_val, week=week
+            )
             teams = (((teams_data.get("sports") or []) or [{}])[0].get("leagues") or [])
             if teams:
                 teams = (teams[0].get("teams") or [])
@@ -225,8 +299,7 @@ class DataService:
                 teams = []
 
             team_map = await self._load_team_map(session)
-            inserted = 0
-            updated = 0
+            rows = []
 
             for entry in teams:
                 team_info = entry.get("team") or {}
@@ -236,7 +309,6 @@ class DataService:
                 if not db_team_id:
                     continue
 
-                record_summary = self._parse_record(team_info.get("record"))
                 stats_endpoint = None
                 for link in team_info.get("links", []):
                     if link.get("rel") and "statistics" in link.get("rel"):
@@ -251,20 +323,17 @@ class DataService:
                         stats_url = f"{stats_url}&week={week}&type=2"
 
                     try:
-                        stats_payload = await self._fetch_json(http, stats_url)
+                        stats_payload = await self._fetch_json(
+                            http, stats_url, feed="team_statistics", season=season_val, week=week
+                        )
                         totals = self._extract_team_totals(stats_payload)
                     except Exception as stats_error:
                         logger.debug("Unable to fetch stats for %s: %s", abbreviation, stats_error)
 
-                params = {
+                rows.append({
                     "team_id": db_team_id,
                     "season": season_val,
                     "week": week,
-                    "wins": record_summary.get("wins"),
-                    "losses": record_summary.get("losses"),
-                    "ties": record_summary.get("ties"),
-                    "points_for": totals.get("pointsFor"),
-                    "points_against": totals.get("pointsAgainst"),
                     "total_yards": totals.get("yardsPerGame"),
                     "passing_yards": totals.get("passingYardsPerGame"),
                     "rushing_yards": totals.get("rushingYardsPerGame"),
@@ -273,59 +342,18 @@ class DataService:
                     "third_down_pct": totals.get("thirdDownPct"),
                     "red_zone_pct": totals.get("redZonePct"),
                     "time_of_possession": totals.get("timeOfPossession"),
-                }
-
-                result = await session.execute(
-                    text(
-                        """
-                        INSERT INTO team_stats (
-                            team_id, season, week, wins, losses, ties,
-                            points_for, points_against,
-                            total_yards, passing_yards, rushing_yards,
-                            turnovers, sacks, third_down_pct, red_zone_pct,
-                            time_of_possession, updated_at
-                        ) VALUES (
-                            :team_id, :season, :week, :wins, :losses, :ties,
-                            :points_for, :points_against,
-                            :total_yards, :passing_yards, :rushing_yards,
-                            :turnovers, :sacks, :third_down_pct, :red_zone_pct,
-                            :time_of_possession, NOW()
-                        )
-                        ON CONFLICT (team_id, season, week)
-                        DO UPDATE SET
-                            wins = EXCLUDED.wins,
-                            losses = EXCLUDED.losses,
-                            ties = EXCLUDED.ties,
-                            points_for = EXCLUDED.points_for,
-                            points_against = EXCLUDED.points_against,
-                            total_yards = EXCLUDED.total_yards,
-                            passing_yards = EXCLUDED.passing_yards,
-                            rushing_yards = EXCLUDED.rushing_yards,
-                            turnovers = EXCLUDED.turnovers,
-                            sacks = EXCLUDED.sacks,
-                            third_down_pct = EXCLUDED.third_down_pct,
-                            red_zone_pct = EXCLUDED.red_zone_pct,
-                            time_of_possession = EXCLUDED.time_of_possession,
-                            updated_at = NOW()
-                        RETURNING (xmax = 0) AS inserted
-                        """
-                    ),
-                    params,
-                )
+                })
 
-                row = result.first()
-                if row and row.inserted:
-                    inserted += 1
-                else:
-                    updated += 1
+            inserted, updated, unchanged = await self.bulk_writer.upsert_team_stats(session, rows)
 
             await session.commit()
 
             logger.info(
-                "Team stats persisted - processed: %s, new: %s, updated: %s",
+                "Team stats persisted - processed: %s, new: %s, updated: %s, unchanged: %s",
                 inserted + updated,
                 inserted,
-                updated
+                updated,
+                unchanged
             )
 
             return {
@@ -334,6 +362,8 @@ class DataService:
                 "processed": inserted + updated,
                 "inserted": inserted,
                 "updated": updated,
+                "unchanged": unchanged,
+                "derived": derived,
             }
 
     async def fetch_injuries(self, season: Optional[int] = None, *, session=None) -> Dict:
@@ -347,12 +377,13 @@ class DataService:
         logger.info("Fetching NFL injury reports")
 
         async with aiohttp.ClientSession(timeout=self.http_timeout) as http:
-            injuries_payload = await self._fetch_json(http, f"{self.espn_base_url}/injuries")
+            injuries_payload = await self._fetch_json(
+                http, f"{self.espn_base_url}/injuries", feed="injuries", season=season_val
+            )
             teams = injuries_payload.get("injuries") or injuries_payload.get("teams") or []
 
             team_map = await self._load_team_map(session)
-            processed = 0
-            await session.execute(text("DELETE FROM injuries WHERE season = :season"), {"season": season_val})
+            rows = []
 
             for team_entry in teams:
                 team_info = team_entry.get("team") or {}
@@ -363,39 +394,37 @@ class DataService:
 
                 for injury in team_entry.get("injuries", []):
                     athlete = injury.get("athlete") or {}
-                    params = {
+                    rows.append({
                         "player_name": athlete.get("displayName"),
                         "team_id": team_id,
                         "position": athlete.get("position", {}).get("abbreviation"),
                         "injury_type": (injury.get("details") or {}).get("detail") or injury.get("type"),
                         "status": (injury.get("status") or {}).get("type"),
-                        "week": injury.get("week"),
+                        "week": self._safe_int(injury.get("week")),
                         "season": season_val,
-                    }
+                    })
 
-                    await session.execute(
-                        text(
-                            """
-                            INSERT INTO injuries (
-                                player_name, team_id, position,
-                                injury_type, status, week, season
-                            ) VALUES (
-                                :player_name, :team_id, :position,
-                                :injury_type, :status, :week, :season
-                            )
-                            """
-                        ),
-                        params,
-                    )
-                    processed += 1
+            merge = await self.bulk_writer.merge_injuries(session, season_val, rows)
 
             await session.commit()
 
-            logger.info("Injury reports refreshed: %s records", processed)
+            # Only predictions for teams whose injury report changed are stale
+            invalidated = await invalidate_team_predictions(session, merge["affected_teams"])
+
+            logger.info(
+                "Injury reports merged - new: %s, updated: %s, removed: %s, unchanged: %s, teams affected: %s",
+                merge["inserted"],
+                merge["updated"],
+                merge["removed"],
+                merge["unchanged"],
+                len(merge["affected_teams"])
+            )
 
             return {
                 "season": season_val,
-                "processed": processed,
+                "processed": merge["inserted"] + merge["updated"] + merge["removed"],
+                **merge,
+                "invalidated_games": invalidated,
             }
 
     async def fetch_betting_odds(
@@ -420,44 +449,39 @@ class DataService:
             season_val, week_val = await self._get_current_context()
 
         odds_url = (
-            "https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds/"
+            f"{self.odds_base_url}/sports/americanfootball_nfl/odds/"
             f"?regions=us&markets=spreads,totals,h2h&oddsFormat=american&dateFormat=iso&apiKey={self.odds_api_key}"
         )
 
         async with aiohttp.ClientSession(timeout=self.http_timeout) as http:
-            odds_payload = await self._fetch_json(http, odds_url)
+            odds_payload = await self._fetch_json(
+                http, odds_url, feed="odds", season=season_val, week=week_val
+            )
             if not isinstance(odds_payload, list):
                 logger.warning("Unexpected odds payload received")
                 return {"processed": 0, "message": "invalid_payload"}
 
-            processed = 0
-
+            events = []
             for event in odds_payload:
-                home_team_name = event.get("home_team")
-                away_team_name = event.get("away_team")
                 commence_time = self._parse_game_date(event.get("commence_time"))
+                if event.get("home_team") and event.get("away_team") and commence_time:
+                    events.append((event, commence_time))
 
-                if not (home_team_name and away_team_name and commence_time):
-                    continue
-
-                game_row = await session.execute(
-                    text(
-                        """
-                        SELECT id FROM games
-                        WHERE LOWER(home_team) = LOWER(:home_team)
-                          AND LOWER(away_team) = LOWER(:away_team)
-                          AND ABS(EXTRACT(EPOCH FROM (game_date - :game_date))) < 86400
-                        LIMIT 1
-                        """
-                    ),
-                    {
-                        "home_team": home_team_name,
-                        "away_team": away_team_name,
-                        "game_date": commence_time,
-                    },
-                )
-                game = game_row.first()
-                if not game:
+            match_index = await self._load_game_match_index(
+                session, [commence_time for _, commence_time in events]
+            )
+            rows = []
+            unmatched = []
+
+            for event, commence_time in events:
+                game_id = match_index.match(event["home_team"], event["away_team"], commence_time)
+                if not game_id:
+                    unmatched.append({
+                        "event_id": event.get("id"),
+                        "home_team": event["home_team"],
+                        "away_team": event["away_team"],
+                        "commence_time": commence_time.isoformat(),
+                    })
                     continue
 
                 spreads = self._extract_market(event, "spreads")
@@ -472,38 +496,42 @@ class DataService:
                         "moneyline": moneyline.get(book_key) if moneyline else None,
                     }
 
-                    await session.execute(
-                        text(
-                            """
-                            INSERT INTO betting_lines (
-                                game_id, sportsbook, home_spread, away_spread,
-                                over_under, home_moneyline, away_moneyline, timestamp
-                            ) VALUES (
-                                :game_id, :sportsbook, :home_spread, :away_spread,
-                                :over_under, :home_moneyline, :away_moneyline, NOW()
-                            )
-                            """
-                        ),
-                        {
-                            "game_id": game.id,
+                    for market, home, away in (
+                        ("spread", (lines["spread"] or {}).get("home"), (lines["spread"] or {}).get("away")),
+                        ("total", (lines["total"] or {}).get("line"), None),
+                        ("moneyline", (lines["moneyline"] or {}).get("home"), (lines["moneyline"] or {}).get("away")),
+                    ):
+                        rows.append({
+                            "game_id": game_id,
                             "sportsbook": book_key,
-                            "home_spread": self._safe_float((lines["spread"] or {}).get("home")),
-                            "away_spread": self._safe_float((lines["spread"] or {}).get("away")),
-                            "over_under": self._safe_float((lines["total"] or {}).get("line")),
-                            "home_moneyline": self._safe_int((lines["moneyline"] or {}).get("home")),
-                            "away_moneyline": self._safe_int((lines["moneyline"] or {}).get("away")),
-                        },
-                    )
-                    processed += 1
+                            "market": market,
+                            "home_value": self._safe_float(home),
+                            "away_value": self._safe_float(away),
+                        })
+
+            changes, changed_games = await self.bulk_writer.record_line_changes(session, rows)
 
             await session.commit()
 
-            logger.info("Betting odds persisted: %s rows", processed)
+            # Cached predictions carry the consensus market lines, so games whose lines moved are stale
+            invalidated = await invalidate_game_predictions(session, changed_games)
+
+            logger.info("Betting lines polled: %s, changed: %s", len(rows), changes)
+            if unmatched:
+                logger.warning(
+                    "Odds events without a matching game: %s of %s",
+                    len(unmatched),
+                    len(events)
+                )
 
             return {
                 "season": season_val,
                 "week": week_val,
-                "processed": processed,
+                "processed": changes,
+                "unchanged": len(rows) - changes,
+                "matched_events": len(events) - len(unmatched),
+                "unmatched": unmatched,
+                "invalidated_games": invalidated,
             }
 
     async def update_all(
@@ -512,79 +540,93 @@ class DataService:
         week: Optional[int] = None,
         *,
         include_weather: bool = True,
-        include_odds: bool = True
+        include_odds: bool = True,
+        historical: bool = False
     ) -> Dict:
-        """Update all configured data feeds"""
-
-        async with SessionLocal() as session:
-            season_val, week_val = season, week
-            if season_val is None or week_val is None:
-                season_val, week_val = await self._get_current_context()
-
-            games_result = await self.fetch_games(
-                season_val,
-                week_val,
-                include_weather=include_weather,
-                session=session
-            )
+        """Update all configured data feeds concurrently, one DB session per feed.
 
-            stats_result = await self.fetch_team_stats(
-                season_val,
-                week_val,
-                session=session
-            )
+        ``historical`` skips the live-only feeds (current injury reports and odds),
+        which carry no information about past weeks.
+        """
 
-            injuries_result = await self.fetch_injuries(
-                season_val,
-                session=session
-            )
+        season_val, week_val = season, week
+        if season_val is None or week_val is None:
+            season_val, week_val = await self._get_current_context()
 
-            odds_result = {"processed": 0}
+        feeds = {
+            "games": lambda: self.fetch_games(season_val, week_val, include_weather=include_weather),
+            "team_stats": lambda: self.fetch_team_stats(season_val, week_val),
+        }
+        if not historical:
+            feeds["injuries"] = lambda: self.fetch_injuries(season_val)
             if include_odds:
-                odds_result = await self.fetch_betting_odds(
-                    season_val,
-                    week_val,
-                    session=session
-                )
+                feeds["odds"] = lambda: self.fetch_betting_odds(season_val, week_val)
 
-            logger.info(
-                "Data update complete for season %s week %s",
-                season_val,
-                week_val
-            )
+        # Odds are matched against stored games and team stats are derived from them,
+        # so both wait for the games feed to commit
+        results, timings, failed = await self.orchestrator.run(
+            feeds, depends_on={"odds": "games", "team_stats": "games"}
+        )
 
-            return {
-                "season": season_val,
-                "week": week_val,
-                "games": games_result,
-                "team_stats": stats_result,
-                "injuries": injuries_result,
-                "odds": odds_result,
-            }
+        logger.info(
+            "Data update complete for season %s week %s",
+            season_val,
+            week_val
+        )
 
-    async def _fetch_json(self, http: aiohttp.ClientSession, url: str) -> Dict:
-        """Helper to fetch JSON with error handling"""
+        return {
+            "season": season_val,
+            "week": week_val,
+            "games": results["games"],
+            "team_stats": results["team_stats"],
+            "injuries": results.get("injuries", {"processed": 0}),
+            "odds": results.get("odds", {"processed": 0}),
+            "timings": timings,
+            "failed_feeds": failed,
+        }
 
-        try:
-            async with http.get(url) as response:
-                response.raise_for_status()
-                return await response.json()
-        except ClientResponseError as error:
-            logger.error("HTTP %s when fetching %s", error.status, url)
-            raise
+    async def _fetch_json(
+        self,
+        http: aiohttp.ClientSession,
+        url: str,
+        *,
+        feed: str = "other",
+        season: Optional[int] = None,
+        week: Optional[int] = None
+    ) -> Dict:
+        """Fetch JSON under the shared per-host policy, archiving the raw payload.
+
+        In replay mode the latest archived payload for the URL is returned instead
+        and no network request is made.
+        """
+
+        if self.replay:
+            return await asyncio.to_thread(self.archive.latest_for_url, url)
+
+        payload = await upstream_policies.get_json(http, url)
+
+        if self.archive:
+            try:
+                await asyncio.to_thread(
+                    self.archive.store, payload, url=url, feed=feed, season=season, week=week
+                )
+            except Exception as archive_error:
+                logger.warning("Failed to archive %s payload: %s", feed, archive_error)
+
+        return payload
 
     async def _get_current_context(self) -> Tuple[int, int]:
+        """Current season/week from the shared, calendar-aware context cache"""
+
+        return await context_resolver.resolve(self._fetch_scoreboard_context)
+
+    async def _fetch_scoreboard_context(self) -> Tuple[Optional[int], Optional[int]]:
         """Lookup current season/week from ESPN scoreboard"""
 
         async with aiohttp.ClientSession(timeout=self.http_timeout) as http:
-            payload = await self._fetch_json(http, f"{self.espn_base_url}/scoreboard")
+            payload = await self._fetch_json(http, f"{self.espn_base_url}/scoreboard", feed="context")
             season = (payload.get("season") or {}).get("year")
             week = (payload.get("week") or {}).get("number")
-
-            if not season or not week:
-                now = datetime.now()
-                return now.year, 1
-
             return season, week
 
     async def _load_team_map(self, session) -> Dict[str, int]:
@@ -593,6 +635,119 @@ class DataService:
         result = await session.execute(text("SELECT id, abbreviation FROM teams"))
         return {row.abbreviation.upper(): row.id for row in result}
 
+    async def _load_game_match_index(self, session, commence_times: List[datetime]) -> GameMatchIndex:
+        """Load every game around the odds window once and index it for in-memory matching"""
+
+        if not commence_times:
+            return GameMatchIndex([])
+
+        result = await session.execute(
+            text(
+                """
+                SELECT id, home_team, away_team, game_date
+                FROM games
+                WHERE game_date BETWEEN :window_start AND :window_end
+                """
+            ),
+            {
+                "window_start": min(commence_times) - timedelta(days=1),
+                "window_end": max(commence_times) + timedelta(days=1),
+            },
+        )
+        return GameMatchIndex(result.mappings().all())
+
+    def _build_game_row(
+        self,
+        event: Dict,
+        season: int,
+        week: int,
+        game_type: str,
+        team_map: Dict[str, int],
+        weather_by_venue: Dict
+    ) -> Optional[Dict]:
+        """Map one ESPN scoreboard event to a games row; None if it has no home/away team"""
+
+        competition = (event.get("competitions") or [{}])[0]
+        home_team = self._get_competitor(competition, "home")
+        away_team = self._get_competitor(competition, "away")
+
+        if not home_team or not away_team:
+            logger.warning("Skipping event without home/away team: %s", event.get("id"))
+            return None
+
+        game_date = self._parse_game_date(event.get("date"))
+        venue = competition.get("venue", {}) or {}
+        venue_name = venue.get("fullName")
+        venue_city = (venue.get("address") or {}).get("city")
+        venue_state = (venue.get("address") or {}).get("state")
+
+        weather_data = weather_by_venue.get((venue_city, venue_state))
+
+        odds = (competition.get("odds") or [])
+        spread = None
+        over_under = None
+        if odds:
+            spread = odds[0].get("details")
+            over_under = odds[0].get("overUnder")
+
+        home_abbr = (home_team.get("team") or {}).get("abbreviation")
+        away_abbr = (away_team.get("team") or {}).get("abbreviation")
+        home_team_id = team_map.get(home_abbr.upper()) if home_abbr else None
+        away_team_id = team_map.get(away_abbr.upper()) if away_abbr else None
+
+        if not home_team_id or not away_team_id:
+            logger.warning(
+                "Team mapping missing for %s vs %s - ensure teams table is populated",
+                home_abbr,
+                away_abbr
+            )
+
+        return {
+            "espn_game_id": event.get("id"),
+            "season": season,
+            "week": week,
+            "game_type": game_type,
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "home_team": (home_team.get("team") or {}).get("displayName"),
+            "away_team": (away_team.get("team") or {}).get("displayName"),
+            "home_score": self._safe_int(home_team.get("score")),
+            "away_score": self._safe_int(away_team.get("score")),
+            "game_date": game_date,
+            "venue": venue_city,
+            "venue_name": venue_name,
+            "status": self._map_game_status((event.get("status") or {}).get("type", {}).get("name")),
+            "spread": self._parse_spread(spread),
+            "over_under": self._safe_float(over_under),
+            "weather_conditions": json.dumps(weather_data) if weather_data else None,
+            "attendance": self._safe_int(competition.get("attendance")),
+        }
+
+    def _week_from_calendar(
+        self,
+        calendar: List[Dict],
+        season_type: Optional[int],
+        game_date: Optional[datetime]
+    ) -> Optional[int]:
+        """Week number for a kickoff from the scoreboard's league calendar"""
+
+        if not game_date:
+            return None
+        for section in calendar:
+            if self._safe_int(section.get("value")) != season_type:
+                continue
+            for entry in section.get("entries", []):
+                start = self._parse_game_date(entry.get("startDate"))
+                end = self._parse_game_date(entry.get("endDate"))
+                if start and end and start <= game_date <= end:
+                    return self._safe_int(entry.get("value"))
+        return None
+
+    def _get_venue_location(self, event: Dict) -> Tuple[Optional[str], Optional[str]]:
+        competition = (event.get("competitions") or [{}])[0]
+        address = (competition.get("venue") or {}).get("address") or {}
+        return address.get("city"), address.get("state")
+
     def _get_competitor(self, competition: Dict, home_away: str) -> Optional[Dict]:
         for competitor in competition.get("competitors", []):
             if competitor.get("homeAway") == home_away:
@@ -644,45 +799,6 @@ class DataService:
 
         return status_mapping.get(status_lower, "scheduled")
 
-    def _parse_record(self, record_payload: Optional[Dict]) -> Dict[str, Optional[int]]:
-        summary = {
-            "wins": None,
-            "losses": None,
-            "ties": None,
-        }
-        if not record_payload:
-            return summary
-
-        items = record_payload.get("items", [])
-        overall = None
-        for item in items:
-            if item.get("type") in ("total", "overall"):
-                overall = item
-                break
-        if not overall and items:
-            overall = items[0]
-
-        if overall:
-            stats = overall.get("stats", [])
-            for stat in stats:
-                name = stat.get("name")
-                if name == "wins":
-                    summary["wins"] = self._safe_int(stat.get("value"))
-                elif name == "losses":
-                    summary["losses"] = self._safe_int(stat.get("value"))
-                elif name == "ties":
-                    summary["ties"] = self._safe_int(stat.get("value"))
-
-            if summary["wins"] is None and overall.get("summary"):
-                parts = overall["summary"].split("-")
-                if len(parts) >= 2:
-                    summary["wins"] = self._safe_int(parts[0])
-                    summary["losses"] = self._safe_int(parts[1])
-                if len(parts) == 3:
-                    summary["ties"] = self._safe_int(parts[2])
-
-        return summary
-
     def _extract_team_totals(self, payload: Dict) -> Dict[str, Optional[float]]:
         totals = {}
         if not payload:
@@ -699,42 +815,34 @@ class DataService:
     async def _fetch_weather(self, city: str, state: Optional[str]) -> Optional[Dict]:
         if not self.weather_api_key:
             return None
+        return await self.weather_cache.get(city, state)
 
-        key = f"{city},{state}".lower()
-        cached = self.weather_cache.get(key)
-        if cached and (datetime.utcnow() - cached["timestamp"]).seconds < 3600:
-            return cached["data"]
+    async def _request_weather(self, city: str, state: Optional[str]) -> Optional[Dict]:
+        """Call OpenWeather for a venue; used by the shared weather cache on a miss"""
 
         query = city
         if state:
             query = f"{city},{state},US"
 
         url = (
-            "https://api.openweathermap.org/data/2.5/weather"
+            f"{self.weather_base_url}/weather"
             f"?q={query}&appid={self.weather_api_key}&units=imperial"
         )
 
         async with aiohttp.ClientSession(timeout=self.http_timeout) as http:
             try:
-                payload = await self._fetch_json(http, url)
+                payload = await self._fetch_json(http, url, feed="weather")
             except Exception as weather_error:
                 logger.debug("Weather fetch failed for %s: %s", query, weather_error)
                 return None
 
-        weather = {
+        return {
             "temperature": payload.get("main", {}).get("temp"),
             "humidity": payload.get("main", {}).get("humidity"),
             "conditions": (payload.get("weather") or [{}])[0].get("description"),
             "windSpeed": payload.get("wind", {}).get("speed"),
         }
 
-        self.weather_cache[key] = {
-            "timestamp": datetime.utcnow(),
-            "data": weather,
-        }
-
-        return weather
-
     def _extract_market(self, event: Dict, market_key: str) -> Dict[str, Dict]:
         markets = {}
         for bookmaker in event.get("bookmakers", []):
@@ -1,5 +1,77 @@
 from typing import Dict, List, Optional
-from sqlalchemy import text
+
+from utils.queries import queries
+
+# Hot per-game lookups, run through the shared statement cache (see utils.queries)
+RECENT_GAMES = queries.register(
+    "recent_games",
+    """
+    SELECT game_date, points_for, points_against, spread_line
+    FROM team_games
+    WHERE team_id = :team_id
+      AND game_date < :game_date
+      AND status = 'final'
+    ORDER BY game_date DESC
+    LIMIT :limit
+    """
+)
+
+TEAM_STATS_AS_OF = queries.register(
+    "team_stats_as_of",
+    """
+    -- Derived record rows (one per week) carry no upstream stats, so each column comes
+    -- from the latest row that actually has it
+    WITH as_of AS (
+        SELECT week, total_yards, turnovers
+        FROM team_stats
+        WHERE team_id = :team_id AND season = :season
+          -- Week W rows are as of W's kickoff, so W itself does not leak its result
+          AND (CAST(:week AS INTEGER) IS NULL OR week IS NULL OR week <= :week)
+    )
+    SELECT
+        (SELECT total_yards FROM as_of WHERE total_yards IS NOT NULL
+         ORDER BY COALESCE(week, 0) DESC LIMIT 1) AS total_yards,
+        (SELECT turnovers FROM as_of WHERE turnovers IS NOT NULL
+         ORDER BY COALESCE(week, 0) DESC LIMIT 1) AS turnovers
+    """
+)
+
+PREVIOUS_GAME_DATE = queries.register(
+    "previous_game_date",
+    """
+    SELECT game_date
+    FROM team_games
+    WHERE team_id = :team_id
+      AND game_date < :game_date
+    ORDER BY game_date DESC
+    LIMIT 1
+    """
+)
+
+H2H_GAMES = queries.register(
+    "h2h_games",
+    """
+    SELECT points_for AS home_points, points_against AS away_points
+    FROM team_games
+    WHERE team_id = :home_team AND opponent_id = :away_team
+      AND game_date < :game_date
+      AND status = 'final'
+    ORDER BY game_date DESC
+    LIMIT 10
+    """
+)
+
+TEAM_INJURY_COUNTS = queries.register(
+    "team_injury_counts",
+    """
+    SELECT team_id, COUNT(*) FILTER (WHERE status IN ('Out', 'IR')) AS severe,
+           COUNT(*) FILTER (WHERE status IN ('Doubtful', 'Questionable')) AS questionable
+    FROM injuries
+    WHERE season = :season
+      AND team_id IN (:home_id, :away_id)
+    GROUP BY team_id
+    """
+)
 
 # Avoid division by zero utility
 def _safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
@@ -161,21 +233,8 @@ class FeatureEngineer:
         if not home_team_id or not away_team_id:
             return [0.5, 0.0]
 
-        result = await session.execute(
-            text(
-                """
-                SELECT
-                  CASE WHEN g.home_team_id = :home_team THEN g.home_score ELSE g.away_score END AS home_points,
-                  CASE WHEN g.home_team_id = :home_team THEN g.away_score ELSE g.home_score END AS away_points
-                FROM games g
-                WHERE ((g.home_team_id = :home_team AND g.away_team_id = :away_team)
-                     OR (g.home_team_id = :away_team AND g.away_team_id = :home_team))
-                  AND g.game_date < :game_date
-                  AND g.status = 'final'
-                ORDER BY g.game_date DESC
-                LIMIT 10
-                """
-            ),
+        result = await H2H_GAMES.execute(
+            session,
             {
                 "home_team": home_team_id,
                 "away_team": away_team_id,
@@ -239,17 +298,8 @@ class FeatureEngineer:
         if not (home_team_id and away_team_id and season):
             return 0.0
 
-        result = await session.execute(
-            text(
-                """
-                SELECT team_id, COUNT(*) FILTER (WHERE status IN ('Out', 'IR')) AS severe,
-                       COUNT(*) FILTER (WHERE status IN ('Doubtful', 'Questionable')) AS questionable
-                FROM injuries
-                WHERE season = :season
-                  AND team_id IN (:home_id, :away_id)
-                GROUP BY team_id
-                """
-            ),
+        result = await TEAM_INJURY_COUNTS.execute(
+            session,
             {
                 "season": season,
                 "home_id": home_team_id,
@@ -274,17 +324,8 @@ class FeatureEngineer:
         if not team_id or not game_date:
             return 7.0
 
-        result = await session.execute(
-            text(
-                """
-                SELECT game_date
-                FROM games
-                WHERE (home_team_id = :team_id OR away_team_id = :team_id)
-                  AND game_date < :game_date
-                ORDER BY game_date DESC
-                LIMIT 1
-                """
-            ),
+        result = await PREVIOUS_GAME_DATE.execute(
+            session,
             {
                 "team_id": team_id,
                 "game_date": game_date
@@ -312,22 +353,8 @@ class FeatureEngineer:
 
         season_val = season or (game_date.year if hasattr(game_date, "year") else None)
 
-        result = await session.execute(
-            text(
-                """
-                SELECT
-                  g.game_date,
-                  CASE WHEN g.home_team_id = :team_id THEN g.home_score ELSE g.away_score END AS points_for,
-                  CASE WHEN g.home_team_id = :team_id THEN g.away_score ELSE g.home_score END AS points_against,
-                  CASE WHEN g.home_team_id = :team_id THEN g.spread ELSE -g.spread END AS spread_line
-                FROM games g
-                WHERE (g.home_team_id = :team_id OR g.away_team_id = :team_id)
-                  AND g.game_date < :game_date
-                  AND g.status = 'final'
-                ORDER BY g.game_date DESC
-                LIMIT :limit
-                """
-            ),
+        result = await RECENT_GAMES.execute(
+            session,
             {
                 "team_id": team_id,
                 "game_date": game_date,
@@ -348,17 +375,8 @@ class FeatureEngineer:
         turnover_norm = 0.5
 
         if season_val:
-            stats_result = await session.execute(
-                text(
-                    """
-                    SELECT total_yards, turnovers
-                    FROM team_stats
-                    WHERE team_id = :team_id AND season = :season
-                      AND (CAST(:week AS INTEGER) IS NULL OR week IS NULL OR week <= :week)
-                    ORDER BY COALESCE(week, 0) DESC
-                    LIMIT 1
-                    """
-                ),
+            stats_result = await TEAM_STATS_AS_OF.execute(
+                session,
                 {
                     "team_id": team_id,
                     "season": season_val,
@@ -0,0 +1,53 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.logger import logger
+
+FeedFactory = Callable[[], Awaitable[Dict]]
+
+
+class FeedOrchestrator:
+    """Run ingestion feeds concurrently with per-feed failure isolation and timing.
+
+    Each feed is a zero-argument coroutine factory that owns its own DB session, so
+    one slow or failing upstream neither blocks nor rolls back the others. A feed may
+    name another feed it depends on (e.g. odds matching needs the games written
+    first); it then starts as soon as that feed finishes, whatever its outcome.
+    """
+
+    async def run(
+        self,
+        feeds: Dict[str, FeedFactory],
+        depends_on: Optional[Dict[str, str]] = None
+    ) -> Tuple[Dict[str, Dict], Dict[str, float], List[str]]:
+        """Run all feeds; returns ``(results, timings_seconds, failed_feed_names)``"""
+
+        depends_on = depends_on or {}
+        tasks: Dict[str, asyncio.Task] = {}
+        timings: Dict[str, float] = {}
+
+        async def _run_feed(name: str, factory: FeedFactory) -> Dict:
+            prerequisite = depends_on.get(name)
+            if prerequisite in tasks:
+                await asyncio.wait([tasks[prerequisite]])
+
+            started = time.perf_counter()
+            try:
+                return await factory()
+            except Exception as exc:
+                logger.error("Feed %s failed: %s", name, exc)
+                return {"status": "error", "error": str(exc)}
+            finally:
+                timings[name] = round(time.perf_counter() - started, 3)
+
+        for name, factory in feeds.items():
+            tasks[name] = asyncio.create_task(_run_feed(name, factory))
+
+        results = dict(zip(tasks.keys(), await asyncio.gather(*tasks.values())))
+        failed = [name for name, result in results.items() if result.get("status") == "error"]
+
+        for name, elapsed in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            logger.info("Feed %s finished in %.3fs%s", name, elapsed, " (failed)" if name in failed else "")
+
+        return results, timings, failed
@@ -0,0 +1,78 @@
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Historical and shorthand names used by odds providers, mapped to the ESPN display
+# names stored in games.home_team / games.away_team (after normalization).
+TEAM_ALIASES: Dict[str, str] = {
+    "washington": "washington commanders",
+    "washington football team": "washington commanders",
+    "washington redskins": "washington commanders",
+    "oakland raiders": "las vegas raiders",
+    "san diego chargers": "los angeles chargers",
+    "la chargers": "los angeles chargers",
+    "st louis rams": "los angeles rams",
+    "la rams": "los angeles rams",
+    "ny giants": "new york giants",
+    "ny jets": "new york jets",
+    "tampa bay bucs": "tampa bay buccaneers",
+    "kc chiefs": "kansas city chiefs",
+    "sf 49ers": "san francisco 49ers",
+    "niners": "san francisco 49ers",
+}
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9 ]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_team_name(name: Optional[str]) -> str:
+    """Lowercase, strip punctuation and resolve aliases so provider names compare equal"""
+    if not name:
+        return ""
+    cleaned = _NON_ALPHANUMERIC.sub("", name.lower().replace("-", " "))
+    cleaned = _WHITESPACE.sub(" ", cleaned).strip()
+    return TEAM_ALIASES.get(cleaned, cleaned)
+
+
+class GameMatchIndex:
+    """In-memory (home, away, date) lookup over a window of games.
+
+    Built once per odds payload so every event is matched without a query. Matching
+    keeps the original rule: same teams, kickoff within ``tolerance`` of the event.
+    """
+
+    def __init__(self, games: Iterable[Mapping], tolerance: timedelta = timedelta(hours=24)):
+        self.tolerance = tolerance
+        self._index: Dict[Tuple[str, str, date], List[Tuple[datetime, int]]] = {}
+        for game in games:
+            game_date = game["game_date"]
+            if game_date is None:
+                continue
+            key = (
+                normalize_team_name(game["home_team"]),
+                normalize_team_name(game["away_team"]),
+                game_date.date(),
+            )
+            self._index.setdefault(key, []).append((game_date, game["id"]))
+
+    def __len__(self) -> int:
+        return sum(len(candidates) for candidates in self._index.values())
+
+    def match(self, home_team: str, away_team: str, commence_time: datetime) -> Optional[int]:
+        """Return the id of the closest game within tolerance, or None"""
+        home = normalize_team_name(home_team)
+        away = normalize_team_name(away_team)
+        best_id = None
+        best_delta = None
+
+        # A kickoff within tolerance can only fall on the neighbouring date buckets
+        days = self.tolerance.days + 1
+        for offset in range(-days, days + 1):
+            bucket = commence_time.date() + timedelta(days=offset)
+            for game_date, game_id in self._index.get((home, away, bucket), ()):
+                delta = abs(game_date - commence_time)
+                if delta < self.tolerance and (best_delta is None or delta < best_delta):
+                    best_id = game_id
+                    best_delta = delta
+
+        return best_id
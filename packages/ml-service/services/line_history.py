@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+
+def _value(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class LineHistory:
+    """Read side of the change-only betting line store.
+
+    ``consensus`` and ``current`` read ``betting_lines_latest`` (one primary-key range
+    scan per game); ``movement`` reads the event history for a single game.
+    """
+
+    async def consensus(self, session, game_ids: List[int]) -> Dict[int, Dict]:
+        """Consensus line per market for each game: ``{game_id: {market: {...}}}``"""
+        if not game_ids:
+            return {}
+        result = await session.execute(
+            text(
+                """
+                SELECT game_id, market, books,
+                       median_home_value, median_away_value,
+                       min_home_value, max_home_value, updated_at
+                FROM betting_line_consensus
+                WHERE game_id = ANY(:game_ids)
+                """
+            ),
+            {"game_ids": list(game_ids)},
+        )
+        consensus: Dict[int, Dict] = {}
+        for row in result.mappings():
+            consensus.setdefault(row["game_id"], {})[row["market"]] = {
+                "home": _value(row["median_home_value"]),
+                "away": _value(row["median_away_value"]),
+                "range": [_value(row["min_home_value"]), _value(row["max_home_value"])],
+                "books": row["books"],
+                "updated_at": row["updated_at"],
+            }
+        return consensus
+
+    async def current(self, session, game_ids: List[int]) -> Dict[int, Dict]:
+        """Latest line per book: ``{game_id: {market: {sportsbook: [home, away]}}}``"""
+        if not game_ids:
+            return {}
+        result = await session.execute(
+            text(
+                """
+                SELECT game_id, market, sportsbook, home_value, away_value
+                FROM betting_lines_latest
+                WHERE game_id = ANY(:game_ids)
+                """
+            ),
+            {"game_ids": list(game_ids)},
+        )
+        lines: Dict[int, Dict] = {}
+        for row in result:
+            lines.setdefault(row.game_id, {}).setdefault(row.market, {})[row.sportsbook] = [
+                _value(row.home_value),
+                _value(row.away_value),
+            ]
+        return lines
+
+    async def movement(
+        self,
+        session,
+        game_id: int,
+        market: Optional[str] = None,
+        sportsbook: Optional[str] = None
+    ) -> Dict[str, Dict[str, List]]:
+        """Line changes as ``{market: {sportsbook: [[recorded_at, home, away], ...]}}``, oldest first"""
+        result = await session.execute(
+            text(
+                """
+                SELECT market, sportsbook, home_value, away_value, recorded_at
+                FROM betting_line_events
+                -- Scalar subquery so the planner prunes to the game's season partition
+                WHERE season = (SELECT season FROM games WHERE id = :game_id)
+                  AND game_id = :game_id
+                  AND (CAST(:market AS VARCHAR) IS NULL OR market = :market)
+                  AND (CAST(:sportsbook AS VARCHAR) IS NULL OR sportsbook = :sportsbook)
+                ORDER BY market, recorded_at, id
+                """
+            ),
+            {"game_id": game_id, "market": market, "sportsbook": sportsbook},
+        )
+        movement: Dict[str, Dict[str, List]] = {}
+        for row in result:
+            movement.setdefault(row.market, {}).setdefault(row.sportsbook, []).append([
+                row.recorded_at.isoformat(),
+                _value(row.home_value),
+                _value(row.away_value),
+            ])
+        return movement
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Mapping, Optional
+
+from sqlalchemy import text
+
+from services.data_service import DataService
+from utils.database import SessionLocal
+from utils.logger import logger
+
+LIVE_INTERVAL = 30
+PREGAME_INTERVAL = 300
+IDLE_INTERVAL = 3600
+PREGAME_WINDOW = timedelta(hours=3)
+
+DONE_STATUSES = {"final", "postponed", "canceled"}
+
+
+def next_poll_interval(
+    games: Iterable[Mapping],
+    now: Optional[datetime] = None,
+    *,
+    live_interval: int = LIVE_INTERVAL,
+    pregame_interval: int = PREGAME_INTERVAL,
+    idle_interval: int = IDLE_INTERVAL,
+    pregame_window: timedelta = PREGAME_WINDOW
+) -> int:
+    """Seconds until the next scoreboard poll given the week's games.
+
+    Live games poll every ``live_interval``; games kicking off within
+    ``pregame_window`` (or past kickoff but not yet reported live) every
+    ``pregame_interval``; otherwise ``idle_interval``, shortened so polling speeds
+    up on time for the next kickoff. ``game_date`` is naive UTC, as stored.
+    """
+    now = now or datetime.utcnow()
+    next_kickoff = None
+
+    for game in games:
+        status = game["status"]
+        if status == "in_progress":
+            return live_interval
+        if status in DONE_STATUSES or game["game_date"] is None:
+            continue
+        if game["game_date"] - now <= pregame_window:
+            return pregame_interval
+        if next_kickoff is None or game["game_date"] < next_kickoff:
+            next_kickoff = game["game_date"]
+
+    if next_kickoff is not None:
+        until_window = (next_kickoff - pregame_window - now).total_seconds()
+        return int(max(pregame_interval, min(idle_interval, until_window)))
+    return idle_interval
+
+
+class LiveGameScheduler:
+    """In-process poller that refreshes the current week's games at a game-state cadence.
+
+    Each poll goes through ``DataService.fetch_games``, whose fingerprinted upsert only
+    writes rows that changed, so quiet polls cost one upstream call and no writes.
+    """
+
+    def __init__(self, service: Optional[DataService] = None, **intervals):
+        self.service = service
+        self.intervals = intervals
+        self._task: Optional[asyncio.Task] = None
+        self.state: Dict = {
+            "running": False,
+            "polls": 0,
+            "failures": 0,
+            "last_poll": None,
+            "last_result": None,
+            "next_interval": None,
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            self.state["running"] = True
+            logger.info("Live game polling started")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.state["running"] = False
+
+    async def poll_once(self) -> int:
+        """Refresh the current week once; returns the delay before the next poll"""
+        self.service = self.service or DataService()
+        result = await self.service.fetch_games()
+        self.state["polls"] += 1
+        self.state["last_poll"] = datetime.utcnow().isoformat()
+        self.state["last_result"] = {
+            key: result.get(key) for key in ("season", "week", "inserted", "updated", "unchanged")
+        }
+
+        async with SessionLocal() as session:
+            games = await session.execute(
+                text("SELECT status, game_date FROM games WHERE season = :season AND week = :week"),
+                {"season": result["season"], "week": result["week"]},
+            )
+            return next_poll_interval(games.mappings().all(), **self.intervals)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                interval = await self.poll_once()
+                last = self.state["last_result"]
+                if last["inserted"] or last["updated"]:
+                    logger.info(
+                        "Live poll: %s new, %s updated games; next poll in %ss",
+                        last["inserted"],
+                        last["updated"],
+                        interval
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.state["failures"] += 1
+                interval = self.intervals.get("pregame_interval", PREGAME_INTERVAL)
+                logger.warning("Live poll failed, retrying in %ss: %s", interval, exc)
+
+            self.state["next_interval"] = interval
+            await asyncio.sleep(interval)
+
+
+live_scheduler = LiveGameScheduler()
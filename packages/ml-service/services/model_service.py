@@ -1,14 +1,52 @@
+import asyncio
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from sklearn.neural_network import MLPClassifier
 import xgboost as xgb
 import joblib
 from pathlib import Path
 from typing import Dict, List
 
+from services.prediction_cache import refresh_model_version
 from utils.logger import logger
+from utils.training_pool import TrainingJob, save_models, train_in_parallel
+
+def _random_forest(n_jobs=-1):
+    return RandomForestClassifier(
+        n_estimators=100,
+        max_depth=10,
+        random_state=42,
+        n_jobs=n_jobs
+    )
+
+def _xgboost(n_jobs=-1):
+    return xgb.XGBClassifier(
+        n_estimators=100,
+        max_depth=6,
+        learning_rate=0.1,
+        random_state=42,
+        n_jobs=n_jobs
+    )
+
+def _neural_network(n_jobs=1):
+    return MLPClassifier(
+        hidden_layer_sizes=(64, 32, 16),
+        activation='relu',
+        solver='adam',
+        max_iter=500,
+        random_state=42,
+        early_stopping=True,
+        validation_fraction=0.1
+    )
+
+TRAINING_JOBS = [
+    TrainingJob("random_forest", _random_forest, "rf_model.joblib", weight=2),
+    TrainingJob("xgboost", _xgboost, "xgb_model.joblib", weight=2),
+    TrainingJob("neural_network", _neural_network, "nn_model.joblib", weight=1, scaler_filename="scaler.joblib"),
+]
 
 class ModelService:
     """Service for model training and evaluation"""
@@ -82,60 +120,17 @@ class ModelService:
                 X, y, test_size=0.2, random_state=42
             )
 
-            results = {}
-
-            # Train Random Forest
-            logger.info("Training Random Forest...")
-            rf_model = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=10,
-                random_state=42,
-                n_jobs=-1
-            )
-            rf_model.fit(X_train, y_train)
-            rf_acc = accuracy_score(y_test, rf_model.predict(X_test))
-            joblib.dump(rf_model, self.models_dir / "rf_model.joblib")
-            results["random_forest"] = {"accuracy": float(rf_acc)}
-            logger.info(f"Random Forest trained: {rf_acc:.3f} accuracy")
-
-            # Train XGBoost
-            logger.info("Training XGBoost...")
-            xgb_model = xgb.XGBClassifier(
-                n_estimators=100,
-                max_depth=6,
-                learning_rate=0.1,
-                random_state=42
-            )
-            xgb_model.fit(X_train, y_train)
-            xgb_acc = accuracy_score(y_test, xgb_model.predict(X_test))
-            joblib.dump(xgb_model, self.models_dir / "xgb_model.joblib")
-            results["xgboost"] = {"accuracy": float(xgb_acc)}
-            logger.info(f"XGBoost trained: {xgb_acc:.3f} accuracy")
-
-            # Train Neural Network
-            logger.info("Training Neural Network...")
-            from sklearn.neural_network import MLPClassifier
-            from sklearn.preprocessing import StandardScaler
-
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
-
-            nn_model = MLPClassifier(
-                hidden_layer_sizes=(64, 32, 16),
-                activation='relu',
-                solver='adam',
-                max_iter=500,
-                random_state=42,
-                early_stopping=True,
-                validation_fraction=0.1
+            # Fit all models concurrently, off the event loop
+            fitted = await asyncio.to_thread(
+                train_in_parallel, TRAINING_JOBS, X_train, y_train, X_test, y_test
             )
-            nn_model.fit(X_train_scaled, y_train)
-            nn_acc = accuracy_score(y_test, nn_model.predict(X_test_scaled))
-            joblib.dump(nn_model, self.models_dir / "nn_model.joblib")
-            joblib.dump(scaler, self.models_dir / "scaler.joblib")
-            results["neural_network"] = {"accuracy": float(nn_acc)}
-            logger.info(f"Neural Network trained: {nn_acc:.3f} accuracy")
+            save_models(TRAINING_JOBS, fitted, self.models_dir)
+            refresh_model_version()
+
+            results = {
+                name: {"accuracy": fitted[name]["test_score"], "fit_seconds": fitted[name]["seconds"]}
+                for name in fitted
+            }
 
             logger.info("Model training completed")
             return {
@@ -0,0 +1,143 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.http_policy import redact_url
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when no archived payload exists for a URL"""
+
+
+class PayloadArchive:
+    """Content-addressed archive of raw upstream JSON payloads.
+
+    Each payload is stored once as ``objects/<aa>/<sha256>.json.gz``. A SQLite index
+    records every fetch (feed, season, week, redacted URL, fetch time) so payloads
+    can be listed for a backfill or looked up by URL when replaying offline.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.sqlite3"
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS payloads (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    feed TEXT NOT NULL,
+                    season INTEGER,
+                    week INTEGER,
+                    url TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    fetched_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_payloads_url ON payloads(url, fetched_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_payloads_feed ON payloads(feed, season, week)")
+
+    @classmethod
+    def from_env(cls) -> Optional["PayloadArchive"]:
+        """Archive configured by ``PAYLOAD_ARCHIVE_DIR``, or None when unset"""
+        root = os.getenv("PAYLOAD_ARCHIVE_DIR")
+        return cls(Path(root)) if root else None
+
+    def store(
+        self,
+        payload: Any,
+        *,
+        url: str,
+        feed: str,
+        season: Optional[int] = None,
+        week: Optional[int] = None
+    ) -> str:
+        """Archive a payload and index the fetch; returns the content hash"""
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with gzip.open(tmp_path, "wb") as handle:
+                handle.write(raw)
+            tmp_path.replace(path)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO payloads (feed, season, week, url, sha256, size, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    feed,
+                    season,
+                    week,
+                    redact_url(url),
+                    digest,
+                    len(raw),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+        return digest
+
+    def load(self, digest: str) -> Any:
+        with gzip.open(self._object_path(digest), "rb") as handle:
+            return json.loads(handle.read())
+
+    def latest_for_url(self, url: str) -> Any:
+        """Most recently archived payload for ``url``; raises ReplayMissError if none"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT sha256 FROM payloads WHERE url = ? ORDER BY fetched_at DESC, id DESC LIMIT 1",
+                (redact_url(url),),
+            ).fetchone()
+        if not row:
+            raise ReplayMissError(f"No archived payload for {redact_url(url)}")
+        return self.load(row[0])
+
+    def entries(
+        self,
+        feed: Optional[str] = None,
+        season: Optional[int] = None,
+        week: Optional[int] = None
+    ) -> List[Dict]:
+        """Index rows filtered by feed/season/week, oldest first"""
+        clauses = []
+        params: List[Any] = []
+        for column, value in (("feed", feed), ("season", season), ("week", week)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                f"SELECT feed, season, week, url, sha256, size, fetched_at FROM payloads {where} "
+                "ORDER BY fetched_at, id",
+                params,
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.index_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
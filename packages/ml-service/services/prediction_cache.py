@@ -0,0 +1,125 @@
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from utils import codec
+from utils.cache import cache
+
+MODELS_DIR = Path(__file__).parent.parent / "models"
+GAME_PREDICTION_TTL = 900
+
+
+_model_version: Optional[str] = None
+
+
+def refresh_model_version() -> str:
+    """Recompute the version from ``MODEL_VERSION`` and the newest model file's mtime.
+
+    Called when models are loaded or retrained, so building a cache key never touches
+    the filesystem.
+    """
+    global _model_version
+    mtimes = [path.stat().st_mtime for path in MODELS_DIR.glob("*.joblib")]
+    _model_version = f"{os.getenv('MODEL_VERSION', '1.0.0')}.{int(max(mtimes, default=0)):x}"
+    return _model_version
+
+
+def model_version() -> str:
+    """Version of the models being served, as of the last load or retrain"""
+    return _model_version or refresh_model_version()
+
+
+# Keys carry the model version: predictions cached before a retrain are never served after it
+def upcoming_predictions_key() -> str:
+    return f"ml:predictions:upcoming:{model_version()}"
+
+
+def weekly_predictions_key(season: int, week: int) -> str:
+    return f"ml:predictions:week:{season}:{week}:{model_version()}"
+
+
+def game_prediction_key(game_id: int, version: Optional[str] = None) -> str:
+    return f"ml:prediction:game:{game_id}:{version or model_version()}"
+
+
+async def get_game_predictions(game_ids: Iterable[int]) -> Dict[int, Dict]:
+    """Cached predictions for whichever of ``game_ids`` are present, fetched in one MGET"""
+    version = model_version()
+    keys = {game_prediction_key(game_id, version): game_id for game_id in game_ids}
+    bodies = await cache.get_many_bytes(list(keys), GAME_PREDICTION_TTL)
+    return {keys[key]: codec.loads(body) for key, body in bodies.items()}
+
+
+async def set_game_predictions(predictions: Iterable[Dict]) -> None:
+    """Cache per-game predictions with one pipelined write"""
+    version = model_version()
+    await cache.set_many_bytes(
+        {
+            game_prediction_key(prediction["game_id"], version): codec.dumps(prediction)
+            for prediction in predictions
+        },
+        GAME_PREDICTION_TTL,
+    )
+
+
+async def invalidate_team_predictions(session, team_ids: Iterable[int]) -> List[int]:
+    """Drop cached predictions (game, week and upcoming lists) for not-yet-final games involving ``team_ids``.
+
+    Returns the ids of the games whose cache entries were removed.
+    """
+    team_ids = sorted(set(team_ids))
+    if not team_ids:
+        return []
+
+    result = await session.execute(
+        text(
+            """
+            SELECT DISTINCT game_id, season, week
+            FROM team_games
+            WHERE team_id = ANY(:team_ids)
+              AND game_date >= NOW() - INTERVAL '4 hours'
+              AND status NOT IN ('final', 'postponed', 'canceled')
+            """
+        ),
+        {"team_ids": team_ids},
+    )
+    return await _drop_game_predictions(result.fetchall())
+
+
+async def invalidate_game_predictions(session, game_ids: Iterable[int]) -> List[int]:
+    """Drop cached predictions (game, week and upcoming lists) for whichever of ``game_ids`` are not final.
+
+    Returns the ids of the games whose cache entries were removed.
+    """
+    game_ids = sorted(set(game_ids))
+    if not game_ids:
+        return []
+
+    result = await session.execute(
+        text(
+            """
+            SELECT id AS game_id, season, week
+            FROM games
+            WHERE id = ANY(:game_ids)
+              AND status NOT IN ('final', 'postponed', 'canceled')
+            """
+        ),
+        {"game_ids": game_ids},
+    )
+    return await _drop_game_predictions(result.fetchall())
+
+
+async def _drop_game_predictions(rows) -> List[int]:
+    game_ids = [row.game_id for row in rows]
+
+    if game_ids:
+        version = model_version()
+        await cache.delete(
+            upcoming_predictions_key(),
+            *(game_prediction_key(game_id, version) for game_id in game_ids),
+            *{weekly_predictions_key(row.season, row.week) for row in rows},
+        )
+
+    return game_ids
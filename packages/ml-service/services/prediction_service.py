@@ -6,10 +6,30 @@ from pathlib import Path
 
 from sqlalchemy import text
 
-from services.feature_engineering import FeatureEngineer
+from services.feature_engineering import TEAM_INJURY_COUNTS, FeatureEngineer
 from services.gematria_service import GematriaService
+from services.line_history import LineHistory
+from services.prediction_cache import get_game_predictions, refresh_model_version, set_game_predictions
 from utils.logger import logger
-from utils.database import SessionLocal
+from utils.database import read_session
+from utils.queries import queries
+
+GAME_DETAILS = queries.register(
+    "game_details",
+    """
+    SELECT
+      g.*, ht.abbreviation AS home_abbr, ht.conference AS home_conference,
+      ht.division AS home_division,
+      at.abbreviation AS away_abbr, at.conference AS away_conference,
+      at.division AS away_division
+    FROM games g
+    LEFT JOIN teams ht ON g.home_team_id = ht.id
+    LEFT JOIN teams at ON g.away_team_id = at.id
+    WHERE g.id = :game_id
+    LIMIT 1
+    """
+)
+
 
 class PredictionService:
     """Service for generating NFL game predictions"""
@@ -19,6 +39,7 @@ class PredictionService:
         self.models_dir.mkdir(exist_ok=True)
         self.feature_engineer = FeatureEngineer()
         self.gematria_service = GematriaService()
+        self.line_history = LineHistory()
         self.models = self._load_models()
 
     def _load_models(self):
@@ -45,25 +66,43 @@ class PredictionService:
         if not models:
             logger.warning("No trained models found, will use baseline predictions")
 
+        # Picks up models retrained by another process
+        refresh_model_version()
         return models
 
     async def get_upcoming_predictions(self) -> List[Dict]:
         """Get predictions for all upcoming games"""
         upcoming_games = await self._get_upcoming_games_from_db()
+        return await self.predict_games([game['id'] for game in upcoming_games])
+
+    async def predict_games(self, game_ids: List[int], strict: bool = False) -> List[Dict]:
+        """Predictions for ``game_ids`` in order, reusing cached per-game predictions.
 
-        predictions = []
-        for game in upcoming_games:
+        Cached games come back from one batched read and only the misses are
+        computed, then written back in one pipelined round trip. Games that fail
+        are logged and left out unless ``strict``, which re-raises instead.
+        """
+        cached = await get_game_predictions(game_ids)
+
+        computed = {}
+        for game_id in game_ids:
+            if game_id in cached or game_id in computed:
+                continue
             try:
-                prediction = await self.predict_game(game['id'])
-                predictions.append(prediction)
+                computed[game_id] = await self.predict_game(game_id)
             except Exception as e:
-                logger.error(f"Error predicting game {game['id']}: {e}")
+                if strict:
+                    raise
+                logger.error(f"Error predicting game {game_id}: {e}")
 
-        return predictions
+        await set_game_predictions(computed.values())
+
+        predictions = {**cached, **computed}
+        return [predictions[game_id] for game_id in game_ids if game_id in predictions]
 
     async def predict_game(self, game_id: int) -> Dict:
         """Generate detailed prediction for a specific game"""
-        async with SessionLocal() as session:
+        async with read_session() as session:
             game_data = await self._get_game_data(session, game_id)
 
             if not game_data:
@@ -136,22 +175,14 @@ class PredictionService:
                 "model_breakdown": predictions,
                 "injuries": game_data.get("injuries"),
                 "weather": game_data.get("weather"),
-                "venue": game_data.get("venue")
+                "venue": game_data.get("venue"),
+                "market_lines": game_data.get("market_lines")
             }
 
     async def get_weekly_predictions(self, week: int, season: int) -> List[Dict]:
         """Get predictions for a specific week"""
         games = await self._get_weekly_games(week, season)
-
-        predictions = []
-        for game in games:
-            try:
-                prediction = await self.predict_game(game['id'])
-                predictions.append(prediction)
-            except Exception as e:
-                logger.error(f"Error predicting game {game['id']}: {e}")
-
-        return predictions
+        return await self.predict_games([game['id'] for game in games])
 
     async def optimize_parlay(
         self,
@@ -160,11 +191,7 @@ class PredictionService:
         target_odds: Optional[float] = None
     ) -> Dict:
         """Optimize parlay selections based on confidence and odds"""
-        predictions = []
-
-        for game_id in game_ids:
-            pred = await self.predict_game(game_id)
-            predictions.append(pred)
+        predictions = await self.predict_games(game_ids, strict=True)
 
         # Sort by confidence
         sorted_preds = sorted(predictions, key=lambda x: x["confidence"], reverse=True)
@@ -176,14 +203,29 @@ class PredictionService:
         combined_confidence = np.prod([p["confidence"] for p in selected])
         estimated_odds = 1 / combined_confidence if combined_confidence > 0 else 1
 
+        # Price at the consensus moneyline, when every pick has one
+        market_odds = [self._market_decimal_odds(p) for p in selected]
+        combined_market_odds = float(np.prod(market_odds)) if selected and all(market_odds) else None
+
         return {
             "selections": selected,
             "num_picks": len(selected),
             "combined_confidence": float(combined_confidence),
             "estimated_odds": float(estimated_odds),
+            "market_odds": combined_market_odds,
             "recommended": combined_confidence > 0.6
         }
 
+    @staticmethod
+    def _market_decimal_odds(prediction: Dict) -> Optional[float]:
+        """Consensus moneyline for the predicted winner, as decimal odds"""
+        moneyline = (prediction.get("market_lines") or {}).get("moneyline") or {}
+        side = "home" if prediction["predicted_winner"] == prediction["home_team"] else "away"
+        american = moneyline.get(side)
+        if not american:
+            return None
+        return 1 + (american / 100 if american > 0 else 100 / abs(american))
+
     def _predict_scores(self, game_data: Dict) -> Dict:
         """Predict final scores and spread using recent averages"""
         home_recent = game_data.get("home_recent", {})
@@ -257,7 +299,7 @@ class PredictionService:
 
     async def _get_upcoming_games_from_db(self) -> List[Dict]:
         """Fetch upcoming games from database"""
-        async with SessionLocal() as session:
+        async with read_session() as session:
             result = await session.execute(
                 text(
                     """
@@ -279,21 +321,8 @@ class PredictionService:
 
     async def _get_game_data(self, session, game_id: int) -> Dict:
         """Fetch game data from database"""
-        result = await session.execute(
-            text(
-                """
-                SELECT
-                  g.*, ht.abbreviation AS home_abbr, ht.conference AS home_conference,
-                  ht.division AS home_division,
-                  at.abbreviation AS away_abbr, at.conference AS away_conference,
-                  at.division AS away_division
-                FROM games g
-                LEFT JOIN teams ht ON g.home_team_id = ht.id
-                LEFT JOIN teams at ON g.away_team_id = at.id
-                WHERE g.id = :game_id
-                LIMIT 1
-                """
-            ),
+        result = await GAME_DETAILS.execute(
+            session,
             {"game_id": game_id}
         )
 
@@ -301,17 +330,8 @@ class PredictionService:
         if not row:
             return {}
 
-        injuries_result = await session.execute(
-            text(
-                """
-                SELECT team_id,
-                       COUNT(*) FILTER (WHERE status IN ('Out', 'IR')) AS severe,
-                       COUNT(*) FILTER (WHERE status IN ('Questionable', 'Doubtful')) AS questionable
-                FROM injuries
-                WHERE season = :season AND team_id IN (:home_id, :away_id)
-                GROUP BY team_id
-                """
-            ),
+        injuries_result = await TEAM_INJURY_COUNTS.execute(
+            session,
             {
                 "season": row.season,
                 "home_id": row.home_team_id,
@@ -367,6 +387,8 @@ class PredictionService:
 
         injury_impact = _impact(injury_map.get(row.away_team_id)) - _impact(injury_map.get(row.home_team_id))
 
+        market_lines = (await self.line_history.consensus(session, [row.id])).get(row.id, {})
+
         weather = row.weather_conditions or {}
         if isinstance(weather, dict):
             conditions = (weather.get("conditions") or weather.get("condition") or "").lower()
@@ -391,6 +413,7 @@ class PredictionService:
             "away_abbr": row.away_abbr,
             "spread": row.spread,
             "over_under": row.over_under,
+            "market_lines": market_lines,
             "status": row.status,
             "venue": {
                 "name": row.venue_name,
@@ -413,7 +436,7 @@ class PredictionService:
 
     async def _get_weekly_games(self, week: int, season: int) -> List[Dict]:
         """Fetch games for a specific week (including completed games)"""
-        async with SessionLocal() as session:
+        async with read_session() as session:
             result = await session.execute(
                 text(
                     """
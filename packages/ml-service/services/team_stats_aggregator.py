@@ -0,0 +1,131 @@
+from typing import Dict, Optional
+
+from sqlalchemy import text
+
+from utils.logger import logger
+
+DERIVED_COLUMNS = (
+    "wins",
+    "losses",
+    "ties",
+    "points_for",
+    "points_against",
+    "games_played",
+    "streak",
+    "home_wins",
+    "home_losses",
+    "away_wins",
+    "away_losses",
+)
+
+
+def _build_statement() -> str:
+    columns = ", ".join(DERIVED_COLUMNS)
+    selected = ", ".join(f"COALESCE(r.{column}, 0)" for column in DERIVED_COLUMNS)
+    assignments = ",\n                ".join(f"{column} = EXCLUDED.{column}" for column in DERIVED_COLUMNS)
+    current = ", ".join(f"team_stats.{column}" for column in DERIVED_COLUMNS)
+    incoming = ", ".join(f"EXCLUDED.{column}" for column in DERIVED_COLUMNS)
+
+    return f"""
+        WITH team_results AS (
+            SELECT week, game_date, team_id, is_home, points_for, points_against
+            FROM team_games
+            WHERE season = :season AND status = 'final'
+              AND points_for IS NOT NULL AND points_against IS NOT NULL
+        ),
+        outcomes AS (
+            SELECT *,
+                   SIGN(points_for - points_against) AS outcome,
+                   ROW_NUMBER() OVER (PARTITION BY team_id ORDER BY game_date) AS game_no
+            FROM team_results
+        ),
+        runs AS (
+            -- Gaps and islands: consecutive equal outcomes share a run_id
+            SELECT *,
+                   game_no - ROW_NUMBER() OVER (PARTITION BY team_id, outcome ORDER BY game_date) AS run_id
+            FROM outcomes
+        ),
+        running AS (
+            SELECT team_id, week, game_date,
+                   game_no AS games_played,
+                   SUM(CASE WHEN outcome = 1 THEN 1 ELSE 0 END) OVER w AS wins,
+                   SUM(CASE WHEN outcome = -1 THEN 1 ELSE 0 END) OVER w AS losses,
+                   SUM(CASE WHEN outcome = 0 THEN 1 ELSE 0 END) OVER w AS ties,
+                   SUM(points_for) OVER w AS points_for,
+                   SUM(points_against) OVER w AS points_against,
+                   SUM(CASE WHEN is_home AND outcome = 1 THEN 1 ELSE 0 END) OVER w AS home_wins,
+                   SUM(CASE WHEN is_home AND outcome = -1 THEN 1 ELSE 0 END) OVER w AS home_losses,
+                   SUM(CASE WHEN NOT is_home AND outcome = 1 THEN 1 ELSE 0 END) OVER w AS away_wins,
+                   SUM(CASE WHEN NOT is_home AND outcome = -1 THEN 1 ELSE 0 END) OVER w AS away_losses,
+                   outcome * ROW_NUMBER() OVER (
+                       PARTITION BY team_id, outcome, run_id ORDER BY game_date
+                   ) AS streak
+            FROM runs
+            WINDOW w AS (
+                PARTITION BY team_id ORDER BY game_date
+                ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+            )
+        ),
+        as_of AS (
+            -- One row per scheduled team for every week through the week after the last
+            -- final game (or the requested week, if later); teams seed from the schedule so
+            -- week 1 gets its 0-0 rows before anyone has played
+            SELECT t.team_id, w.week
+            FROM (SELECT DISTINCT team_id FROM team_games WHERE season = :season) t
+            CROSS JOIN generate_series(
+                1,
+                GREATEST(
+                    (SELECT COALESCE(MAX(week), 0) + 1 FROM team_results),
+                    COALESCE(CAST(:week AS INTEGER), 0)
+                )
+            ) AS w(week)
+            WHERE CAST(:week AS INTEGER) IS NULL OR w.week = :week
+        )
+        INSERT INTO team_stats (team_id, season, week, {columns}, updated_at)
+        SELECT a.team_id, CAST(:season AS INTEGER), a.week, {selected}, NOW()
+        FROM as_of a
+        LEFT JOIN LATERAL (
+            SELECT *
+            FROM running r
+            WHERE r.team_id = a.team_id AND r.week < a.week
+            ORDER BY r.game_date DESC
+            LIMIT 1
+        ) r ON TRUE
+        ON CONFLICT (team_id, season, week)
+        DO UPDATE SET
+                {assignments},
+                updated_at = NOW()
+        WHERE ({current}) IS DISTINCT FROM ({incoming})
+        RETURNING (xmax = 0) AS inserted
+    """
+
+
+class TeamStatsAggregator:
+    """Builds point-in-time team_stats rows from finalized games in one set-based pass.
+
+    The row for week W reflects only games from weeks before W, so it is the record a
+    model could have known at kickoff. Columns ESPN alone can provide (yardage,
+    turnovers, efficiency) are left to ``DataService.fetch_team_stats``.
+    """
+
+    statement = text(_build_statement())
+
+    async def rebuild(self, session, season: int, week: Optional[int] = None) -> Dict:
+        """Recompute derived columns for a season (or one week); unchanged rows are not rewritten"""
+        result = await session.execute(self.statement, {"season": season, "week": week})
+        inserted = 0
+        updated = 0
+        for row in result:
+            if row.inserted:
+                inserted += 1
+            else:
+                updated += 1
+
+        logger.info(
+            "Derived team stats for season %s%s - new: %s, updated: %s",
+            season,
+            f" week {week}" if week else "",
+            inserted,
+            updated
+        )
+        return {"inserted": inserted, "updated": updated}
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from utils.cache import LocalCache
+from utils.database import get_redis
+from utils.logger import logger
+
+WEATHER_TTL_SECONDS = 3600
+# Roughly a season's venues times a day of forecast hours
+WEATHER_LOCAL_MAX_ENTRIES = 1024
+
+Venue = Tuple[str, Optional[str]]
+WeatherFetcher = Callable[[str, Optional[str]], Awaitable[Optional[Dict]]]
+
+
+class WeatherCache:
+    """Shared weather cache keyed by venue and forecast hour.
+
+    Entries live in Redis with a real TTL so they survive across the short-lived
+    DataService instances created per request. When Redis is unavailable a bounded
+    process-local LRU is used instead. Concurrent lookups for the same key wait on a single
+    in-flight upstream request.
+    """
+
+    # Shared by every instance in the process
+    _inflight: Dict[str, asyncio.Future] = {}
+    _local = LocalCache(max_entries=WEATHER_LOCAL_MAX_ENTRIES)
+
+    def __init__(self, fetcher: WeatherFetcher, ttl: int = WEATHER_TTL_SECONDS, shared: bool = True):
+        self.fetcher = fetcher
+        self.ttl = ttl
+        # Unshared caches (offline replay) always call the fetcher so results stay deterministic
+        self.shared = shared
+
+    @staticmethod
+    def cache_key(city: str, state: Optional[str], hour: Optional[datetime] = None) -> str:
+        hour = hour or datetime.now(timezone.utc)
+        venue = f"{city},{state or ''}".lower().replace(" ", "_")
+        return f"ml:weather:{venue}:{hour:%Y%m%d%H}"
+
+    async def get(self, city: str, state: Optional[str]) -> Optional[Dict]:
+        if not self.shared:
+            return await self.fetcher(city, state)
+
+        key = self.cache_key(city, state)
+
+        found, cached = await self._read(key)
+        if found:
+            return cached
+
+        while key in self._inflight:
+            inflight = self._inflight[key]
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the lookup we were waiting on was cancelled: take it over
+                if not inflight.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            weather = await self.fetcher(city, state)
+            await self._write(key, weather)
+            future.set_result(weather)
+            return weather
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception retrieved so waiter-less futures don't warn
+            future.exception()
+            raise
+        except BaseException:
+            # Cancelled: release waiters so they retry instead of hanging
+            future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def prefetch(self, venues: Iterable[Venue]) -> Dict[Venue, Optional[Dict]]:
+        """Resolve weather for every distinct venue of a slate in parallel"""
+        unique = list(dict.fromkeys(venues))
+        results = await asyncio.gather(
+            *(self.get(city, state) for city, state in unique),
+            return_exceptions=True
+        )
+        weather: Dict[Venue, Optional[Dict]] = {}
+        for venue, result in zip(unique, results):
+            if isinstance(result, Exception):
+                logger.debug("Weather prefetch failed for %s: %s", venue, result)
+                result = None
+            weather[venue] = result
+        return weather
+
+    async def _read(self, key: str) -> Tuple[bool, Optional[Dict]]:
+        redis = get_redis()
+        if redis:
+            try:
+                cached = await redis.get(key)
+                if cached is not None:
+                    return True, json.loads(cached)
+                return False, None
+            except Exception as exc:
+                logger.debug("Weather cache read failed for %s: %s", key, exc)
+
+        return self._local.get(key)
+
+    async def _write(self, key: str, weather: Optional[Dict]) -> None:
+        # Failed lookups are not cached so the next caller retries
+        if weather is None:
+            return
+
+        redis = get_redis()
+        if redis:
+            try:
+                await redis.setex(key, self.ttl, json.dumps(weather))
+                return
+            except Exception as exc:
+                logger.debug("Weather cache write failed for %s: %s", key, exc)
+
+        self._local.set(key, weather, self.ttl)
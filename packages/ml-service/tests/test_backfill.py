@@ -0,0 +1,162 @@
+"""
+Tests for the resumable historical backfill
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from services.backfill import BackfillEngine
+from utils.rate_limit import TokenBucket
+
+
+def _engine(update_all, completed=()):
+    service = Mock()
+    service.update_all = AsyncMock(side_effect=update_all)
+    service.fetch_team_stats = AsyncMock(return_value={"derived": {"inserted": 32, "updated": 0}})
+    engine = BackfillEngine(service, concurrency=4, weeks_per_second=1000)
+    engine._load_completed = AsyncMock(return_value=set(completed))
+    engine._checkpoint = AsyncMock()
+    return engine, service
+
+
+async def _games_ok(season, week, **kwargs):
+    return {"games": {"inserted": 2, "updated": 1}, "team_stats": {"processed": 32}, "failed_feeds": []}
+
+
+def _statuses(engine):
+    return {(call.args[0], call.args[1], call.args[2]) for call in engine._checkpoint.await_args_list}
+
+
+@pytest.mark.unit
+class TestBackfillEngine:
+    """Resume, checkpoints and failure handling"""
+
+    def test_resume_skips_completed_weeks(self):
+        engine, service = _engine(_games_ok, completed={(2023, 1), (2023, 2)})
+
+        summary = asyncio.run(engine.run([2023], weeks=range(1, 5)))
+
+        weeks_run = sorted(call.kwargs["week"] for call in service.update_all.await_args_list)
+        assert weeks_run == [3, 4]
+        assert summary["skipped"] == 2
+        assert summary["completed"] == 2
+        assert summary["games_written"] == 6
+
+    def test_without_resume_every_week_runs(self):
+        engine, service = _engine(_games_ok, completed={(2023, 1)})
+
+        asyncio.run(engine.run([2023], weeks=range(1, 3), resume=False))
+
+        assert service.update_all.await_count == 2
+        engine._load_completed.assert_not_awaited()
+
+    def test_failed_weeks_are_checkpointed_as_failed(self):
+        async def update_all(season, week, **kwargs):
+            if week == 2:
+                return {"games": {"status": "error", "error": "upstream down"}, "failed_feeds": ["games"]}
+            return await _games_ok(season, week)
+
+        engine, _ = _engine(update_all)
+
+        summary = asyncio.run(engine.run([2023], weeks=range(1, 4)))
+
+        assert summary["failed"] == [{"season": 2023, "week": 2}]
+        assert summary["completed"] == 2
+        assert (2023, 2, "failed") in _statuses(engine)
+        assert (2023, 2, "completed") not in _statuses(engine)
+        failed_call = next(
+            call for call in engine._checkpoint.await_args_list if call.args[1:3] == (2, "failed")
+        )
+        assert failed_call.kwargs["error"] == "upstream down"
+
+    def test_team_stats_feed_failure_fails_the_week(self):
+        async def update_all(season, week, **kwargs):
+            result = await _games_ok(season, week)
+            if week == 1:
+                result["team_stats"] = {"status": "error", "error": "stats down"}
+                result["failed_feeds"] = ["team_stats"]
+            return result
+
+        engine, _ = _engine(update_all)
+
+        summary = asyncio.run(engine.run([2023], weeks=range(1, 3)))
+
+        assert summary["failed"] == [{"season": 2023, "week": 1}]
+        assert (2023, 1, "completed") not in _statuses(engine)
+        assert (2023, 2, "completed") in _statuses(engine)
+
+    def test_season_stats_rebuilt_once_after_all_weeks_land(self):
+        events = []
+
+        async def update_all(season, week, **kwargs):
+            events.append(("week", season, week))
+            return await _games_ok(season, week)
+
+        engine, service = _engine(update_all)
+        service.fetch_team_stats.side_effect = lambda season, **kwargs: events.append(("rebuild", season))
+        engine._checkpoint.side_effect = (
+            lambda season, week, status, **kwargs: events.append((status, season, week))
+        )
+
+        asyncio.run(engine.run([2022, 2023], weeks=range(1, 4)))
+
+        rebuilt = [call.args[0] for call in service.fetch_team_stats.await_args_list]
+        assert rebuilt == [2022, 2023]
+        assert service.fetch_team_stats.await_args.kwargs == {"include_upstream": False}
+        for season in (2022, 2023):
+            rebuild = events.index(("rebuild", season))
+            # After every week of the season lands, and before any of them is completed
+            assert max(events.index(("week", season, week)) for week in range(1, 4)) < rebuild
+            assert min(events.index(("completed", season, week)) for week in range(1, 4)) > rebuild
+
+    def test_finished_season_survives_an_interrupted_run(self):
+        async def update_all(season, week, **kwargs):
+            if season == 2023:
+                raise asyncio.CancelledError()
+            return await _games_ok(season, week)
+
+        engine, _ = _engine(update_all)
+        engine.concurrency = 1
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(engine.run([2022, 2023], weeks=range(1, 3)))
+
+        assert {(2022, 1, "completed"), (2022, 2, "completed")} <= _statuses(engine)
+        assert not any(season == 2023 and status == "completed" for season, _, status in _statuses(engine))
+
+    def test_failed_rebuild_leaves_weeks_to_retry(self):
+        engine, service = _engine(_games_ok)
+        service.fetch_team_stats.side_effect = RuntimeError("db gone")
+
+        summary = asyncio.run(engine.run([2023], weeks=range(1, 3)))
+
+        assert summary["completed"] == 0
+        assert summary["games_written"] == 0
+        assert {(2023, 1, "failed"), (2023, 2, "failed")} <= _statuses(engine)
+        assert not any(status == "completed" for _, _, status in _statuses(engine))
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Burst capacity and pacing"""
+
+    def test_burst_up_to_capacity_then_paced(self):
+        bucket = TokenBucket(rate=50, capacity=2)
+
+        async def take(n):
+            return [await bucket.acquire() for _ in range(n)]
+
+        started = time.monotonic()
+        waits = asyncio.run(take(3))
+        elapsed = time.monotonic() - started
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] > 0
+        assert elapsed >= 0.015
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
@@ -0,0 +1,109 @@
+"""
+Tests for set-based ingestion writers
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from services.bulk_writer import BulkWriter, GAME_COLUMNS, _dedupe, _unnest, fingerprint
+
+
+@pytest.mark.unit
+class TestBulkWriter:
+    """Test bulk upsert helpers"""
+
+    def test_unnest_casts_each_column_to_array(self):
+        """Each column is bound as one typed array parameter"""
+        clause = _unnest((("team_id", "INTEGER"), ("player_name", "VARCHAR")))
+        assert clause == (
+            "UNNEST(CAST(:team_id AS INTEGER[]), CAST(:player_name AS VARCHAR[])) "
+            "AS u(team_id, player_name)"
+        )
+
+    def test_dedupe_keeps_last_row_per_key(self):
+        """Duplicate conflict keys collapse to the latest row"""
+        rows = [
+            {"espn_game_id": "1", "home_score": 7},
+            {"espn_game_id": "2", "home_score": 3},
+            {"espn_game_id": "1", "home_score": 14},
+            {"espn_game_id": None, "home_score": 0},
+        ]
+        deduped = _dedupe(rows, ("espn_game_id",))
+        assert len(deduped) == 3
+        assert {"espn_game_id": "1", "home_score": 14} in deduped
+        assert {"espn_game_id": None, "home_score": 0} in deduped
+
+    def test_upsert_games_single_statement(self):
+        """A week of games is written in one statement with counts preserved"""
+        session = Mock()
+        session.execute = AsyncMock(return_value=[
+            Mock(inserted=True), Mock(inserted=False), Mock(inserted=True)
+        ])
+        rows = [{"espn_game_id": str(i), "season": 2024, "week": 1} for i in range(3)]
+
+        inserted, updated, unchanged = asyncio.run(BulkWriter().upsert_games(session, rows))
+
+        assert (inserted, updated, unchanged) == (2, 1, 0)
+        assert session.execute.await_count == 1
+        params = session.execute.await_args.args[1]
+        assert set(params) == {name for name, _ in GAME_COLUMNS}
+        assert params["espn_game_id"] == ["0", "1", "2"]
+
+    def test_unchanged_rows_are_counted(self):
+        """Rows skipped by the fingerprint guard are reported as unchanged"""
+        session = Mock()
+        session.execute = AsyncMock(return_value=[Mock(inserted=False)])
+        rows = [{"espn_game_id": str(i), "home_score": 7} for i in range(4)]
+
+        result = asyncio.run(BulkWriter().upsert_games(session, rows))
+
+        assert result == (0, 1, 3)
+        hashes = session.execute.await_args.args[1]["payload_hash"]
+        assert len(set(hashes)) == 4
+
+    def test_fingerprint_ignores_float_noise(self):
+        """Equivalent rows hash the same; real changes do not"""
+        row = {"espn_game_id": "1", "spread": -3.5, "home_score": 10}
+        noisy = {**row, "spread": -3.5000000001}
+        changed = {**row, "home_score": 13}
+
+        assert fingerprint(row, GAME_COLUMNS) == fingerprint(noisy, GAME_COLUMNS)
+        assert fingerprint(row, GAME_COLUMNS) != fingerprint(changed, GAME_COLUMNS)
+
+    def test_merge_injuries_reports_affected_teams(self):
+        """Only teams with inserted, updated or removed injuries are reported"""
+        session = Mock()
+        session.execute = AsyncMock(return_value=[
+            Mock(team_id=3, action="inserted"),
+            Mock(team_id=3, action="updated"),
+            Mock(team_id=9, action="removed"),
+        ])
+        rows = [
+            {"player_name": "A", "team_id": 3, "season": 2024, "status": "Out"},
+            {"player_name": "B", "team_id": 3, "season": 2024, "status": "Questionable"},
+            {"player_name": "C", "team_id": 5, "season": 2024, "status": "Out"},
+            {"player_name": None, "team_id": 5, "season": 2024, "status": "Out"},
+        ]
+
+        result = asyncio.run(BulkWriter().merge_injuries(session, 2024, rows))
+
+        assert result == {
+            "inserted": 1,
+            "updated": 1,
+            "removed": 1,
+            "unchanged": 1,
+            "affected_teams": [3, 9],
+        }
+        params = session.execute.await_args.args[1]
+        assert params["season"] == 2024
+        assert params["player_name"] == ["A", "B", "C"]
+
+    def test_empty_feed_skips_database(self):
+        """No statement is issued when a feed returns nothing"""
+        session = Mock()
+        session.execute = AsyncMock()
+
+        assert asyncio.run(BulkWriter().record_line_changes(session, [])) == (0, [])
+        session.execute.assert_not_awaited()
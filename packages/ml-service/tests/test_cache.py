@@ -0,0 +1,141 @@
+"""
+Tests for the in-process cache tier in front of Redis
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from utils import codec
+from utils.cache import INVALIDATION_CHANNEL, LocalCache, TieredCache
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """LRU and TTL behaviour"""
+
+    def test_evicts_least_recently_used(self):
+        local = LocalCache(max_entries=2)
+        local.set("a", 1, 60)
+        local.set("b", 2, 60)
+        local.get("a")
+        local.set("c", 3, 60)
+
+        assert local.get("b") == (False, None)
+        assert local.get("a") == (True, 1)
+        assert local.metrics["evictions"] == 1
+
+    def test_expired_entries_miss(self):
+        local = LocalCache()
+        local.set("a", 1, 0)
+
+        assert local.get("a") == (False, None)
+        assert len(local) == 0
+
+
+@pytest.mark.unit
+class TestTieredCache:
+    """Local tier, Redis fallback and cross-worker invalidation"""
+
+    def test_caches_locally_without_redis(self):
+        tiered = TieredCache(LocalCache())
+        with patch("utils.cache.get_redis", return_value=None):
+            asyncio.run(tiered.set("key", {"value": 1}, 60))
+            assert asyncio.run(tiered.get("key", 60)) == {"value": 1}
+
+    def test_redis_hit_is_decoded_once(self):
+        redis = AsyncMock()
+        redis.get.return_value = json.dumps({"value": 1})
+        tiered = TieredCache(LocalCache())
+
+        with patch("utils.cache.get_redis", return_value=redis):
+            first = asyncio.run(tiered.get("key", 60))
+            second = asyncio.run(tiered.get("key", 60))
+
+        assert first == second == {"value": 1}
+        redis.get.assert_awaited_once_with("key")
+        assert tiered.metrics["redis_hits"] == 1
+
+    def test_redis_errors_fall_through_to_a_miss(self):
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError("down")
+        tiered = TieredCache(LocalCache())
+
+        with patch("utils.cache.get_redis", return_value=redis):
+            assert asyncio.run(tiered.get("key", 60)) is None
+        assert tiered.metrics["redis_errors"] == 1
+
+    def test_delete_publishes_invalidation_for_other_workers(self):
+        redis = AsyncMock()
+        writer, reader = TieredCache(LocalCache()), TieredCache(LocalCache())
+        reader.local.set("key", "stale", 60)
+
+        with patch("utils.cache.get_redis", return_value=redis):
+            asyncio.run(writer.delete("key"))
+
+        channel, message = redis.publish.await_args.args
+        assert channel == INVALIDATION_CHANNEL
+        writer.handle_invalidation(message)
+        reader.handle_invalidation(message)
+
+        assert reader.local.get("key") == (False, None)
+        assert writer.metrics["invalidations_received"] == 0
+        assert reader.metrics["invalidations_received"] == 1
+
+    def test_batch_read_sends_only_local_misses_in_one_mget(self):
+        redis = AsyncMock()
+        redis.mget.return_value = [codec.pack(b'{"game_id":2}'), None]
+        tiered = TieredCache(LocalCache())
+        tiered.local.set("game:1", b'{"game_id":1}', 60)
+
+        with patch("utils.cache.get_redis_bytes", return_value=redis):
+            found = asyncio.run(tiered.get_many_bytes(["game:1", "game:2", "game:3"], 60))
+
+        assert found == {"game:1": b'{"game_id":1}', "game:2": b'{"game_id":2}'}
+        redis.mget.assert_awaited_once_with(["game:2", "game:3"])
+        assert tiered.local.get("game:2") == (True, b'{"game_id":2}')
+
+    def test_batch_write_is_one_pipeline(self):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        tiered = TieredCache(LocalCache())
+
+        with patch("utils.cache.get_redis_bytes", return_value=redis):
+            asyncio.run(tiered.set_many_bytes({"game:1": b"1", "game:2": b"2"}, 900))
+
+        redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_awaited_once()
+        assert tiered.local.get("game:1") == (True, b"1")
+
+
+@pytest.mark.unit
+class TestCodec:
+    """Stored payload framing"""
+
+    def test_round_trip(self):
+        body = codec.dumps([{"game_id": 1, "confidence": 0.61}] * 100)
+
+        assert codec.unpack(codec.pack(body)) == body
+        assert codec.loads(codec.pack(body))[0] == {"game_id": 1, "confidence": 0.61}
+
+    def test_plain_json_from_before_the_codec_is_readable(self):
+        assert codec.unpack(b'{"game_id": 1}') == b'{"game_id": 1}'
+
+    def test_bytes_hit_returns_stored_body_without_decoding(self):
+        redis = AsyncMock()
+        body = codec.dumps({"game_id": 1})
+        redis.get.return_value = codec.pack(body)
+        tiered = TieredCache(LocalCache())
+
+        with patch("utils.cache.get_redis_bytes", return_value=redis):
+            assert asyncio.run(tiered.get_bytes("key", 60)) == body
+            assert asyncio.run(tiered.get_bytes("key", 60)) == body
+
+        redis.get.assert_awaited_once_with("key")
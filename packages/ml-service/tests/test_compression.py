@@ -0,0 +1,50 @@
+"""
+Tests for negotiated response compression
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils import compression
+from utils.compression import CompressionMiddleware, choose_encoding
+
+def _client(minimum_size=100):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get("/large")
+    async def large():
+        return {"values": list(range(200))}
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    return TestClient(app)
+
+@pytest.mark.unit
+class TestCompression:
+    """Encoding negotiation and the size threshold"""
+
+    def test_choose_encoding_honours_quality(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", None)
+
+        assert choose_encoding("gzip, deflate") == "gzip"
+        assert choose_encoding("gzip;q=0") is None
+        assert choose_encoding("*") == "gzip"
+        assert choose_encoding("") is None
+
+    def test_large_json_is_gzipped(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", None)
+        response = _client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json()["values"][-1] == 199
+
+    def test_small_or_unaccepted_responses_are_not_compressed(self):
+        client = _client()
+
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
@@ -0,0 +1,119 @@
+"""
+Tests for the cached season/week context
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from services.context_resolver import (
+    CONTEXT_CACHE_KEY,
+    MIN_CONTEXT_TTL,
+    SeasonContextResolver,
+    seconds_until_week_rollover,
+)
+
+
+def _redis(value=None, ttl=-2):
+    redis = AsyncMock()
+    redis.get.return_value = value
+    redis.ttl.return_value = ttl
+    return redis
+
+
+@pytest.mark.unit
+class TestSeasonContextResolver:
+    """Redis, in-flight and schedule fallback paths"""
+
+    def test_redis_hit_is_remembered_no_longer_than_its_ttl(self):
+        resolver = SeasonContextResolver()
+        redis = _redis(json.dumps({"season": 2024, "week": 9}), ttl=120)
+        fetcher = AsyncMock()
+
+        with patch("services.context_resolver.get_redis", return_value=redis):
+            started = time.monotonic()
+            context = asyncio.run(resolver.resolve(fetcher))
+
+        assert context == (2024, 9)
+        fetcher.assert_not_awaited()
+        assert resolver._expires_at - started <= 121
+
+    def test_concurrent_misses_share_one_scoreboard_fetch(self):
+        resolver = SeasonContextResolver()
+        calls = []
+
+        async def fetcher():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 2024, 10
+
+        async def scenario():
+            return await asyncio.gather(*(resolver.resolve(fetcher) for _ in range(5)))
+
+        redis = _redis()
+        with patch("services.context_resolver.get_redis", return_value=redis):
+            contexts = asyncio.run(scenario())
+
+        assert contexts == [(2024, 10)] * 5
+        assert calls == [1]
+        key, ttl, payload = redis.setex.await_args.args
+        assert key == CONTEXT_CACHE_KEY
+        assert abs(ttl - seconds_until_week_rollover()) <= 1
+        assert json.loads(payload) == {"season": 2024, "week": 10}
+
+    def test_cancelled_refresh_does_not_strand_waiters(self):
+        """When the task refreshing the context is cancelled, a waiter takes over"""
+        resolver = SeasonContextResolver()
+        calls = []
+
+        async def fetcher():
+            calls.append(1)
+            if len(calls) == 1:
+                await asyncio.sleep(10)
+            return 2024, 12
+
+        async def scenario():
+            owner = asyncio.create_task(resolver.resolve(fetcher))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(resolver.resolve(fetcher))
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            context = await asyncio.wait_for(waiter, timeout=1)
+            with pytest.raises(asyncio.CancelledError):
+                await owner
+            return context
+
+        with patch("services.context_resolver.get_redis", return_value=_redis()):
+            context = asyncio.run(scenario())
+
+        assert context == (2024, 12)
+        assert calls == [1, 1]
+        assert resolver._inflight is None
+
+    def test_scoreboard_failure_falls_back_to_schedule_briefly(self):
+        resolver = SeasonContextResolver()
+        fetcher = AsyncMock(side_effect=ConnectionError("down"))
+        resolver._from_schedule = AsyncMock(return_value=(2024, 11))
+        redis = _redis()
+
+        with patch("services.context_resolver.get_redis", return_value=redis):
+            started = time.monotonic()
+            context = asyncio.run(resolver.resolve(fetcher))
+
+        assert context == (2024, 11)
+        assert redis.setex.await_args.args[1] == MIN_CONTEXT_TTL
+        assert resolver._expires_at - started <= MIN_CONTEXT_TTL + 1
+
+    def test_fallback_read_back_from_redis_keeps_short_ttl(self):
+        """Another worker's schedule fallback is not held locally until rollover"""
+        resolver = SeasonContextResolver()
+        redis = _redis(json.dumps({"season": 2024, "week": 11}), ttl=MIN_CONTEXT_TTL)
+
+        with patch("services.context_resolver.get_redis", return_value=redis):
+            started = time.monotonic()
+            asyncio.run(resolver.resolve(AsyncMock()))
+
+        assert resolver._expires_at - started <= MIN_CONTEXT_TTL + 1
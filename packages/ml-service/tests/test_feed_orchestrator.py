@@ -0,0 +1,68 @@
+"""
+Tests for concurrent feed orchestration
+"""
+
+import asyncio
+
+import pytest
+
+from services.data_service import DataService
+from services.feed_orchestrator import FeedOrchestrator
+
+
+@pytest.mark.unit
+class TestFeedOrchestrator:
+    """Test feed orchestration"""
+
+    def test_feeds_run_concurrently_and_failures_are_isolated(self):
+        """A failing feed is reported without cancelling the others"""
+        order = []
+
+        async def games():
+            await asyncio.sleep(0.05)
+            order.append("games")
+            return {"inserted": 1}
+
+        async def stats():
+            order.append("stats")
+            return {"processed": 32}
+
+        async def injuries():
+            raise RuntimeError("upstream down")
+
+        async def odds():
+            order.append("odds")
+            return {"processed": 4}
+
+        results, timings, failed = asyncio.run(FeedOrchestrator().run(
+            {"games": games, "team_stats": stats, "injuries": injuries, "odds": odds},
+            depends_on={"odds": "games"}
+        ))
+
+        assert order == ["stats", "games", "odds"]
+        assert failed == ["injuries"]
+        assert results["injuries"] == {"status": "error", "error": "upstream down"}
+        assert results["games"] == {"inserted": 1}
+        assert set(timings) == {"games", "team_stats", "injuries", "odds"}
+
+    def test_update_all_derives_team_stats_after_games_commit(self):
+        """team_stats aggregates stored games, so it starts only once the games feed is done"""
+        order = []
+
+        async def fetch_games(season, week, **kwargs):
+            await asyncio.sleep(0.02)
+            order.append("games")
+            return {"inserted": 1}
+
+        async def fetch_team_stats(season, week):
+            order.append("team_stats")
+            return {"processed": 32}
+
+        service = DataService()
+        service.fetch_games = fetch_games
+        service.fetch_team_stats = fetch_team_stats
+
+        result = asyncio.run(service.update_all(season=2024, week=3, historical=True))
+
+        assert order == ["games", "team_stats"]
+        assert result["failed_feeds"] == []
@@ -0,0 +1,47 @@
+"""
+Tests for in-memory odds-to-game matching
+"""
+
+from datetime import datetime
+
+import pytest
+
+from services.game_matcher import GameMatchIndex, normalize_team_name
+
+
+@pytest.mark.unit
+class TestGameMatchIndex:
+    """Test game matching index"""
+
+    @pytest.fixture
+    def index(self):
+        return GameMatchIndex([
+            {
+                "id": 1,
+                "home_team": "Washington Commanders",
+                "away_team": "Dallas Cowboys",
+                "game_date": datetime(2024, 11, 24, 18, 0),
+            },
+            {
+                "id": 2,
+                "home_team": "Kansas City Chiefs",
+                "away_team": "Buffalo Bills",
+                "game_date": datetime(2024, 11, 25, 1, 15),
+            },
+        ])
+
+    def test_normalize_resolves_aliases(self):
+        """Provider names and legacy names normalize to the stored display name"""
+        assert normalize_team_name("Washington Football Team") == "washington commanders"
+        assert normalize_team_name("  Kansas  City Chiefs ") == "kansas city chiefs"
+        assert normalize_team_name("St. Louis Rams") == "los angeles rams"
+
+    def test_match_within_tolerance_across_date_bucket(self, index):
+        """Kickoffs near midnight UTC still match games in the adjacent bucket"""
+        assert index.match("Kansas City Chiefs", "Buffalo Bills", datetime(2024, 11, 24, 23, 0)) == 2
+        assert index.match("Washington Football Team", "Dallas Cowboys", datetime(2024, 11, 24, 18, 0)) == 1
+
+    def test_unmatched_when_outside_tolerance_or_reversed(self, index):
+        """Reversed home/away or a kickoff a day away is not a match"""
+        assert index.match("Dallas Cowboys", "Washington Commanders", datetime(2024, 11, 24, 18, 0)) is None
+        assert index.match("Kansas City Chiefs", "Buffalo Bills", datetime(2024, 11, 26, 2, 0)) is None
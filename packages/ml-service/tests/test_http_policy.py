@@ -0,0 +1,153 @@
+"""
+Tests for upstream rate limiting, retries and circuit breaking
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import ClientResponseError
+from unittest.mock import AsyncMock, Mock
+
+from utils.http_policy import CircuitBreaker, CircuitOpenError, UpstreamPolicyRegistry, redact_url
+
+
+class _FakeResponse:
+    def __init__(self, status, payload=None):
+        self.status = status
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise ClientResponseError(Mock(), (), status=self.status, headers={})
+
+    async def json(self):
+        return self.payload
+
+
+class _FakeHttp:
+    def __init__(self, statuses, payload_error=None):
+        self.statuses = list(statuses)
+        self.payload_error = payload_error
+        self.calls = 0
+
+    def get(self, url):
+        self.calls += 1
+        response = _FakeResponse(self.statuses.pop(0), {"ok": True})
+        if self.payload_error is not None:
+            response.json = AsyncMock(side_effect=self.payload_error)
+        return response
+
+
+def _registry(**settings):
+    policy = {"rate": 1000.0, "burst": 1000, "backoff_base": 0.0, **settings}
+    return UpstreamPolicyRegistry({"upstream.test": policy})
+
+
+@pytest.mark.unit
+class TestUpstreamPolicy:
+    """Test per-host upstream policies"""
+
+    def test_transient_errors_are_retried(self):
+        """A 503 followed by a 200 succeeds and counts one retry"""
+        registry = _registry(max_retries=2)
+        http = _FakeHttp([503, 200])
+
+        payload = asyncio.run(registry.get_json(http, "https://upstream.test/scoreboard"))
+
+        assert payload == {"ok": True}
+        assert http.calls == 2
+        assert registry.metrics()["upstream.test"]["retries"] == 1
+
+    def test_client_errors_are_not_retried(self):
+        """A 404 is raised immediately"""
+        registry = _registry(max_retries=3)
+        http = _FakeHttp([404])
+
+        with pytest.raises(ClientResponseError):
+            asyncio.run(registry.get_json(http, "https://upstream.test/missing"))
+        assert http.calls == 1
+
+    def test_open_circuit_fails_fast(self):
+        """Once the breaker opens, requests are rejected without calling upstream"""
+        registry = _registry(max_retries=0, failure_threshold=2, reset_timeout=60.0)
+        http = _FakeHttp([500, 500])
+
+        for _ in range(2):
+            with pytest.raises(ClientResponseError):
+                asyncio.run(registry.get_json(http, "https://upstream.test/odds"))
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(registry.get_json(http, "https://upstream.test/odds"))
+
+        metrics = registry.metrics()["upstream.test"]
+        assert http.calls == 2
+        assert metrics["circuit_state"] == "open"
+        assert metrics["circuit_rejections"] == 1
+
+    def test_half_open_trial_closes_breaker(self):
+        """A successful trial after the reset timeout closes the circuit"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_unparseable_trial_reopens_breaker(self):
+        """A half-open trial that fails outside the HTTP layer still records a failure"""
+        registry = _registry(max_retries=0, failure_threshold=1, reset_timeout=0.0)
+        policy = registry.for_url("https://upstream.test/odds")
+        policy.breaker.record_failure()
+
+        with pytest.raises(ValueError):
+            asyncio.run(registry.get_json(_FakeHttp([200], ValueError("bad json")), "https://upstream.test/odds"))
+
+        assert policy.breaker.state == "open"
+        payload = asyncio.run(registry.get_json(_FakeHttp([200]), "https://upstream.test/odds"))
+        assert payload == {"ok": True}
+        assert policy.breaker.state == "closed"
+
+    def test_cancelled_trial_does_not_block_host(self):
+        """A cancelled half-open trial frees the slot for the next request"""
+        registry = _registry(max_retries=0, failure_threshold=1, reset_timeout=0.0)
+        policy = registry.for_url("https://upstream.test/odds")
+        policy.breaker.record_failure()
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(registry.get_json(
+                _FakeHttp([200], asyncio.CancelledError()), "https://upstream.test/odds"
+            ))
+
+        assert policy.breaker.state == "open"
+        assert policy.breaker.allow()
+
+    def test_trial_cancelled_while_throttled_does_not_block_host(self):
+        """Cancelling a half-open trial that is still waiting on the rate limit frees the slot"""
+        registry = _registry(rate=1.0, burst=1, max_retries=0, failure_threshold=1, reset_timeout=0.0)
+        policy = registry.for_url("https://upstream.test/odds")
+        policy.bucket._tokens = 0
+        policy.breaker.record_failure()
+        http = _FakeHttp([200])
+
+        async def scenario():
+            request = asyncio.create_task(registry.get_json(http, "https://upstream.test/odds"))
+            await asyncio.sleep(0.01)
+            assert policy.breaker.state == "half_open"
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+
+        asyncio.run(scenario())
+
+        assert http.calls == 0
+        assert policy.breaker.state == "open"
+        assert policy.breaker.allow()
+
+    def test_redact_url_hides_keys(self):
+        """API keys never reach the logs"""
+        assert redact_url("https://x/odds?apiKey=secret&regions=us") == "https://x/odds?apiKey=***&regions=us"
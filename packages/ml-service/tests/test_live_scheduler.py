@@ -0,0 +1,43 @@
+"""
+Tests for live game polling cadence
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.live_scheduler import next_poll_interval
+
+
+NOW = datetime(2024, 10, 13, 16, 0)
+
+
+@pytest.mark.unit
+class TestNextPollInterval:
+    """Test polling cadence selection"""
+
+    def test_live_game_polls_fastest(self):
+        """Any in-progress game switches to the live cadence"""
+        games = [
+            {"status": "final", "game_date": NOW - timedelta(hours=4)},
+            {"status": "in_progress", "game_date": NOW - timedelta(hours=1)},
+        ]
+        assert next_poll_interval(games, NOW) == 30
+
+    def test_upcoming_kickoff_polls_every_few_minutes(self):
+        """Kickoffs inside the pregame window use the pregame cadence"""
+        games = [{"status": "scheduled", "game_date": NOW + timedelta(hours=2)}]
+        assert next_poll_interval(games, NOW) == 300
+
+    def test_idle_wakes_before_pregame_window(self):
+        """Idle polling is shortened so the pregame window is not missed"""
+        games = [{"status": "scheduled", "game_date": NOW + timedelta(hours=3, minutes=20)}]
+        assert next_poll_interval(games, NOW) == 1200
+
+        later = [{"status": "scheduled", "game_date": NOW + timedelta(days=3)}]
+        assert next_poll_interval(later, NOW) == 3600
+
+    def test_finished_week_is_idle(self):
+        """A week with no remaining games polls hourly"""
+        games = [{"status": "final", "game_date": NOW - timedelta(hours=6)}]
+        assert next_poll_interval(games, NOW) == 3600
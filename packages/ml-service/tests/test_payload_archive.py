@@ -0,0 +1,38 @@
+"""
+Tests for the raw upstream payload archive
+"""
+
+import pytest
+
+from services.payload_archive import PayloadArchive, ReplayMissError
+
+
+@pytest.mark.unit
+class TestPayloadArchive:
+    """Test payload storage, deduplication and replay lookup"""
+
+    def test_identical_payloads_share_one_object(self, tmp_path):
+        """Content is stored once while every fetch is indexed"""
+        archive = PayloadArchive(tmp_path)
+        url = "https://api.the-odds-api.com/v4/odds?apiKey=secret"
+
+        first = archive.store({"b": 1, "a": [1, 2]}, url=url, feed="odds", season=2024, week=3)
+        second = archive.store({"a": [1, 2], "b": 1}, url=url, feed="odds", season=2024, week=3)
+
+        assert first == second
+        assert len(list((tmp_path / "objects").rglob("*.json.gz"))) == 1
+        entries = archive.entries(feed="odds", season=2024)
+        assert len(entries) == 2
+        assert entries[0]["url"].endswith("apiKey=***")
+
+    def test_latest_for_url_returns_newest_payload(self, tmp_path):
+        """Replay resolves a URL to its most recent archived payload"""
+        archive = PayloadArchive(tmp_path)
+        url = "https://site.api.espn.com/scoreboard?week=3"
+
+        archive.store({"events": []}, url=url, feed="scoreboard")
+        archive.store({"events": [{"id": "1"}]}, url=url, feed="scoreboard")
+
+        assert archive.latest_for_url(url) == {"events": [{"id": "1"}]}
+        with pytest.raises(ReplayMissError):
+            archive.latest_for_url("https://site.api.espn.com/scoreboard?week=4")
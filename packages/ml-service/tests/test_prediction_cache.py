@@ -0,0 +1,105 @@
+"""
+Tests for prediction cache versioning and invalidation when betting lines move
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from services import prediction_cache
+from services.data_service import DataService
+
+ODDS_EVENT = {
+    "id": "evt-1",
+    "home_team": "Kansas City Chiefs",
+    "away_team": "Baltimore Ravens",
+    "commence_time": "2024-09-06T00:20:00Z",
+    "bookmakers": [{
+        "key": "draftkings",
+        "markets": [{
+            "key": "h2h",
+            "outcomes": [{"type": "home", "price": -150}, {"type": "away", "price": 130}],
+        }],
+    }],
+}
+
+
+@pytest.mark.unit
+class TestModelVersion:
+    """The cache-key version is computed on load or retrain, not per key"""
+
+    def test_keys_reuse_the_stored_version_until_refreshed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(prediction_cache, "MODELS_DIR", tmp_path)
+        monkeypatch.setattr(prediction_cache, "_model_version", None)
+        monkeypatch.setenv("MODEL_VERSION", "2.0.0")
+        (tmp_path / "rf_model.joblib").write_bytes(b"model")
+
+        first = prediction_cache.game_prediction_key(1)
+        with patch.object(Path, "glob", side_effect=AssertionError("filesystem on the key path")):
+            assert prediction_cache.game_prediction_key(1) == first
+            assert prediction_cache.upcoming_predictions_key().endswith(prediction_cache.model_version())
+
+        retrained = tmp_path / "xgb_model.joblib"
+        retrained.write_bytes(b"model")
+        os.utime(retrained, (2_000_000_000, 2_000_000_000))
+        version = prediction_cache.refresh_model_version()
+
+        assert version == f"2.0.0.{2_000_000_000:x}"
+        assert prediction_cache.game_prediction_key(1) != first
+
+
+@pytest.mark.unit
+class TestLineChangeInvalidation:
+    """Games whose lines changed lose their cached predictions"""
+
+    def test_invalidate_game_predictions_drops_game_week_and_upcoming_keys(self):
+        session = Mock()
+        result = Mock()
+        result.fetchall.return_value = [
+            SimpleNamespace(game_id=7, season=2024, week=1),
+            SimpleNamespace(game_id=9, season=2024, week=1),
+        ]
+        session.execute = AsyncMock(return_value=result)
+
+        with patch.object(prediction_cache, "model_version", return_value="1.0.0.a"), \
+                patch.object(prediction_cache.cache, "delete", AsyncMock()) as delete:
+            invalidated = asyncio.run(prediction_cache.invalidate_game_predictions(session, [9, 7, 7]))
+
+        assert invalidated == [7, 9]
+        assert session.execute.await_args.args[1] == {"game_ids": [7, 9]}
+        assert set(delete.await_args.args) == {
+            "ml:predictions:upcoming:1.0.0.a",
+            "ml:prediction:game:7:1.0.0.a",
+            "ml:prediction:game:9:1.0.0.a",
+            "ml:predictions:week:2024:1:1.0.0.a",
+        }
+
+    def test_no_changed_games_skips_database_and_cache(self):
+        session = Mock()
+        session.execute = AsyncMock()
+
+        with patch.object(prediction_cache.cache, "delete", AsyncMock()) as delete:
+            assert asyncio.run(prediction_cache.invalidate_game_predictions(session, [])) == []
+
+        session.execute.assert_not_awaited()
+        delete.assert_not_awaited()
+
+    def test_odds_fetch_invalidates_games_whose_lines_changed(self):
+        service = DataService()
+        service.odds_api_key = "key"
+        service._fetch_json = AsyncMock(return_value=[ODDS_EVENT])
+        service._load_game_match_index = AsyncMock(return_value=Mock(match=Mock(return_value=7)))
+        service.bulk_writer.record_line_changes = AsyncMock(return_value=(1, [7]))
+        session = AsyncMock()
+
+        with patch("services.data_service.invalidate_game_predictions", AsyncMock(return_value=[7])) as invalidate:
+            summary = asyncio.run(service.fetch_betting_odds(2024, 1, session=session))
+
+        invalidate.assert_awaited_once_with(session, [7])
+        session.commit.assert_awaited_once()
+        assert summary["processed"] == 1
+        assert summary["invalidated_games"] == [7]
@@ -0,0 +1,65 @@
+"""
+Tests for conditional GETs on cached prediction sets
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import predictions
+from api.predictions import _etag, _etag_matches
+
+BODY = b'[{"game_id":1,"home_team":"Home","away_team":"Away","confidence":0.6}]'
+
+def _client():
+    app = FastAPI()
+    app.include_router(predictions.router, prefix="/api/predictions")
+    return TestClient(app)
+
+@pytest.mark.unit
+class TestPredictionETags:
+    """ETag derivation and If-None-Match handling"""
+
+    def test_etag_tracks_body_fields_and_model_version(self):
+        with patch("api.predictions.model_version", return_value="1.0.0.a"):
+            etag = _etag(BODY)
+            assert etag.startswith('W/"1.0.0.a-')
+            assert _etag(BODY) == etag
+            assert _etag(BODY + b" ") != etag
+            assert _etag(BODY, ["game_id", "confidence"]) != etag
+        with patch("api.predictions.model_version", return_value="1.0.0.b"):
+            assert _etag(BODY) != etag
+
+    def test_if_none_match_uses_weak_comparison(self):
+        etag = 'W/"1.0.0-abc"'
+
+        assert _etag_matches('"1.0.0-abc"', etag)
+        assert _etag_matches('W/"other", W/"1.0.0-abc"', etag)
+        assert _etag_matches("*", etag)
+        assert not _etag_matches('W/"1.0.0-abd"', etag)
+        assert not _etag_matches(None, etag)
+
+    def test_repeat_poll_gets_304_without_body(self):
+        with patch.object(predictions.cache, "get_bytes", AsyncMock(return_value=BODY)):
+            client = _client()
+            first = client.get("/api/predictions/upcoming")
+            repeat = client.get("/api/predictions/upcoming", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "public, no-cache"
+        assert repeat.status_code == 304
+        assert repeat.content == b""
+        assert repeat.headers["etag"] == first.headers["etag"]
+
+    def test_projection_has_its_own_etag(self):
+        with patch.object(predictions.cache, "get_bytes", AsyncMock(return_value=BODY)):
+            client = _client()
+            full = client.get("/api/predictions/weekly?week=1&season=2024")
+            projected = client.get(
+                "/api/predictions/weekly?week=1&season=2024&fields=confidence",
+                headers={"If-None-Match": full.headers["etag"]},
+            )
+
+        assert projected.status_code == 200
+        assert projected.json() == [{"game_id": 1, "confidence": 0.6}]
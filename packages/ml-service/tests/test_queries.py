@@ -0,0 +1,50 @@
+"""
+Tests for the named query registry
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from utils.queries import QueryRegistry
+
+
+@pytest.mark.unit
+class TestQueryRegistry:
+    """Registration and latency recording for hot queries"""
+
+    def test_register_is_idempotent_for_same_sql(self):
+        registry = QueryRegistry()
+        first = registry.register("lookup", "SELECT 1")
+
+        assert registry.register("lookup", "SELECT 1") is first
+        with pytest.raises(ValueError):
+            registry.register("lookup", "SELECT 2")
+
+    def test_execute_reuses_statement_and_records_latency(self):
+        registry = QueryRegistry()
+        query = registry.register("lookup", "SELECT :value")
+        session = AsyncMock()
+
+        asyncio.run(query.execute(session, {"value": 1}))
+        asyncio.run(query.execute(session, {"value": 2}))
+
+        statements = {call.args[0] for call in session.execute.call_args_list}
+        assert statements == {query.statement}
+        metrics = registry.metrics()["lookup"]
+        assert metrics["calls"] == 2
+        assert metrics["failures"] == 0
+        assert metrics["first_ms"] is not None
+
+    def test_failures_are_counted_and_raised(self):
+        registry = QueryRegistry()
+        query = registry.register("lookup", "SELECT 1")
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(query.execute(session))
+
+        assert registry.metrics()["lookup"]["failures"] == 1
+        assert registry.metrics()["lookup"]["calls"] == 1
@@ -0,0 +1,115 @@
+"""
+Tests for read replica routing
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from utils.database import ReplicaRouter
+
+
+def _factory(lag=None, error=None, connect_delay=0.0):
+    session = AsyncMock()
+    if error:
+        session.execute.side_effect = error
+    else:
+        result = MagicMock()
+        result.scalar_one.return_value = lag
+        session.execute.return_value = result
+    async def connect():
+        await asyncio.sleep(connect_delay)
+        return session
+
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(side_effect=connect)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context)
+
+
+async def _route_after_probe(router):
+    """Route once to start the lag check, let it finish, then route again"""
+    await router.session_factory()
+    if router._probe is not None:
+        await router._probe
+    return await router.session_factory()
+
+
+@pytest.mark.unit
+class TestReplicaRouter:
+    """Replica selection and the lag guard"""
+
+    def test_without_replica_reads_use_primary(self):
+        primary = _factory()
+        router = ReplicaRouter(None, primary)
+
+        assert asyncio.run(router.session_factory()) is primary
+        assert router.state["configured"] is False
+
+    def test_fresh_replica_serves_reads(self):
+        replica, primary = _factory(lag=0.5), _factory()
+        router = ReplicaRouter(replica, primary, max_lag=5)
+
+        assert asyncio.run(_route_after_probe(router)) is replica
+        assert router.state["lag_seconds"] == 0.5
+        assert router.state["replica_reads"] == 1
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        replica, primary = _factory(lag=30), _factory()
+        router = ReplicaRouter(replica, primary, max_lag=5)
+
+        assert asyncio.run(_route_after_probe(router)) is primary
+        assert router.state["primary_fallbacks"] == 2
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        replica, primary = _factory(error=OSError("connection refused")), _factory()
+        router = ReplicaRouter(replica, primary)
+
+        assert asyncio.run(_route_after_probe(router)) is primary
+        assert router.state["healthy"] is False
+
+    def test_lag_is_checked_at_most_once_per_interval(self):
+        replica, primary = _factory(lag=0), _factory()
+        router = ReplicaRouter(replica, primary, check_interval=60)
+
+        async def scenario():
+            for _ in range(3):
+                await _route_after_probe(router)
+
+        asyncio.run(scenario())
+
+        # One call for the lag check, none for the routed reads themselves
+        assert replica.call_count == 1
+
+    def test_reads_do_not_wait_for_a_pending_check(self):
+        """Concurrent reads share one background check and go to the primary meanwhile"""
+        replica, primary = _factory(lag=0, connect_delay=0.05), _factory()
+        router = ReplicaRouter(replica, primary)
+
+        async def scenario():
+            factories = await asyncio.gather(*(router.session_factory() for _ in range(5)))
+            probe = router._probe
+            await probe
+            return factories, await router.session_factory()
+
+        factories, settled = asyncio.run(scenario())
+
+        assert factories == [primary] * 5
+        assert replica.call_count == 1
+        assert settled is replica
+
+    def test_hung_replica_check_times_out(self):
+        replica, primary = _factory(lag=0, connect_delay=10), _factory()
+        router = ReplicaRouter(replica, primary, probe_timeout=0.05)
+
+        async def scenario():
+            started = asyncio.get_running_loop().time()
+            routed = await _route_after_probe(router)
+            return routed, asyncio.get_running_loop().time() - started
+
+        routed, elapsed = asyncio.run(scenario())
+
+        assert routed is primary
+        assert elapsed < 1
+        assert router.state["healthy"] is False
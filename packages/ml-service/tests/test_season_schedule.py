@@ -0,0 +1,108 @@
+"""
+Tests for whole-season schedule ingestion
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock
+
+from services.data_service import DataService
+
+CALENDAR = [
+    {
+        "value": "2",
+        "entries": [
+            {"value": "1", "startDate": "2024-09-04T07:00Z", "endDate": "2024-09-11T06:59Z"},
+            {"value": "2", "startDate": "2024-09-11T07:00Z", "endDate": "2024-09-18T06:59Z"},
+        ],
+    },
+    {
+        "value": "3",
+        "entries": [
+            {"value": "1", "startDate": "2025-01-08T08:00Z", "endDate": "2025-01-15T07:59Z"},
+        ],
+    },
+]
+
+
+def _event(event_id, date, season_type, week=None, home="KC", away="BAL"):
+    event = {
+        "id": event_id,
+        "date": date,
+        "season": {"type": season_type},
+        "status": {"type": {"name": "STATUS_FINAL"}},
+        "competitions": [{
+            "competitors": [
+                {"homeAway": "home", "score": "27", "team": {"abbreviation": home, "displayName": home}},
+                {"homeAway": "away", "score": "20", "team": {"abbreviation": away, "displayName": away}},
+            ],
+            "venue": {"fullName": "Stadium", "address": {"city": "Kansas City", "state": "MO"}},
+        }],
+    }
+    if week is not None:
+        event["week"] = {"number": week}
+    return event
+
+
+SCOREBOARD = {
+    "leagues": [{"calendar": CALENDAR}],
+    "events": [
+        _event("1", "2024-09-06T00:20Z", 2, week=1),
+        # No week on the event: resolved from the calendar
+        _event("2", "2024-09-15T17:00Z", 2),
+        _event("3", "2025-01-12T01:00Z", 3),
+        # Preseason events are ignored
+        _event("4", "2024-08-10T23:00Z", 1, week=1),
+        # Outside every calendar entry
+        _event("5", "2024-12-31T12:00Z", 2),
+    ],
+}
+
+
+def _service():
+    service = DataService()
+    service._fetch_json = AsyncMock(return_value=SCOREBOARD)
+    service._load_team_map = AsyncMock(return_value={"KC": 1, "BAL": 2})
+    service.bulk_writer.upsert_games = AsyncMock(side_effect=lambda session, rows: (len(rows), 0, 0))
+    return service
+
+
+@pytest.mark.unit
+class TestSeasonSchedule:
+    """Calendar week mapping and the single-request season load"""
+
+    def test_week_from_calendar(self):
+        service = DataService()
+
+        assert service._week_from_calendar(CALENDAR, 2, datetime(2024, 9, 15, 17)) == 2
+        assert service._week_from_calendar(CALENDAR, 3, datetime(2025, 1, 12, 1)) == 1
+        # The same date under the wrong season type does not match
+        assert service._week_from_calendar(CALENDAR, 3, datetime(2024, 9, 15, 17)) is None
+        assert service._week_from_calendar(CALENDAR, 2, None) is None
+
+    def test_season_loads_in_one_request_and_one_upsert(self):
+        service = _service()
+        session = AsyncMock()
+
+        summary = asyncio.run(service.fetch_season_games(2024, include_postseason=True, session=session))
+
+        service._fetch_json.assert_awaited_once()
+        url = service._fetch_json.await_args.args[1]
+        assert "dates=20240801-20250228" in url
+
+        rows = service.bulk_writer.upsert_games.await_args.args[1]
+        assert [(row["espn_game_id"], row["week"]) for row in rows] == [("1", 1), ("2", 2), ("3", 19)]
+        assert rows[2]["game_type"] == "playoff"
+        assert summary["weeks"] == {1: 1, 2: 1, 19: 1}
+        assert summary["skipped"] == 1
+        assert summary["inserted"] == 3
+        session.commit.assert_awaited_once()
+
+    def test_postseason_is_excluded_by_default(self):
+        service = _service()
+
+        summary = asyncio.run(service.fetch_season_games(2024, session=AsyncMock()))
+
+        assert summary["weeks"] == {1: 1, 2: 1}
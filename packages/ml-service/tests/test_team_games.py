@@ -0,0 +1,142 @@
+"""
+Tests for team_games sync and the per-team feature queries (needs TEST_DATABASE_URL)
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from services.bulk_writer import BulkWriter
+from services.feature_engineering import H2H_GAMES, PREVIOUS_GAME_DATE, RECENT_GAMES
+
+INSERT_GAME = text(
+    """
+    INSERT INTO games (season, week, home_team_id, away_team_id, home_team, away_team,
+                       home_score, away_score, game_date, status, spread)
+    VALUES (:season, :week, :home, :away, 'Home', 'Away',
+            :home_score, :away_score, :game_date, :status, :spread)
+    RETURNING id
+    """
+)
+
+TEAM_ROWS = text(
+    """
+    SELECT team_id, opponent_id, is_home, points_for, points_against, spread_line, status
+    FROM team_games
+    WHERE game_id = :game_id
+    ORDER BY is_home DESC
+    """
+)
+
+
+async def _team_ids(session, count=3):
+    result = await session.execute(text("SELECT id FROM teams ORDER BY id LIMIT :count"), {"count": count})
+    return [row.id for row in result]
+
+
+async def _insert_game(session, home, away, game_date, week=1, status="final",
+                       home_score=None, away_score=None, spread=None, season=2024):
+    result = await session.execute(INSERT_GAME, {
+        "season": season, "week": week, "home": home, "away": away,
+        "home_score": home_score, "away_score": away_score,
+        "game_date": game_date, "status": status, "spread": spread,
+    })
+    return result.scalar_one()
+
+
+@pytest.mark.integration
+class TestTeamGamesSync:
+    """The trigger on games keeps both sides of every game in team_games"""
+
+    def test_direct_insert_update_and_delete_are_mirrored(self, pg_run):
+        async def scenario(session):
+            home, away, other = await _team_ids(session)
+            game_id = await _insert_game(
+                session, home, away, datetime(2024, 9, 8, 17), status="scheduled", spread=-3.5
+            )
+            inserted = (await session.execute(TEAM_ROWS, {"game_id": game_id})).all()
+
+            # What the backend cron does when a game goes final
+            await session.execute(
+                text("UPDATE games SET home_score = 24, away_score = 17, status = 'final' WHERE id = :id"),
+                {"id": game_id}
+            )
+            finished = (await session.execute(TEAM_ROWS, {"game_id": game_id})).all()
+
+            await session.execute(text("UPDATE games SET away_team_id = :other WHERE id = :id"),
+                                  {"other": other, "id": game_id})
+            reassigned = (await session.execute(TEAM_ROWS, {"game_id": game_id})).all()
+
+            await session.execute(text("DELETE FROM games WHERE id = :id"), {"id": game_id})
+            deleted = (await session.execute(TEAM_ROWS, {"game_id": game_id})).all()
+            return (home, away, other), inserted, finished, reassigned, deleted
+
+        (home, away, other), inserted, finished, reassigned, deleted = pg_run(scenario)
+
+        assert [(row.team_id, row.opponent_id, row.is_home) for row in inserted] == [
+            (home, away, True), (away, home, False)
+        ]
+        assert [float(row.spread_line) for row in inserted] == [-3.5, 3.5]
+        assert [(row.points_for, row.points_against, row.status) for row in finished] == [
+            (24, 17, "final"), (17, 24, "final")
+        ]
+        assert [row.team_id for row in reassigned] == [home, other]
+        assert reassigned[0].opponent_id == other
+        assert deleted == []
+
+    def test_bulk_upsert_is_mirrored(self, pg_run):
+        async def scenario(session):
+            home, away, _ = await _team_ids(session)
+            row = {
+                "espn_game_id": "401", "season": 2024, "week": 2, "game_type": "regular",
+                "home_team_id": home, "away_team_id": away,
+                "home_team": "Home", "away_team": "Away",
+                "home_score": 31, "away_score": 10,
+                "game_date": datetime(2024, 9, 15, 20), "venue": None, "venue_name": None,
+                "status": "final", "spread": None, "over_under": None,
+                "weather_conditions": None, "attendance": None,
+            }
+            await BulkWriter().upsert_games(session, [row])
+            game_id = (await session.execute(
+                text("SELECT id FROM games WHERE espn_game_id = '401'")
+            )).scalar_one()
+            return (await session.execute(TEAM_ROWS, {"game_id": game_id})).all()
+
+        rows = pg_run(scenario)
+
+        assert [(row.is_home, row.points_for, row.points_against) for row in rows] == [
+            (True, 31, 10), (False, 10, 31)
+        ]
+
+
+@pytest.mark.integration
+class TestTeamGamesFeatureQueries:
+    """Recent form, rest days and head to head from the team's side"""
+
+    def test_queries_see_the_team_perspective(self, pg_run):
+        async def scenario(session):
+            team, rival, other = await _team_ids(session)
+            await _insert_game(session, team, rival, datetime(2024, 9, 8), 1, home_score=20, away_score=13)
+            await _insert_game(session, other, team, datetime(2024, 9, 15), 2, home_score=27, away_score=24)
+            await _insert_game(session, rival, team, datetime(2024, 9, 22), 3, home_score=10, away_score=30)
+            # Not final yet, and after the cut-off
+            await _insert_game(session, team, other, datetime(2024, 9, 29), 4, status="scheduled")
+
+            cutoff = datetime(2024, 9, 28)
+            recent = (await RECENT_GAMES.execute(
+                session, {"team_id": team, "game_date": cutoff, "limit": 5}
+            )).all()
+            previous = (await PREVIOUS_GAME_DATE.execute(
+                session, {"team_id": team, "game_date": datetime(2024, 9, 30)}
+            )).scalar_one()
+            h2h = (await H2H_GAMES.execute(
+                session, {"home_team": team, "away_team": rival, "game_date": cutoff}
+            )).all()
+            return recent, previous, h2h
+
+        recent, previous, h2h = pg_run(scenario)
+
+        assert [(row.points_for, row.points_against) for row in recent] == [(30, 10), (24, 27), (20, 13)]
+        assert previous == datetime(2024, 9, 29)
+        assert [(row.home_points, row.away_points) for row in h2h] == [(30, 10), (20, 13)]
@@ -0,0 +1,155 @@
+"""
+Tests for the point-in-time team_stats rebuild (needs TEST_DATABASE_URL)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from services.feature_engineering import TEAM_STATS_AS_OF, FeatureEngineer
+from services.team_stats_aggregator import TeamStatsAggregator
+
+INSERT_GAME = text(
+    """
+    INSERT INTO games (season, week, home_team_id, away_team_id, home_team, away_team,
+                       home_score, away_score, game_date, status)
+    VALUES (:season, :week, :home, :away, 'Home', 'Away',
+            :home_score, :away_score, :game_date, :status)
+    """
+)
+
+TEAM_ROWS = text(
+    """
+    SELECT week, wins, losses, ties, points_for, points_against, games_played, streak,
+           home_wins, home_losses, away_wins, away_losses
+    FROM team_stats
+    WHERE team_id = :team_id AND season = :season
+    ORDER BY week
+    """
+)
+
+
+async def _team_ids(session, count=3):
+    result = await session.execute(text("SELECT id FROM teams ORDER BY id LIMIT :count"), {"count": count})
+    return [row.id for row in result]
+
+
+async def _insert_game(session, season, week, home, away, home_score=None, away_score=None,
+                       status="final"):
+    await session.execute(INSERT_GAME, {
+        "season": season, "week": week, "home": home, "away": away,
+        "home_score": home_score, "away_score": away_score,
+        "game_date": datetime(season, 9, 1, 17) + timedelta(weeks=week), "status": status,
+    })
+
+
+@pytest.mark.integration
+class TestTeamStatsAggregator:
+    """Records, streaks and splits as of each week's kickoff"""
+
+    def test_running_records_streaks_and_splits(self, pg_run):
+        async def scenario(session):
+            team, rival, other = await _team_ids(session)
+            await _insert_game(session, 2024, 1, team, rival, 21, 14)
+            await _insert_game(session, 2024, 2, other, team, 30, 10)
+            await _insert_game(session, 2024, 3, rival, team, 3, 17)
+            await _insert_game(session, 2024, 4, team, other, status="scheduled")
+
+            summary = await TeamStatsAggregator().rebuild(session, 2024)
+            rows = (await session.execute(TEAM_ROWS, {"team_id": team, "season": 2024})).all()
+            rerun = await TeamStatsAggregator().rebuild(session, 2024)
+            return summary, rows, rerun
+
+        summary, rows, rerun = pg_run(scenario)
+
+        # Three teams, weeks 1 through the week after the last final game
+        assert summary == {"inserted": 12, "updated": 0}
+        assert rerun == {"inserted": 0, "updated": 0}
+        assert [
+            (row.week, row.wins, row.losses, row.ties, row.points_for, row.points_against,
+             row.games_played, row.streak)
+            for row in rows
+        ] == [
+            (1, 0, 0, 0, 0, 0, 0, 0),
+            (2, 1, 0, 0, 21, 14, 1, 1),
+            (3, 1, 1, 0, 31, 44, 2, -1),
+            (4, 2, 1, 0, 48, 47, 3, 1),
+        ]
+        assert [
+            (row.home_wins, row.home_losses, row.away_wins, row.away_losses) for row in rows
+        ][-1] == (1, 0, 1, 1)
+
+    def test_streak_counts_consecutive_results(self, pg_run):
+        async def scenario(session):
+            team, rival, _ = await _team_ids(session)
+            for week, (team_score, rival_score) in enumerate([(20, 10), (24, 3), (7, 14), (9, 6), (13, 10)], 1):
+                await _insert_game(session, 2024, week, team, rival, team_score, rival_score)
+            await TeamStatsAggregator().rebuild(session, 2024)
+            team_rows = (await session.execute(TEAM_ROWS, {"team_id": team, "season": 2024})).all()
+            rival_rows = (await session.execute(TEAM_ROWS, {"team_id": rival, "season": 2024})).all()
+            return team_rows, rival_rows
+
+        team_rows, rival_rows = pg_run(scenario)
+
+        assert [row.streak for row in team_rows] == [0, 1, 2, -1, 1, 2]
+        assert [row.streak for row in rival_rows] == [0, -1, -2, 1, -1, -2]
+        assert (rival_rows[-1].away_wins, rival_rows[-1].away_losses) == (1, 4)
+
+    def test_week_one_rows_exist_before_any_game_is_final(self, pg_run):
+        async def scenario(session):
+            home, away, _ = await _team_ids(session)
+            await _insert_game(session, 2025, 1, home, away, status="scheduled")
+
+            summary = await TeamStatsAggregator().rebuild(session, 2025, 1)
+            rows = (await session.execute(
+                text("SELECT team_id, week, wins, losses, games_played FROM team_stats "
+                     "WHERE season = 2025 ORDER BY team_id")
+            )).all()
+            return (home, away), summary, rows
+
+        (home, away), summary, rows = pg_run(scenario)
+
+        assert summary == {"inserted": 2, "updated": 0}
+        assert [tuple(row) for row in rows] == [(home, 1, 0, 0, 0), (away, 1, 0, 0, 0)]
+
+
+@pytest.mark.integration
+class TestUpstreamStatsLookup:
+    """Derived weekly rows do not hide the upstream yardage and turnovers"""
+
+    def test_features_read_upstream_values_next_to_derived_rows(self, pg_run):
+        async def scenario(session):
+            team, rival, _ = await _team_ids(session)
+            await _insert_game(session, 2024, 1, team, rival, 21, 14)
+            await _insert_game(session, 2024, 2, rival, team, 10, 24)
+            await _insert_game(session, 2024, 3, team, rival, status="scheduled")
+            await session.execute(
+                text(
+                    "INSERT INTO team_stats (team_id, season, week, total_yards, turnovers, payload_hash) "
+                    "VALUES (:team_id, 2024, NULL, 360, 10, 'upstream')"
+                ),
+                {"team_id": team},
+            )
+            await TeamStatsAggregator().rebuild(session, 2024)
+
+            derived = (await session.execute(
+                text("SELECT total_yards, turnovers FROM team_stats "
+                     "WHERE team_id = :team_id AND season = 2024 AND week = 3"),
+                {"team_id": team},
+            )).one()
+            as_of = (await TEAM_STATS_AS_OF.execute(
+                session, {"team_id": team, "season": 2024, "week": 3}
+            )).one()
+            summary = await FeatureEngineer()._get_recent_summary(
+                session, team, datetime(2024, 9, 22, 17), season=2024, week=3
+            )
+            return derived, as_of, summary
+
+        derived, as_of, summary = pg_run(scenario)
+
+        # Unknown, not zero
+        assert (derived.total_yards, derived.turnovers) == (None, None)
+        assert (float(as_of.total_yards), as_of.turnovers) == (360.0, 10)
+        assert summary["yards_per_play"] == 6.0
+        assert summary["turnover_diff_normalized"] == 0.6
@@ -0,0 +1,80 @@
+"""
+Tests for the parallel model training orchestrator
+"""
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.naive_bayes import GaussianNB
+from sklearn.tree import DecisionTreeClassifier
+
+from utils.training_pool import TrainingJob, allocate_cores, save_models, train_in_parallel
+
+
+def _tree(n_jobs):
+    return DecisionTreeClassifier(max_depth=3, random_state=0)
+
+
+def _naive_bayes(n_jobs):
+    return GaussianNB()
+
+
+JOBS = [
+    TrainingJob("tree", _tree, "tree.joblib", weight=2),
+    TrainingJob("bayes", _naive_bayes, "bayes.joblib", weight=1, scaler_filename="scaler.joblib"),
+]
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    X = rng.random((200, 4))
+    y = (X[:, 0] + X[:, 1] > 1).astype(int)
+    return X[:160], y[:160], X[160:], y[160:]
+
+
+@pytest.mark.unit
+class TestTrainingPool:
+    """Core budgets, results and saved artifacts"""
+
+    def test_cores_split_by_weight_with_at_least_one_each(self):
+        assert allocate_cores(JOBS, 9) == {"tree": 6, "bayes": 3}
+        assert allocate_cores(JOBS, 2) == {"tree": 1, "bayes": 1}
+        assert allocate_cores(JOBS, 1) == {"tree": 1, "bayes": 1}
+
+    def test_budgets_add_up_to_the_cores_available(self):
+        jobs = [
+            TrainingJob("forest", _tree, "forest.joblib", weight=2),
+            TrainingJob("boosted", _tree, "boosted.joblib", weight=2),
+            TrainingJob("bayes", _naive_bayes, "bayes.joblib", weight=1),
+        ]
+
+        assert allocate_cores(jobs, 4) == {"forest": 2, "boosted": 1, "bayes": 1}
+        assert allocate_cores(jobs, 5) == {"forest": 2, "boosted": 2, "bayes": 1}
+        for total_cores in range(3, 17):
+            assert sum(allocate_cores(jobs, total_cores).values()) == total_cores
+
+    def test_results_and_artifacts_come_back_to_the_parent(self, tmp_path):
+        results = train_in_parallel(JOBS, *_data(), total_cores=3, processes=1)
+
+        assert set(results) == {"tree", "bayes"}
+        assert results["tree"]["cores"] == 2
+        assert results["tree"]["scaler"] is None
+        assert results["bayes"]["scaler"] is not None
+        assert 0.5 < results["bayes"]["test_score"] <= 1.0
+        assert len(results["tree"]["predictions"]) == 40
+
+        save_models(JOBS, results, tmp_path)
+        assert joblib.load(tmp_path / "tree.joblib").get_depth() <= 3
+        assert (tmp_path / "scaler.joblib").exists()
+
+    def test_worker_processes_match_inline_results(self):
+        data = _data()
+
+        pooled = train_in_parallel(JOBS, *data, total_cores=2, processes=2)
+        inline = train_in_parallel(JOBS, *data, total_cores=2, processes=1)
+
+        assert {name: result["cores"] for name, result in pooled.items()} == {"tree": 1, "bayes": 1}
+        for name in ("tree", "bayes"):
+            assert np.array_equal(pooled[name]["predictions"], inline[name]["predictions"])
+            assert pooled[name]["test_score"] == inline[name]["test_score"]
+        assert pooled["bayes"]["scaler"] is not None
@@ -0,0 +1,99 @@
+"""
+Tests for the shared weather cache
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from services.weather_cache import WeatherCache
+
+
+@pytest.mark.unit
+class TestWeatherCache:
+    """Test weather caching and request coalescing"""
+
+    def test_concurrent_lookups_share_one_request(self):
+        """Lookups for the same venue collapse into one upstream call"""
+        calls = []
+
+        async def fetcher(city, state):
+            calls.append((city, state))
+            await asyncio.sleep(0.01)
+            return {"temperature": 41.0}
+
+        async def scenario():
+            cache = WeatherCache(fetcher)
+            results = await asyncio.gather(*(cache.get("Green Bay", "WI") for _ in range(5)))
+            cached = await WeatherCache(fetcher).get("Green Bay", "WI")
+            return results, cached
+
+        WeatherCache._local.clear()
+        results, cached = asyncio.run(scenario())
+
+        assert calls == [("Green Bay", "WI")]
+        assert results == [{"temperature": 41.0}] * 5
+        assert cached == {"temperature": 41.0}
+
+    def test_cancelled_lookup_does_not_strand_waiters(self):
+        """When the task fetching a venue is cancelled, a waiter takes over the lookup"""
+        calls = []
+
+        async def fetcher(city, state):
+            calls.append(city)
+            if len(calls) == 1:
+                await asyncio.sleep(10)
+            return {"temperature": 50.0}
+
+        async def scenario():
+            cache = WeatherCache(fetcher)
+            owner = asyncio.create_task(cache.get("Chicago", "IL"))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.create_task(cache.get("Chicago", "IL"))
+            await asyncio.sleep(0.01)
+            owner.cancel()
+            result = await asyncio.wait_for(waiter, timeout=1)
+            with pytest.raises(asyncio.CancelledError):
+                await owner
+            return result
+
+        WeatherCache._local.clear()
+        with patch("services.weather_cache.get_redis", return_value=None):
+            result = asyncio.run(scenario())
+
+        assert result == {"temperature": 50.0}
+        assert calls == ["Chicago", "Chicago"]
+        assert WeatherCache._inflight == {}
+
+    def test_prefetch_dedupes_venues(self):
+        """A slate is resolved once per distinct venue"""
+        calls = []
+
+        async def fetcher(city, state):
+            calls.append(city)
+            return None if city == "Nowhere" else {"conditions": "clear"}
+
+        WeatherCache._local.clear()
+        weather = asyncio.run(WeatherCache(fetcher).prefetch([
+            ("Denver", "CO"), ("Denver", "CO"), ("Nowhere", None)
+        ]))
+
+        assert sorted(calls) == ["Denver", "Nowhere"]
+        assert weather == {("Denver", "CO"): {"conditions": "clear"}, ("Nowhere", None): None}
+
+    def test_local_fallback_is_bounded(self):
+        """Without Redis the process-local cache evicts instead of growing forever"""
+        async def fetcher(city, state):
+            return {"conditions": "clear"}
+
+        async def scenario():
+            cache = WeatherCache(fetcher)
+            for index in range(WeatherCache._local.max_entries + 10):
+                await cache.get(f"City {index}", None)
+
+        WeatherCache._local.clear()
+        with patch("services.weather_cache.get_redis", return_value=None):
+            asyncio.run(scenario())
+
+        assert len(WeatherCache._local) == WeatherCache._local.max_entries
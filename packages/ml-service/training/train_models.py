@@ -19,6 +19,46 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.database import get_postgres_connection
 from utils.logger import logger
+from utils.training_pool import TrainingJob, save_models, train_in_parallel
+
+def _random_forest(n_jobs=-1):
+    return RandomForestClassifier(
+        n_estimators=100,
+        max_depth=10,
+        min_samples_split=5,
+        random_state=42,
+        n_jobs=n_jobs
+    )
+
+def _xgboost(n_jobs=-1):
+    return xgb.XGBClassifier(
+        n_estimators=100,
+        max_depth=6,
+        learning_rate=0.1,
+        subsample=0.8,
+        colsample_bytree=0.8,
+        random_state=42,
+        n_jobs=n_jobs
+    )
+
+def _neural_network(n_jobs=1):
+    # No n_jobs of its own; the core budget is applied to its BLAS threads
+    return MLPClassifier(
+        hidden_layer_sizes=(64, 32, 16),
+        activation='relu',
+        solver='adam',
+        max_iter=500,
+        random_state=42,
+        early_stopping=True,
+        validation_fraction=0.1
+    )
+
+# The tree ensembles scale with cores; the MLP mostly does not
+TRAINING_JOBS = [
+    TrainingJob('random_forest', _random_forest, 'rf_model.joblib', weight=2),
+    TrainingJob('xgboost', _xgboost, 'xgb_model.joblib', weight=2),
+    TrainingJob('neural_net', _neural_network, 'nn_model.joblib', weight=1, scaler_filename='scaler.joblib'),
+]
 
 class NFLModelTrainer:
     """Train and evaluate NFL prediction models"""
@@ -114,13 +154,7 @@ class NFLModelTrainer:
         """Train Random Forest model"""
         logger.info("Training Random Forest...")
 
-        rf_model = RandomForestClassifier(
-            n_estimators=100,
-            max_depth=10,
-            min_samples_split=5,
-            random_state=42,
-            n_jobs=-1
-        )
+        rf_model = _random_forest()
 
         rf_model.fit(X_train, y_train)
 
@@ -144,15 +178,7 @@ class NFLModelTrainer:
         """Train XGBoost model"""
         logger.info("Training XGBoost...")
 
-        xgb_model = xgb.XGBClassifier(
-            n_estimators=100,
-            max_depth=6,
-            learning_rate=0.1,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            random_state=42,
-            n_jobs=-1
-        )
+        xgb_model = _xgboost()
 
         xgb_model.fit(X_train, y_train)
 
@@ -180,15 +206,7 @@ class NFLModelTrainer:
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
 
-        nn_model = MLPClassifier(
-            hidden_layer_sizes=(64, 32, 16),
-            activation='relu',
-            solver='adam',
-            max_iter=500,
-            random_state=42,
-            early_stopping=True,
-            validation_fraction=0.1
-        )
+        nn_model = _neural_network()
 
         nn_model.fit(X_train_scaled, y_train)
 
@@ -266,17 +284,16 @@ class NFLModelTrainer:
         logger.info(f"Train set: {len(X_train)}, Test set: {len(X_test)}")
         logger.info(f"Home win rate: {y.mean():.2%}")
 
-        # Train models
-        rf_model, rf_score = self.train_random_forest(X_train, y_train, X_test, y_test)
-        xgb_model, xgb_score = self.train_xgboost(X_train, y_train, X_test, y_test)
-        nn_model, nn_score = self.train_neural_network(X_train, y_train, X_test, y_test)
+        # Train models concurrently, one process each
+        results = train_in_parallel(TRAINING_JOBS, X_train, y_train, X_test, y_test)
+        for name, result in results.items():
+            logger.info(f"{name} - Train: {result['train_score']:.4f}, Test: {result['test_score']:.4f}")
+            logger.info(f"\n{classification_report(y_test, result['predictions'])}")
+        save_models(TRAINING_JOBS, results, self.models_dir)
+        self.scaler = results['neural_net']['scaler']
 
         # Evaluate ensemble
-        models = {
-            'random_forest': rf_model,
-            'xgboost': xgb_model,
-            'neural_net': nn_model
-        }
+        models = {name: result['model'] for name, result in results.items()}
 
         ensemble_score = self.evaluate_ensemble(models, X_test, y_test)
 
@@ -288,11 +305,12 @@ class NFLModelTrainer:
             'train_size': len(X_train),
             'test_size': len(X_test),
             'scores': {
-                'random_forest': float(rf_score),
-                'xgboost': float(xgb_score),
-                'neural_network': float(nn_score),
+                'random_forest': results['random_forest']['test_score'],
+                'xgboost': results['xgboost']['test_score'],
+                'neural_network': results['neural_net']['test_score'],
                 'ensemble': float(ensemble_score)
-            }
+            },
+            'fit_seconds': {name: result['seconds'] for name, result in results.items()}
         }
 
         import json
@@ -0,0 +1,266 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import codec
+from utils.database import get_redis, get_redis_bytes
+from utils.logger import logger
+
+LOCAL_CACHE_MAX_ENTRIES = int(os.getenv("LOCAL_CACHE_MAX_ENTRIES", 512))
+# Upper bound on how long a Redis-backed entry is served from process memory
+LOCAL_CACHE_MAX_TTL = int(os.getenv("LOCAL_CACHE_MAX_TTL", 300))
+INVALIDATION_CHANNEL = "ml:cache:invalidate"
+
+
+class LocalCache:
+    """Size-bounded LRU of decoded values with a per-entry TTL"""
+
+    def __init__(self, max_entries: int = LOCAL_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.metrics = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.metrics["misses"] += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.metrics["hits"] += 1
+        return True, entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.metrics["evictions"] += 1
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredCache:
+    """In-process LRU in front of Redis for response payloads.
+
+    Reads check process memory first, then Redis (decoding once and keeping the
+    decoded value locally). ``get``/``set`` hold JSON-compatible values;
+    ``get_bytes``/``set_bytes`` (and the batched ``get_many_bytes``/``set_many_bytes``)
+    hold serialized JSON bodies that can be sent as-is.
+    Deletes are published on ``INVALIDATION_CHANNEL`` so every worker drops its local
+    copy. Without Redis the local tier keeps caching for the full TTL. Cached values
+    are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, local: Optional[LocalCache] = None, max_local_ttl: int = LOCAL_CACHE_MAX_TTL):
+        self.local = local or LocalCache()
+        self.max_local_ttl = max_local_ttl
+        self.instance_id = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+        self.metrics = {"redis_hits": 0, "redis_errors": 0, "invalidations_received": 0}
+
+    def _local_ttl(self, ttl: int, redis) -> float:
+        # Other workers can only invalidate us through Redis, so bound staleness when it's in use
+        return min(ttl, self.max_local_ttl) if redis else ttl
+
+    async def get(self, key: str, ttl: int) -> Optional[Any]:
+        """Cached value for ``key`` or None; ``ttl`` bounds the local copy of a Redis hit"""
+        found, value = self.local.get(key)
+        if found:
+            return value
+
+        redis = get_redis()
+        if not redis:
+            return None
+        try:
+            cached = await redis.get(key)
+        except Exception as exc:
+            self.metrics["redis_errors"] += 1
+            logger.debug("Cache read failed for %s: %s", key, exc)
+            return None
+        if cached is None:
+            return None
+
+        value = json.loads(cached)
+        self.metrics["redis_hits"] += 1
+        self.local.set(key, value, self._local_ttl(ttl, redis))
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        redis = get_redis()
+        self.local.set(key, value, self._local_ttl(ttl, redis))
+        if redis:
+            try:
+                await redis.setex(key, ttl, json.dumps(value))
+            except Exception as exc:
+                self.metrics["redis_errors"] += 1
+                logger.debug("Cache write failed for %s: %s", key, exc)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        self.local.delete(*keys)
+        redis = get_redis()
+        if not redis:
+            return
+        try:
+            await redis.delete(*keys)
+            await redis.publish(
+                INVALIDATION_CHANNEL,
+                json.dumps({"origin": self.instance_id, "keys": list(keys)})
+            )
+        except Exception as exc:
+            self.metrics["redis_errors"] += 1
+            logger.warning("Cache invalidation failed for %s: %s", keys, exc)
+
+    async def get_bytes(self, key: str, ttl: int) -> Optional[bytes]:
+        """Cached JSON body for ``key``, stored with ``set_bytes``, or None"""
+        found, body = self.local.get(key)
+        if found:
+            return body
+
+        redis = get_redis_bytes()
+        if not redis:
+            return None
+        try:
+            payload = await redis.get(key)
+        except Exception as exc:
+            self.metrics["redis_errors"] += 1
+            logger.debug("Cache read failed for %s: %s", key, exc)
+            return None
+        if payload is None:
+            return None
+
+        body = codec.unpack(payload)
+        self.metrics["redis_hits"] += 1
+        self.local.set(key, body, self._local_ttl(ttl, redis))
+        return body
+
+    async def set_bytes(self, key: str, body: bytes, ttl: int) -> None:
+        """Cache a serialized JSON body; Redis holds it packed (zstd when enabled)"""
+        redis = get_redis_bytes()
+        self.local.set(key, body, self._local_ttl(ttl, redis))
+        if redis:
+            try:
+                await redis.setex(key, ttl, codec.pack(body))
+            except Exception as exc:
+                self.metrics["redis_errors"] += 1
+                logger.debug("Cache write failed for %s: %s", key, exc)
+
+    async def get_many_bytes(self, keys: List[str], ttl: int) -> Dict[str, bytes]:
+        """Cached JSON bodies for the ``keys`` that are present; local misses share one MGET"""
+        found: Dict[str, bytes] = {}
+        missing = []
+        for key in keys:
+            hit, body = self.local.get(key)
+            if hit:
+                found[key] = body
+            else:
+                missing.append(key)
+
+        redis = get_redis_bytes()
+        if not missing or not redis:
+            return found
+        try:
+            payloads = await redis.mget(missing)
+        except Exception as exc:
+            self.metrics["redis_errors"] += 1
+            logger.debug("Cache batch read failed for %d keys: %s", len(missing), exc)
+            return found
+
+        local_ttl = self._local_ttl(ttl, redis)
+        for key, payload in zip(missing, payloads):
+            if payload is None:
+                continue
+            body = codec.unpack(payload)
+            self.metrics["redis_hits"] += 1
+            self.local.set(key, body, local_ttl)
+            found[key] = body
+        return found
+
+    async def set_many_bytes(self, bodies: Dict[str, bytes], ttl: int) -> None:
+        """Cache several serialized JSON bodies, written to Redis in one pipelined round trip"""
+        if not bodies:
+            return
+        redis = get_redis_bytes()
+        local_ttl = self._local_ttl(ttl, redis)
+        for key, body in bodies.items():
+            self.local.set(key, body, local_ttl)
+        if not redis:
+            return
+        try:
+            # No MULTI/EXEC: the writes are independent, only the round trips are batched
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, body in bodies.items():
+                    pipe.setex(key, ttl, codec.pack(body))
+                await pipe.execute()
+        except Exception as exc:
+            self.metrics["redis_errors"] += 1
+            logger.debug("Cache batch write failed for %d keys: %s", len(bodies), exc)
+
+    def handle_invalidation(self, message: str) -> None:
+        payload = json.loads(message)
+        if payload.get("origin") == self.instance_id:
+            return
+        self.metrics["invalidations_received"] += 1
+        self.local.delete(*payload.get("keys", []))
+
+    async def start(self) -> None:
+        """Subscribe to cross-worker invalidations; a no-op without Redis"""
+        redis = get_redis()
+        if redis and (self._listener is None or self._listener.done()):
+            self._listener = asyncio.create_task(self._listen(redis))
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self, redis) -> None:
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # Entries that were invalidated while disconnected may be stale; drop them all
+                self.local.clear()
+                logger.warning("Cache invalidation listener failed, resubscribing: %s", exc)
+                await asyncio.sleep(5)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+    def snapshot(self) -> Dict:
+        return {
+            **self.local.metrics,
+            **self.metrics,
+            "local_entries": len(self.local),
+            "listening": self._listener is not None and not self._listener.done(),
+        }
+
+
+cache = TieredCache()
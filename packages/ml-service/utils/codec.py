@@ -0,0 +1,66 @@
+import os
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+try:
+    import zstandard
+except ImportError:  # optional: payloads are stored uncompressed without it
+    zstandard = None
+
+# One-byte header in front of every stored payload
+RAW = b"j"
+ZSTD = b"z"
+
+CACHE_COMPRESSION = os.getenv("CACHE_COMPRESSION", "zstd").lower()
+CACHE_ZSTD_LEVEL = int(os.getenv("CACHE_ZSTD_LEVEL", 3))
+# Below this size compression costs more than it saves
+COMPRESSION_MIN_BYTES = 1024
+
+_compressor = (
+    zstandard.ZstdCompressor(level=CACHE_ZSTD_LEVEL)
+    if zstandard is not None and CACHE_COMPRESSION == "zstd"
+    else None
+)
+_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+
+def _default(value: Any) -> Any:
+    # NUMERIC columns come back from the database as Decimal
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes (datetimes, numpy values and Decimals included)"""
+    return orjson.dumps(
+        value,
+        default=_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def pack(body: bytes) -> bytes:
+    """Wrap JSON bytes for storage, compressing larger payloads when zstd is enabled"""
+    if _compressor is not None and len(body) >= COMPRESSION_MIN_BYTES:
+        return ZSTD + _compressor.compress(body)
+    return RAW + body
+
+
+def unpack(payload: bytes) -> bytes:
+    """JSON bytes from a stored payload, ready to send as a response body"""
+    header, data = payload[:1], payload[1:]
+    if header == RAW:
+        return data
+    if header == ZSTD:
+        if _decompressor is None:
+            raise ValueError("Cached payload is zstd-compressed but zstandard is not installed")
+        return _decompressor.decompress(data)
+    # Plain JSON written before the codec existed
+    return payload
+
+
+def loads(payload: bytes) -> Any:
+    return orjson.loads(unpack(payload))
@@ -0,0 +1,228 @@
+import asyncio
+import random
+import re
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from aiohttp import ClientResponseError
+
+from utils.logger import logger
+from utils.rate_limit import TokenBucket
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Per-host limits. ESPN's public endpoints tolerate bursts; The Odds API bills per
+# request and OpenWeather's free tier allows 60 calls/minute.
+DEFAULT_HOST_POLICIES: Dict[str, Dict] = {
+    "site.api.espn.com": {"rate": 10.0, "burst": 20},
+    "sports.core.api.espn.com": {"rate": 10.0, "burst": 20},
+    "api.the-odds-api.com": {"rate": 1.0, "burst": 2},
+    "api.openweathermap.org": {"rate": 1.0, "burst": 5},
+}
+
+_SECRET_PARAMS = re.compile(r"(apiKey|appid)=[^&]+", re.IGNORECASE)
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the upstream while its circuit breaker is open"""
+
+
+def redact_url(url: str) -> str:
+    """Hide API keys before a URL is logged"""
+    return _SECRET_PARAMS.sub(r"\1=***", url)
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures and fails fast until
+    ``reset_timeout`` has passed; then a single trial request decides whether it closes."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_count = 0
+
+    def allow(self) -> bool:
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = "half_open"
+            return True
+        # Only one trial request is let through while half open
+        return self.state == "closed"
+
+    def release_trial(self) -> None:
+        """Give up a half-open trial without an outcome, so the next request can retry it"""
+        if self.state == "half_open":
+            self.state = "open"
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                self.open_count += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+
+class UpstreamPolicy:
+    """Rate limit, retry and circuit breaker settings for one upstream host"""
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        rate: float = 5.0,
+        burst: float = 10,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ):
+        self.host = host
+        self.bucket = TokenBucket(rate, capacity=burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.metrics = {
+            "requests": 0,
+            "failures": 0,
+            "retries": 0,
+            "throttle_waits": 0,
+            "throttle_wait_seconds": 0.0,
+            "circuit_rejections": 0,
+        }
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential backoff, never shorter than a Retry-After hint"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    def snapshot(self) -> Dict:
+        return {
+            **self.metrics,
+            "throttle_wait_seconds": round(self.metrics["throttle_wait_seconds"], 3),
+            "circuit_state": self.breaker.state,
+            "circuit_opens": self.breaker.open_count,
+        }
+
+
+class UpstreamPolicyRegistry:
+    """Process-wide policies keyed by host, shared by every DataService instance"""
+
+    def __init__(self, overrides: Optional[Dict[str, Dict]] = None):
+        self._settings = {**DEFAULT_HOST_POLICIES, **(overrides or {})}
+        self._policies: Dict[str, UpstreamPolicy] = {}
+
+    def for_url(self, url: str) -> UpstreamPolicy:
+        host = urlparse(url).netloc
+        if host not in self._policies:
+            self._policies[host] = UpstreamPolicy(host, **self._settings.get(host, {}))
+        return self._policies[host]
+
+    def configure(self, host: str, **settings) -> None:
+        """Override the policy for ``host``; applies to requests made after the call"""
+        self._settings[host] = {**self._settings.get(host, {}), **settings}
+        self._policies.pop(host, None)
+
+    def metrics(self) -> Dict[str, Dict]:
+        return {host: policy.snapshot() for host, policy in self._policies.items()}
+
+    async def get_json(self, http: aiohttp.ClientSession, url: str):
+        """GET ``url`` as JSON under the host's rate limit, retry and breaker policy.
+
+        Only idempotent GETs go through here, so transient failures (connection
+        errors, timeouts, 429 and 5xx) are retried. Other 4xx responses are raised
+        immediately and do not count against the breaker.
+        """
+        policy = self.for_url(url)
+
+        for attempt in range(policy.max_retries + 1):
+            if not policy.breaker.allow():
+                policy.metrics["circuit_rejections"] += 1
+                raise CircuitOpenError(f"Circuit open for {policy.host}")
+
+            retry_after = None
+            try:
+                # Inside the guarded block: a cancel while throttled must free a half-open trial
+                waited = await policy.bucket.acquire()
+                if waited > 0:
+                    policy.metrics["throttle_waits"] += 1
+                    policy.metrics["throttle_wait_seconds"] += waited
+
+                policy.metrics["requests"] += 1
+                async with http.get(url) as response:
+                    response.raise_for_status()
+                    payload = await response.json()
+                policy.breaker.record_success()
+                return payload
+
+            except ClientResponseError as error:
+                if error.status not in RETRYABLE_STATUS:
+                    policy.breaker.record_success()
+                    logger.error("HTTP %s when fetching %s", error.status, redact_url(url))
+                    raise
+                retry_after = _parse_retry_after(error.headers)
+                failure = f"HTTP {error.status}"
+                last_error = error
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                failure = type(error).__name__
+                last_error = error
+
+            except Exception:
+                # e.g. an unparseable body: not retried, but the upstream misbehaved
+                policy.metrics["failures"] += 1
+                policy.breaker.record_failure()
+                raise
+
+            except BaseException:
+                # Cancelled mid-request: no verdict on the upstream, but free a half-open trial
+                policy.breaker.release_trial()
+                raise
+
+            policy.metrics["failures"] += 1
+            policy.breaker.record_failure()
+
+            if attempt == policy.max_retries or policy.breaker.state == "open":
+                logger.error(
+                    "%s when fetching %s (attempt %s/%s)",
+                    failure,
+                    redact_url(url),
+                    attempt + 1,
+                    policy.max_retries + 1
+                )
+                raise last_error
+
+            delay = policy.backoff(attempt, retry_after)
+            policy.metrics["retries"] += 1
+            logger.warning(
+                "%s when fetching %s, retrying in %.2fs",
+                failure,
+                redact_url(url),
+                delay
+            )
+            await asyncio.sleep(delay)
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    value = (headers or {}).get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+upstream_policies = UpstreamPolicyRegistry()
@@ -0,0 +1,88 @@
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from sqlalchemy import text
+
+LATENCY_WINDOW = 1000
+
+
+def _percentile_ms(ordered, pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index] * 1000, 3)
+
+
+class NamedQuery:
+    """A hot statement with fixed SQL text and its latency record.
+
+    The SQL never changes between calls, so SQLAlchemy's compiled cache and the
+    asyncpg per-connection prepared statement cache (``DB_STATEMENT_CACHE_SIZE``)
+    turn every call after a connection's first into a bind + execute without
+    re-parsing or re-planning. ``first_ms`` is the cold call that included the
+    prepare, for comparison with the warm percentiles.
+    """
+
+    def __init__(self, name: str, sql: str):
+        self.name = name
+        self.sql = sql
+        self.statement = text(sql)
+        self.calls = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.first_seconds: Optional[float] = None
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    async def execute(self, session, params: Optional[Dict] = None):
+        started = time.perf_counter()
+        try:
+            return await session.execute(self.statement, params or {})
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.calls += 1
+            self.total_seconds += elapsed
+            if self.first_seconds is None:
+                self.first_seconds = elapsed
+            self.latencies.append(elapsed)
+
+    def snapshot(self) -> Dict:
+        ordered = sorted(self.latencies)
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "mean_ms": round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+            "first_ms": round(self.first_seconds * 1000, 3) if self.first_seconds is not None else None,
+            "p50_ms": _percentile_ms(ordered, 50),
+            "p95_ms": _percentile_ms(ordered, 95),
+            "max_ms": _percentile_ms(ordered, 100),
+        }
+
+
+class QueryRegistry:
+    """Process-wide registry of named hot queries, shared by every service instance"""
+
+    def __init__(self):
+        self._queries: Dict[str, NamedQuery] = {}
+
+    def register(self, name: str, sql: str) -> NamedQuery:
+        existing = self._queries.get(name)
+        if existing is not None:
+            if existing.sql != sql:
+                raise ValueError(f"Query {name!r} is already registered with different SQL")
+            return existing
+        query = NamedQuery(name, sql)
+        self._queries[name] = query
+        return query
+
+    def get(self, name: str) -> NamedQuery:
+        return self._queries[name]
+
+    def metrics(self) -> Dict[str, Dict]:
+        return {name: query.snapshot() for name, query in sorted(self._queries.items())}
+
+
+queries = QueryRegistry()
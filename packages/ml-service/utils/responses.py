@@ -0,0 +1,15 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from utils import codec
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson via ``utils.codec``.
+
+    Handlers that return one directly also skip FastAPI's ``jsonable_encoder`` pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return codec.dumps(content)
@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import joblib
+from sklearn.metrics import accuracy_score
+from sklearn.preprocessing import StandardScaler
+from threadpoolctl import threadpool_limits
+
+from utils.logger import logger
+
+TRAINING_CORES = int(os.getenv("TRAINING_CORES", os.cpu_count() or 1))
+
+
+@dataclass(frozen=True)
+class TrainingJob:
+    """One model fitted in its own worker process.
+
+    ``build`` must be a module-level function (it is pickled to the worker) that takes
+    the job's core budget and returns an unfitted estimator. ``weight`` is the job's
+    share of the cores. Jobs with a ``scaler_filename`` are fitted on standardized
+    features and the fitted scaler is saved alongside the model.
+    """
+
+    name: str
+    build: Callable[[int], Any]
+    filename: str
+    weight: float = 1.0
+    scaler_filename: Optional[str] = None
+
+
+def allocate_cores(jobs: List[TrainingJob], total_cores: int) -> Dict[str, int]:
+    """Split ``total_cores`` across jobs by weight, at least one core each.
+
+    Every job is given one core and the rest are shared out by largest remainder, so
+    the budgets add up to exactly ``total_cores``. With fewer cores than jobs each job
+    gets one core and ``train_in_parallel`` runs no more than ``total_cores`` at once.
+    """
+    spare = max(total_cores - len(jobs), 0)
+    total_weight = sum(job.weight for job in jobs)
+    shares = {job.name: spare * job.weight / total_weight for job in jobs}
+    budgets = {name: 1 + int(share) for name, share in shares.items()}
+
+    leftover = spare - sum(int(share) for share in shares.values())
+    # Stable sort: ties go to the job listed first
+    by_remainder = sorted(shares, key=lambda name: shares[name] - int(shares[name]), reverse=True)
+    for name in by_remainder[:leftover]:
+        budgets[name] += 1
+    return budgets
+
+
+def _fit(job: TrainingJob, cores: int, X_train, y_train, X_test, y_test) -> Dict:
+    started = time.perf_counter()
+    # Caps the BLAS/OpenMP pools as well, so numpy inside the MLP stays within budget
+    with threadpool_limits(limits=cores):
+        scaler = None
+        if job.scaler_filename:
+            scaler = StandardScaler()
+            X_train = scaler.fit_transform(X_train)
+            X_test = scaler.transform(X_test)
+
+        model = job.build(cores)
+        model.fit(X_train, y_train)
+        predictions = model.predict(X_test)
+        train_score = model.score(X_train, y_train)
+
+    return {
+        "model": model,
+        "scaler": scaler,
+        "predictions": predictions,
+        "train_score": float(train_score),
+        "test_score": float(accuracy_score(y_test, predictions)),
+        "cores": cores,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def train_in_parallel(
+    jobs: List[TrainingJob],
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    total_cores: int = TRAINING_CORES,
+    processes: Optional[int] = None
+) -> Dict[str, Dict]:
+    """Fit every job concurrently, one worker process each, and return results by job name.
+
+    Each result holds the fitted model and scaler, test-set predictions, scores and
+    timing. Wall-clock time follows the slowest job rather than the sum. ``processes``
+    is capped at one per job and one per core, so the jobs running at any moment never
+    hold more than ``total_cores``. With a single process (one core by default) the
+    jobs run in this process one after another.
+    """
+    total_cores = max(total_cores, 1)
+    budgets = allocate_cores(jobs, total_cores)
+    processes = min(processes or len(jobs), len(jobs), total_cores)
+    started = time.perf_counter()
+
+    if processes <= 1:
+        results = {job.name: _fit(job, budgets[job.name], X_train, y_train, X_test, y_test) for job in jobs}
+    else:
+        # spawn, not fork: the service process has an event loop and threads running
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+            futures = {
+                job.name: pool.submit(_fit, job, budgets[job.name], X_train, y_train, X_test, y_test)
+                for job in jobs
+            }
+            results = {name: future.result() for name, future in futures.items()}
+
+    for name, result in results.items():
+        logger.info(
+            "Trained %s on %d core(s) in %.2fs: test accuracy %.4f",
+            name, result["cores"], result["seconds"], result["test_score"]
+        )
+    logger.info("Trained %d models in %.2fs using %d process(es)", len(results), time.perf_counter() - started, processes)
+    return results
+
+
+def save_models(jobs: List[TrainingJob], results: Dict[str, Dict], models_dir: Path) -> None:
+    """Write each fitted model (and scaler) from ``train_in_parallel`` to ``models_dir``"""
+    for job in jobs:
+        result = results[job.name]
+        joblib.dump(result["model"], models_dir / job.filename)
+        if job.scaler_filename:
+            joblib.dump(result["scaler"], models_dir / job.scaler_filename)
+        logger.info("Saved %s to %s", job.name, models_dir / job.filename)